@@ -0,0 +1,31 @@
+"""Add composite index for keyset pagination of the admin user list.
+
+Revision ID: 007_add_users_created_id_index
+Revises: 006_add_performance_indexes
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_add_users_created_id_index"
+down_revision: Union[str, None] = "006_add_performance_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Admin user listing: ORDER BY created_at DESC, id DESC with a (created_at, id) cursor
+    op.create_index(
+        "idx_users_created_id",
+        "users",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_users_created_id", table_name="users")
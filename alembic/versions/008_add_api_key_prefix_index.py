@@ -0,0 +1,31 @@
+"""Index API key prefixes for authentication lookups.
+
+Revision ID: 008_add_api_key_prefix_index
+Revises: 007_add_users_created_id_index
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_add_api_key_prefix_index"
+down_revision: Union[str, None] = "007_add_users_created_id_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # API key auth: WHERE prefix = :prefix AND is_active, then bcrypt-verify candidates
+    op.create_index(
+        "ix_api_keys_prefix",
+        "api_keys",
+        ["prefix"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_keys_prefix", table_name="api_keys")
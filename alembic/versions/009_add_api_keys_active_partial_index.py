@@ -0,0 +1,33 @@
+"""Add partial index on active API keys per user.
+
+Revision ID: 009_add_api_keys_active_partial_index
+Revises: 008_add_api_key_prefix_index
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_add_api_keys_active_partial_index"
+down_revision: Union[str, None] = "008_add_api_key_prefix_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only active keys are looked up on hot paths; revoked keys stay out of the index
+    op.create_index(
+        "ix_api_keys_user_id_active_only",
+        "api_keys",
+        ["user_id"],
+        postgresql_where=sa.text("is_active = true"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_keys_user_id_active_only", table_name="api_keys")
@@ -0,0 +1,42 @@
+"""Add indexes for dashboard aggregation queries.
+
+Revision ID: 010_add_dashboard_indexes
+Revises: 009_add_api_keys_active_partial_index
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_add_dashboard_indexes"
+down_revision: Union[str, None] = "009_add_api_keys_active_partial_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. A user's 100 most recent completed experiments (partial, newest first)
+    op.create_index(
+        "ix_experiments_user_created_completed",
+        "experiments",
+        ["user_id", sa.text("created_at DESC")],
+        postgresql_where=sa.text("status = 'completed'"),
+        if_not_exists=True,
+    )
+
+    # 2. Trend aggregation over batch runs by completion date
+    op.create_index(
+        "ix_batch_runs_experiment_completed",
+        "batch_runs",
+        ["experiment_id", "completed_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_batch_runs_experiment_completed", table_name="batch_runs")
+    op.drop_index("ix_experiments_user_created_completed", table_name="experiments")
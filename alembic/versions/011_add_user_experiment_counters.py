@@ -0,0 +1,70 @@
+"""Add denormalized experiment counters to users.
+
+Revision ID: 011_add_user_experiment_counters
+Revises: 010_add_dashboard_indexes
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_add_user_experiment_counters"
+down_revision: Union[str, None] = "010_add_dashboard_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "experiments_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Experiments created by this user",
+        ),
+    )
+    op.add_column(
+        "users",
+        sa.Column(
+            "completed_experiments_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Experiments that have completed at least once",
+        ),
+    )
+
+    # Backfill from existing experiments
+    op.execute(
+        """
+        UPDATE users SET
+            experiments_count = counts.total,
+            completed_experiments_count = counts.completed
+        FROM (
+            SELECT
+                e.user_id,
+                count(*) AS total,
+                count(*) FILTER (
+                    WHERE e.status = 'completed' OR EXISTS (
+                        SELECT 1 FROM batch_runs b
+                        WHERE b.experiment_id = e.id AND b.status = 'completed'
+                    )
+                ) AS completed
+            FROM experiments e
+            WHERE e.user_id IS NOT NULL
+            GROUP BY e.user_id
+        ) AS counts
+        WHERE users.id = counts.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "completed_experiments_count")
+    op.drop_column("users", "experiments_count")
@@ -0,0 +1,55 @@
+"""Add (user_id, status, created_at) index for the filtered experiment list.
+
+Revision ID: 012_add_experiments_user_status_created_index
+Revises: 011_add_user_experiment_counters
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_add_experiments_user_status_created_index"
+down_revision: Union[str, None] = "011_add_user_experiment_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        # GET /experiments?status=...: equality on both leading columns, then an
+        # index-ordered (backward) scan on created_at for ORDER BY ... DESC LIMIT
+        op.create_index(
+            "ix_experiments_user_status_created",
+            "experiments",
+            ["user_id", "status", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Leading-prefix of the new index, so it's redundant
+        op.drop_index(
+            "ix_experiments_user_status",
+            table_name="experiments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_experiments_user_status",
+            "experiments",
+            ["user_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_experiments_user_status_created",
+            table_name="experiments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,47 @@
+"""Backfill share_of_voice_by_brand into existing batch run metrics.
+
+Revision ID: 013_backfill_share_of_voice_by_brand
+Revises: 012_add_experiments_user_status_created_index
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_backfill_share_of_voice_by_brand"
+down_revision: Union[str, None] = "012_add_experiments_user_status_created_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Derive the {brand: share} map from the ranked share_of_voice list that
+    # every analysed run already stores
+    op.execute(
+        """
+        UPDATE batch_runs SET metrics = metrics || jsonb_build_object(
+            'share_of_voice_by_brand',
+            (
+                SELECT jsonb_object_agg(item->>'brand', item->'share')
+                FROM jsonb_array_elements(metrics->'share_of_voice') AS item
+                WHERE item->>'brand' IS NOT NULL
+            )
+        )
+        WHERE jsonb_typeof(metrics) = 'object'
+          AND jsonb_typeof(metrics->'share_of_voice') = 'array'
+          AND jsonb_array_length(metrics->'share_of_voice') > 0
+          AND NOT metrics ? 'share_of_voice_by_brand'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE batch_runs SET metrics = metrics - 'share_of_voice_by_brand'
+        WHERE jsonb_typeof(metrics) = 'object' AND metrics ? 'share_of_voice_by_brand'
+        """
+    )
@@ -0,0 +1,33 @@
+"""Compress iteration raw responses with lz4 and from a lower size threshold.
+
+Revision ID: 014_compress_iteration_raw_response
+Revises: 013_backfill_share_of_voice_by_brand
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_compress_iteration_raw_response"
+down_revision: Union[str, None] = "013_backfill_share_of_voice_by_brand"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # lz4 (PostgreSQL 14+) decompresses several times faster than the default
+    # pglz, which is what /detail and the NDJSON stream pay per raw_response.
+    # Catalog-only change: values written from now on use lz4, existing pglz
+    # values stay readable as they are.
+    op.execute("ALTER TABLE iterations ALTER COLUMN raw_response SET COMPRESSION lz4")
+    # TOAST only compresses rows over ~2 KB by default, which leaves most
+    # 1-2 KB LLM answers uncompressed inline; try from 256 bytes instead
+    op.execute("ALTER TABLE iterations SET (toast_tuple_target = 256)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE iterations RESET (toast_tuple_target)")
+    op.execute("ALTER TABLE iterations ALTER COLUMN raw_response SET COMPRESSION DEFAULT")
@@ -0,0 +1,43 @@
+"""Add partial created_at index for the PII cleanup task.
+
+Revision ID: 015_add_iterations_pii_cleanup_index
+Revises: 014_compress_iteration_raw_response
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_add_iterations_pii_cleanup_index"
+down_revision: Union[str, None] = "014_compress_iteration_raw_response"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; build without locking writes
+    with op.get_context().autocommit_block():
+        # cleanup_old_pii_data: created_at < cutoff AND raw_response IS NOT NULL.
+        # Rows drop out of the index once nulled, so it only covers pending work.
+        op.create_index(
+            "ix_iterations_pii_cleanup",
+            "iterations",
+            ["created_at"],
+            postgresql_where=sa.text("raw_response IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_iterations_pii_cleanup",
+            table_name="iterations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -667,6 +667,8 @@ class AnalysisBuilder:
             metrics["share_of_voice"] = [
                 {"brand": s.brand, "share": s.share, "rank": s.rank} for s in share_of_voice
             ]
+            # Keyed copy so readers can look up one brand's share without scanning
+            metrics["share_of_voice_by_brand"] = {s.brand: s.share for s in share_of_voice}
 
         if hallucination:
             metrics["hallucination"] = {
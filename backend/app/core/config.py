@@ -156,6 +156,13 @@ class Settings(BaseSettings):
     postgres_port: int = Field(default=5432, description="PostgreSQL port")
     postgres_db: str = Field(default="ai_visibility_db", description="PostgreSQL database name")
 
+    # API connection pool (per process); the Celery worker uses its own small pool
+    db_pool_size: int = Field(default=20, description="Persistent DB connections per API process")
+    db_max_overflow: int = Field(default=10, description="Extra DB connections allowed under burst")
+    db_pool_timeout: int = Field(
+        default=10, description="Seconds to wait for a pooled connection before erroring"
+    )
+
     # Allow raw DATABASE_URL from environment (e.g. Railway)
     # This must be distinct from the computed properties
     raw_database_url: str | None = Field(default=None, alias="DATABASE_URL")
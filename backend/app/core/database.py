@@ -48,10 +48,11 @@ def create_database_engine(settings: Settings) -> AsyncEngine:
         str(settings.database_url),
         echo=settings.debug,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
-        pool_recycle=3600,
-        pool_timeout=30,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=1800,  # Recycle before typical 30-60 min proxy/LB idle cutoffs
+        # Fail fast under pool exhaustion instead of stacking requests for 30s
+        pool_timeout=settings.db_pool_timeout,
         pool_use_lifo=True,
     )
 
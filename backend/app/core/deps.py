@@ -14,7 +14,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db_session as get_db
-from backend.app.core.security import decode_access_token, verify_api_key
+from backend.app.core.security import decode_access_token, verify_api_key_async
 from backend.app.models.user import APIKey, User
 
 # Security schemes
@@ -22,26 +22,22 @@ security = HTTPBearer(auto_error=False)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
-async def get_current_user_from_jwt(
-    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User | None:
+async def _user_id_from_token(credentials: HTTPAuthorizationCredentials) -> UUID:
     """
-    Get the current user from a JWT token in the Authorization header.
+    Validate a bearer token and return the user ID it was issued for.
+
+    Checks the signature, the JTI blacklist and global session revocation,
+    but does not touch the database.
 
     Args:
         credentials: HTTP Bearer credentials from the Authorization header.
-        db: Database session.
 
     Returns:
-        User: The authenticated user.
+        UUID: The token's user ID.
 
     Raises:
-        HTTPException: If the token is invalid or the user doesn't exist.
+        HTTPException: If the token is invalid, blacklisted or revoked.
     """
-    if not credentials:
-        return None
-
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -73,12 +69,41 @@ async def get_current_user_from_jwt(
         if await is_token_revoked_by_global(str(user_id), float(token_iat)):
             raise credentials_exception
 
+    return UUID(str(user_id))
+
+
+async def get_current_user_from_jwt(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User | None:
+    """
+    Get the current user from a JWT token in the Authorization header.
+
+    Args:
+        credentials: HTTP Bearer credentials from the Authorization header.
+        db: Database session.
+
+    Returns:
+        User: The authenticated user.
+
+    Raises:
+        HTTPException: If the token is invalid or the user doesn't exist.
+    """
+    if not credentials:
+        return None
+
+    user_id = await _user_id_from_token(credentials)
+
     # Fetch the user from the database
-    result = await db.execute(select(User).where(User.id == UUID(str(user_id))))
+    result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     if not user.is_active:
         raise HTTPException(
@@ -133,7 +158,7 @@ async def get_current_user_from_api_key(
 
     # Check each API key (usually just 1, but prefix collisions theoretically possible)
     for key_record in api_keys:
-        if verify_api_key(api_key, key_record.key):
+        if await verify_api_key_async(api_key, key_record.key):
             # Update last used timestamp (commit handled by dependency manager)
             key_record.last_used_at = datetime.now(UTC)
             # DO NOT commit here - let the dependency manager handle it
@@ -188,6 +213,40 @@ async def get_current_user(
     return user
 
 
+async def get_current_user_id(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    api_key_user: Annotated[User | None, Depends(get_current_user_from_api_key)] = None,
+) -> UUID:
+    """
+    Get the current user's ID without loading the user from the database.
+
+    For bearer tokens the ID comes straight from the validated JWT, so the
+    caller must scope its own queries to active users. API keys still need a
+    lookup and fall back to the full API-key dependency.
+
+    Args:
+        credentials: HTTP Bearer credentials from the Authorization header.
+        api_key_user: User from API key (if provided).
+
+    Returns:
+        UUID: The authenticated user's ID.
+
+    Raises:
+        HTTPException: If neither authentication method succeeds.
+    """
+    if credentials:
+        return await _user_id_from_token(credentials)
+
+    if api_key_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return api_key_user.id
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
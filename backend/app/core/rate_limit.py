@@ -0,0 +1,167 @@
+"""
+Distributed rate limiting backed by Redis.
+
+Each limit is a rolling window stored in a Redis sorted set (one member per
+request, scored by its timestamp). A single Lua script trims expired entries,
+counts, records the request and refreshes the TTL atomically, so every API
+worker and replica shares one accurate counter at the cost of one round-trip.
+"""
+
+import logging
+import math
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from backend.app.core.deps import get_current_active_user
+from backend.app.core.redis import RedisClient
+from backend.app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = window key; ARGV = now_ms, window_ms, limit, member
+# Returns {allowed (1/0), retry_after_ms}
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return {1, 0}
+end
+
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {0, tonumber(oldest[2]) + window - now}
+"""
+
+_script: AsyncScript | None = None
+
+
+def _sliding_window_script(redis: Redis) -> AsyncScript:  # type: ignore[type-arg]
+    """Register the Lua script once; later calls run it via EVALSHA."""
+    global _script
+    if _script is None:
+        _script = redis.register_script(_SLIDING_WINDOW_LUA)
+    return _script
+
+
+async def hit(
+    redis: Redis,  # type: ignore[type-arg]
+    key: str,
+    limit: int,
+    window_seconds: int,
+) -> int:
+    """
+    Record a request against a rolling-window limit.
+
+    Args:
+        redis: Redis client.
+        key: Bucket key (scope plus caller identity).
+        limit: Maximum requests allowed per window.
+        window_seconds: Window length in seconds.
+
+    Returns:
+        int: 0 if the request is allowed, otherwise seconds until it would be.
+    """
+    now_ms = int(time.time() * 1000)
+    window_ms = window_seconds * 1000
+    script = _sliding_window_script(redis)
+    allowed, retry_after_ms = await script(
+        keys=[key],
+        args=[now_ms, window_ms, limit, f"{now_ms}:{uuid.uuid4().hex[:8]}"],
+        client=redis,
+    )
+    if allowed:
+        return 0
+    return max(1, math.ceil(int(retry_after_ms) / 1000))
+
+
+async def _enforce(
+    redis: Redis,  # type: ignore[type-arg]
+    key: str,
+    limit: int,
+    window_seconds: int,
+) -> None:
+    """
+    Raise 429 if the bucket is over its limit.
+
+    Redis errors fail open (the request is allowed and a warning logged),
+    matching the cache helpers: an unavailable limiter must not take the API
+    down with it.
+    """
+    try:
+        retry_after = await hit(redis, key, limit, window_seconds)
+    except Exception as e:
+        logger.warning("Rate limiter unavailable for %s: %s", key, e)
+        return
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded: {limit} per {window_seconds} seconds",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+def rate_limit_by_ip(
+    scope: str,
+    limit: int,
+    window_seconds: int,
+) -> Callable[..., Awaitable[None]]:
+    """
+    Build a dependency enforcing `limit` requests per window per client IP.
+
+    For unauthenticated endpoints; authenticated ones should use
+    rate_limit_by_user so callers behind one NAT don't share a bucket.
+
+    Args:
+        scope: Name of the protected action, used in the Redis key.
+        limit: Maximum requests allowed per window.
+        window_seconds: Window length in seconds.
+
+    Returns:
+        A FastAPI dependency raising 429 when the limit is exceeded.
+    """
+
+    async def dependency(request: Request, redis: RedisClient) -> None:
+        client_ip = request.client.host if request.client else "unknown"
+        await _enforce(redis, f"rl:{scope}:{client_ip}", limit, window_seconds)
+
+    return dependency
+
+
+def rate_limit_by_user(
+    scope: str,
+    limit: int,
+    window_seconds: int,
+) -> Callable[..., Awaitable[None]]:
+    """
+    Build a dependency enforcing `limit` requests per window per user.
+
+    Resolves the caller through get_current_active_user, which FastAPI caches
+    per request, so the endpoint's own user dependency costs nothing extra.
+
+    Args:
+        scope: Name of the protected action, used in the Redis key.
+        limit: Maximum requests allowed per window.
+        window_seconds: Window length in seconds.
+
+    Returns:
+        A FastAPI dependency raising 429 when the limit is exceeded.
+    """
+
+    async def dependency(
+        redis: RedisClient,
+        current_user: Annotated[User, Depends(get_current_active_user)],
+    ) -> None:
+        await _enforce(redis, f"rl:{scope}:{current_user.id}", limit, window_seconds)
+
+    return dependency
@@ -8,6 +8,8 @@ Innovation: Redis serves dual purpose - Celery broker for distributed
 task processing and cache for probabilistic result memoization.
 """
 
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
 from typing import Annotated
 
@@ -17,6 +19,8 @@ from redis.asyncio import Redis
 
 from backend.app.core.config import Settings, get_settings
 
+logger = logging.getLogger(__name__)
+
 
 def create_redis_client(settings: Settings) -> Redis:  # type: ignore[type-arg]
     """
@@ -94,15 +98,9 @@ async def check_redis_health() -> bool:
     Returns:
         bool: True if Redis is reachable and responding.
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     try:
         client = get_redis_client()
         # Use asyncio.wait_for to add timeout
-        import asyncio
-
         await asyncio.wait_for(client.ping(), timeout=3.0)
         return True
     except TimeoutError:
@@ -113,5 +111,108 @@ async def check_redis_health() -> bool:
         return False
 
 
+# --- Response caching helpers ---
+# Cache failures are logged and swallowed so a Redis outage degrades to a cache miss.
+
+
+async def cache_get(redis: Redis, key: str) -> str | None:  # type: ignore[type-arg]
+    """
+    Read a cached payload.
+
+    Args:
+        redis: Redis client.
+        key: Cache key.
+
+    Returns:
+        str | None: The cached payload, or None on miss or Redis error.
+    """
+    try:
+        return await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Redis cache read failed for {key}: {e}")
+        return None
+
+
+async def cache_set(redis: Redis, key: str, value: str, ttl_seconds: int) -> None:  # type: ignore[type-arg]
+    """
+    Write a payload to the cache with a TTL.
+
+    Args:
+        redis: Redis client.
+        key: Cache key.
+        value: Serialized payload (typically JSON).
+        ttl_seconds: Time-to-live in seconds.
+    """
+    try:
+        await redis.setex(key, ttl_seconds, value)
+    except Exception as e:
+        logger.warning(f"Redis cache write failed for {key}: {e}")
+
+
+async def cache_hget(redis: Redis, key: str, field: str) -> str | None:  # type: ignore[type-arg]
+    """
+    Read one cached payload from a hash of related entries.
+
+    Args:
+        redis: Redis client.
+        key: Hash key grouping the entries.
+        field: Entry within the hash.
+
+    Returns:
+        str | None: The cached payload, or None on miss or Redis error.
+    """
+    try:
+        return await redis.hget(key, field)
+    except Exception as e:
+        logger.warning(f"Redis cache read failed for {key}[{field}]: {e}")
+        return None
+
+
+async def cache_hset(
+    redis: Redis,  # type: ignore[type-arg]
+    key: str,
+    field: str,
+    value: str,
+    ttl_seconds: int,
+) -> None:
+    """
+    Write one payload into a hash of related entries.
+
+    The TTL applies to the whole hash and is only set when it has none, so
+    every entry expires at most `ttl_seconds` after the hash was created;
+    deleting the hash key invalidates all entries at once.
+
+    Args:
+        redis: Redis client.
+        key: Hash key grouping the entries.
+        field: Entry within the hash.
+        value: Serialized payload (typically JSON).
+        ttl_seconds: Time-to-live of the hash in seconds.
+    """
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, field, value)
+            pipe.expire(key, ttl_seconds, nx=True)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Redis cache write failed for {key}[{field}]: {e}")
+
+
+async def cache_delete(redis: Redis, *keys: str) -> None:  # type: ignore[type-arg]
+    """
+    Invalidate one or more cache keys.
+
+    Args:
+        redis: Redis client.
+        keys: Cache keys to delete.
+    """
+    if not keys:
+        return
+    try:
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Redis cache invalidation failed for {keys}: {e}")
+
+
 # Type alias for dependency injection
 RedisClient = Annotated[Redis, Depends(get_redis)]
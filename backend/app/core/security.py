@@ -11,6 +11,8 @@ Security best practices implemented:
 - Secure API key generation
 """
 
+import asyncio
+import hmac
 import logging
 import secrets
 import uuid
@@ -64,6 +66,37 @@ def get_password_hash(password: str) -> str:
     return hashed.decode("utf-8")
 
 
+# bcrypt is CPU-bound (~100ms per call) and releases the GIL, so request
+# handlers run it in a worker thread instead of blocking the event loop.
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async variant of verify_password that runs bcrypt in a worker thread."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Async variant of get_password_hash that runs bcrypt in a worker thread."""
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+def secure_eq(a: str, b: str) -> bool:
+    """
+    Compare two secret strings in constant time.
+
+    Use this instead of `==` for any attacker-supplied secret (tokens, keys,
+    signatures) so the comparison time doesn't reveal a matching prefix.
+
+    Args:
+        a: First value.
+        b: Second value.
+
+    Returns:
+        bool: True if the values are equal.
+    """
+    return hmac.compare_digest(a.encode("utf-8"), b.encode("utf-8"))
+
+
 def get_secret_key() -> str:
     """
     Get the secret key, enforcing security in production.
@@ -228,6 +261,11 @@ def verify_api_key(raw_key: str, hashed_key: str) -> bool:
     return verify_password(raw_key, hashed_key)
 
 
+async def verify_api_key_async(raw_key: str, hashed_key: str) -> bool:
+    """Async variant of verify_api_key that runs bcrypt in a worker thread."""
+    return await asyncio.to_thread(verify_api_key, raw_key, hashed_key)
+
+
 def get_api_key_prefix(key: str) -> str:
     """
     Get the display prefix for an API key.
@@ -292,3 +330,20 @@ async def is_token_revoked_by_global(user_id: str, token_iat: float) -> bool:
         return token_iat < float(revoked_before)
     except Exception:
         return False
+
+
+# --- Last-login buffering via Redis ---
+
+# Hash of user_id -> ISO timestamp, flushed to users.last_login_at periodically
+LAST_LOGIN_KEY = "echo:lastlogin"
+
+
+async def record_last_login(user_id: str) -> None:
+    """Buffer a user's login timestamp in Redis for the periodic flush task."""
+    try:
+        from backend.app.core.redis import get_redis_client
+
+        redis = get_redis_client()
+        await redis.hset(LAST_LOGIN_KEY, user_id, datetime.now(UTC).isoformat())
+    except Exception as e:
+        logger.warning(f"Failed to record last login: {e}")
@@ -8,6 +8,8 @@ Innovation: The platform uses async context managers for resource lifecycle,
 ensuring clean startup/shutdown of database and Redis connections.
 """
 
+import asyncio
+import contextlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -15,15 +17,14 @@ from typing import Any
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
+from sqlalchemy import text
 
 from backend.app.core.config import Settings, get_settings
-from backend.app.core.database import get_engine
+from backend.app.core.database import get_engine, get_session_factory
 from backend.app.core.logging import setup_logging
-from backend.app.core.redis import check_redis_health, close_redis_connection
+from backend.app.core.redis import check_redis_health, close_redis_connection, get_redis_client
 from backend.app.middleware.security_headers import SecurityHeadersMiddleware
 from backend.app.routers import experiments_router
 from backend.app.routers.admin import router as admin_router
@@ -33,9 +34,14 @@ from backend.app.routers.brand import router as brand_router
 from backend.app.routers.dashboard import router as dashboard_router
 from backend.app.routers.demo import router as demo_router
 from backend.app.routers.health import router as health_router
+from backend.app.services.system_config import system_config_store
+from backend.app.worker import celery_app
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+
+def _warm_broker_pool() -> None:
+    """Open one pooled broker connection so the first task publish reuses it."""
+    with celery_app.producer_or_acquire() as producer:
+        producer.connection.ensure_connection(max_retries=1)
 
 
 @asynccontextmanager
@@ -75,8 +81,23 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {settings.environment}")
 
+    # Connect to the broker now rather than inside the first POST /experiments
+    try:
+        await asyncio.to_thread(_warm_broker_pool)
+    except Exception as e:
+        logger.warning(f"Celery broker not reachable at startup: {e}")
+
+    # Drop this worker's config snapshot when another worker updates it
+    config_listener = asyncio.create_task(
+        system_config_store.listen_for_invalidations(get_redis_client())
+    )
+
     yield
 
+    config_listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await config_listener
+
     # Shutdown: Cleanup resources
     import logging
 
@@ -119,13 +140,12 @@ def create_application() -> FastAPI:
         openapi_url=f"{settings.api_v1_prefix}/openapi.json",
     )
 
-    # Add rate limiter to app state
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
     # Security headers middleware
     app.add_middleware(SecurityHeadersMiddleware)
 
+    # Compress larger JSON responses (admin lists, stats, experiment results)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Configure CORS with explicit whitelist in production
     if settings.environment == "development":
         allowed_origins = ["*"]
@@ -218,10 +238,6 @@ def _register_routers(app: FastAPI, settings: Settings) -> None:
         Returns:
             dict: Health status including database and Redis connectivity.
         """
-        from sqlalchemy import text
-
-        from backend.app.core.database import get_session_factory
-
         # Check Redis
         redis_healthy = await check_redis_health()
 
@@ -24,6 +24,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -192,8 +193,16 @@ class Experiment(Base):
         Index("ix_experiments_created_at", "created_at"),
         Index("ix_experiments_status_created", "status", "created_at"),
         # ix_experiments_user_id is already created by index=True on the column
-        Index("ix_experiments_user_status", "user_id", "status"),
+        # Filtered list: user + status, ordered by created_at
+        Index("ix_experiments_user_status_created", "user_id", "status", "created_at"),
         Index("ix_experiments_user_created", "user_id", "created_at"),
+        # Dashboard: a user's most recent completed experiments
+        Index(
+            "ix_experiments_user_created_completed",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'completed'"),
+        ),
     )
 
 
@@ -332,7 +341,11 @@ class BatchRun(Base):
         lazy="selectin",
     )
 
-    __table_args__ = (Index("ix_batch_runs_experiment_provider", "experiment_id", "provider"),)
+    __table_args__ = (
+        Index("ix_batch_runs_experiment_provider", "experiment_id", "provider"),
+        # Dashboard trend aggregation by completion date
+        Index("ix_batch_runs_experiment_completed", "experiment_id", "completed_at"),
+    )
 
 
 class Iteration(Base):
@@ -386,6 +399,7 @@ class Iteration(Base):
 
     # Response data
     # Innovation: Raw response storage enables variance analysis and audit trails
+    # Stored lz4-compressed by TOAST from 256-byte rows up (migration 014)
     raw_response: Mapped[str | None] = mapped_column(
         Text,
         nullable=True,
@@ -458,4 +472,10 @@ class Iteration(Base):
         Index("ix_iterations_batch_success", "batch_run_id", "is_success"),
         Index("ix_iterations_batch_index", "batch_run_id", "iteration_index"),
         Index("ix_iterations_status", "status"),  # For filtering by status
+        # PII cleanup: only rows still holding a raw response
+        Index(
+            "ix_iterations_pii_cleanup",
+            "created_at",
+            postgresql_where=text("raw_response IS NOT NULL"),
+        ),
     )
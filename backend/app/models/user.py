@@ -9,7 +9,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -111,6 +111,22 @@ class User(Base):
         comment="When the monthly quota resets",
     )
 
+    # Denormalized experiment counters (let the dashboard skip queries for new users)
+    experiments_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Experiments created by this user",
+    )
+    completed_experiments_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Experiments that have completed at least once",
+    )
+
     # Stripe integration
     stripe_customer_id: Mapped[str | None] = mapped_column(
         String(255),
@@ -199,6 +215,8 @@ class User(Base):
     __table_args__ = (
         Index("ix_users_pricing_tier", "pricing_tier"),
         Index("ix_users_created_at", "created_at"),
+        # Admin user list: keyset pagination on (created_at, id)
+        Index("idx_users_created_id", "created_at", "id"),
     )
 
 
@@ -232,6 +250,7 @@ class APIKey(Base):
     prefix: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
+        index=True,
         comment="Display prefix of key (e.g., 'sk_live_abc1...')",
     )
     name: Mapped[str] = mapped_column(
@@ -276,5 +295,10 @@ class APIKey(Base):
 
     __table_args__ = (
         Index("ix_api_keys_user_active", "user_id", "is_active"),
+        Index(
+            "ix_api_keys_user_id_active_only",
+            "user_id",
+            postgresql_where=text("is_active = true"),
+        ),
         Index("ix_api_keys_created_at", "created_at"),
     )
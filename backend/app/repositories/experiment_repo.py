@@ -9,13 +9,14 @@ enabling testability and flexibility. Async operations ensure non-blocking
 database access for high-concurrency probabilistic workloads.
 """
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import Row, Select, exists, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from backend.app.models.experiment import (
     BatchRun,
@@ -24,6 +25,26 @@ from backend.app.models.experiment import (
     ExperimentStatus,
     Iteration,
 )
+from backend.app.models.user import User
+
+
+def _iteration_detail_query(experiment_id: UUID) -> Select[Any]:
+    """Iteration columns rendered by the detail views, in run/index order."""
+    return (
+        select(
+            Iteration.batch_run_id,
+            Iteration.iteration_index,
+            Iteration.is_success,
+            Iteration.status,
+            Iteration.latency_ms,
+            Iteration.raw_response,
+            Iteration.error_message,
+            Iteration.extracted_brands,
+        )
+        .join(BatchRun, Iteration.batch_run_id == BatchRun.id)
+        .where(BatchRun.experiment_id == experiment_id)
+        .order_by(BatchRun.started_at, Iteration.batch_run_id, Iteration.iteration_index)
+    )
 
 
 class ExperimentRepository:
@@ -55,6 +76,7 @@ class ExperimentRepository:
         config: dict[str, Any],
         competitor_brands: list[str] | None = None,
         domain_whitelist: list[str] | None = None,
+        experiment_id: UUID | None = None,
     ) -> Experiment:
         """
         Create a new experiment.
@@ -66,23 +88,81 @@ class ExperimentRepository:
             config: Experiment configuration (iterations, temperature, etc.).
             competitor_brands: Optional list of competitor brands.
             domain_whitelist: Optional list of allowed domains for hallucination check.
+            experiment_id: Optional pre-generated ID, for callers that need it
+                before the insert completes.
 
         Returns:
-            Experiment: The created experiment instance.
-        """
-        experiment = Experiment(
-            user_id=user_id,
-            prompt=prompt,
-            target_brand=target_brand,
-            competitor_brands=competitor_brands,
-            domain_whitelist=domain_whitelist,
-            config=config,
-            status=ExperimentStatus.PENDING.value,
+            Experiment: The created experiment. It is written with a Core
+            INSERT, so the instance is not attached to the session.
+        """
+        now = datetime.now(UTC)
+        values: dict[str, Any] = {
+            "id": experiment_id or uuid4(),
+            "user_id": user_id,
+            "prompt": prompt,
+            "target_brand": target_brand,
+            "competitor_brands": competitor_brands,
+            "domain_whitelist": domain_whitelist,
+            "config": config,
+            "status": ExperimentStatus.PENDING.value,
+            "is_recurring": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+        # The denormalized counter bump rides along as a data-modifying CTE, so
+        # insert and counter are one statement and one round-trip. Every value
+        # is generated here, so nothing needs to be read back either.
+        bump_experiments_count = (
+            update(User)
+            .where(User.id == user_id)
+            .values(experiments_count=User.experiments_count + 1, updated_at=func.now())
+            .cte("bump_experiments_count")
+        )
+        await self.session.execute(
+            insert(Experiment.__table__).values(**values).add_cte(bump_experiments_count)
         )
-        self.session.add(experiment)
+        return Experiment(**values)
+
+    async def create_experiments(
+        self,
+        user_id: UUID,
+        specs: list[dict[str, Any]],
+    ) -> list[Experiment]:
+        """
+        Create several experiments for one user with a single flush.
+
+        Args:
+            user_id: ID of the user creating the experiments.
+            specs: One dict per experiment with `prompt`, `target_brand` and
+                `config`, plus optional `competitor_brands`/`domain_whitelist`.
+
+        Returns:
+            list[Experiment]: The created experiments, in `specs` order.
+        """
+        experiments = [
+            Experiment(
+                id=uuid4(),
+                user_id=user_id,
+                prompt=spec["prompt"],
+                target_brand=spec["target_brand"],
+                competitor_brands=spec.get("competitor_brands"),
+                domain_whitelist=spec.get("domain_whitelist"),
+                config=spec["config"],
+                status=ExperimentStatus.PENDING.value,
+            )
+            for spec in specs
+        ]
+        self.session.add_all(experiments)
         await self.session.flush()
-        await self.session.refresh(experiment)
-        return experiment
+
+        await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(experiments_count=User.experiments_count + len(experiments))
+            .execution_options(synchronize_session=False)
+        )
+        return experiments
 
     async def get_experiment(self, experiment_id: UUID) -> Experiment | None:
         """
@@ -92,9 +172,14 @@ class ExperimentRepository:
             experiment_id: The experiment UUID.
 
         Returns:
-            Experiment or None if not found.
+            Experiment or None if not found. Relationships are not loaded
+            (batch_runs would otherwise selectin-load every run and iteration).
         """
-        stmt = select(Experiment).where(Experiment.id == experiment_id)
+        stmt = (
+            select(Experiment)
+            .where(Experiment.id == experiment_id)
+            .options(raiseload(Experiment.batch_runs))
+        )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -121,6 +206,83 @@ class ExperimentRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_experiment_with_batch_runs_for_user(
+        self,
+        experiment_id: UUID,
+        user_id: UUID,
+    ) -> Experiment | None:
+        """
+        Get an experiment owned by the user, with batch runs but no iterations.
+
+        Iterations (and their raw_response blobs) are selectin-loaded by
+        default; this skips them for endpoints that only need run summaries.
+        Accessing batch_run.iterations on the result raises instead of
+        lazy-loading.
+
+        Args:
+            experiment_id: The experiment UUID.
+            user_id: The user UUID who should own this experiment.
+
+        Returns:
+            Experiment with batch runs loaded, or None if not found or
+            doesn't belong to user.
+        """
+        stmt = (
+            select(Experiment)
+            .where(
+                Experiment.id == experiment_id,
+                Experiment.user_id == user_id,
+            )
+            .options(selectinload(Experiment.batch_runs).options(raiseload(BatchRun.iterations)))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_experiment_with_results_for_user(
+        self,
+        experiment_id: UUID,
+        user_id: UUID,
+    ) -> Experiment | None:
+        """
+        Get an experiment owned by the user, with batch runs and iterations.
+
+        Combines the ownership check of get_experiment_by_user with the eager
+        loading of get_experiment_with_results in a single lookup. Only the
+        iteration columns the detail and export views render are loaded;
+        citations and token counts are skipped and raise if accessed.
+
+        Args:
+            experiment_id: The experiment UUID.
+            user_id: The user UUID who should own this experiment.
+
+        Returns:
+            Experiment with loaded relationships, or None if not found or
+            doesn't belong to user.
+        """
+        stmt = (
+            select(Experiment)
+            .where(
+                Experiment.id == experiment_id,
+                Experiment.user_id == user_id,
+            )
+            .options(
+                selectinload(Experiment.batch_runs)
+                .selectinload(BatchRun.iterations)
+                .load_only(
+                    Iteration.iteration_index,
+                    Iteration.is_success,
+                    Iteration.status,
+                    Iteration.latency_ms,
+                    Iteration.raw_response,
+                    Iteration.error_message,
+                    Iteration.extracted_brands,
+                    raiseload=True,
+                )
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def update_experiment_status(
         self,
         experiment_id: UUID,
@@ -146,27 +308,73 @@ class ExperimentRepository:
         )
         await self.session.execute(stmt)
 
-    async def list_experiments(
+    async def record_first_completion(
+        self,
+        user_id: UUID,
+        experiment_id: UUID,
+        batch_run_id: UUID,
+    ) -> None:
+        """
+        Count an experiment toward the user's completed_experiments_count.
+
+        Only the experiment's first completed batch run increments the counter,
+        so recurring re-runs don't inflate it.
+
+        Args:
+            user_id: Owner of the experiment.
+            experiment_id: The experiment UUID.
+            batch_run_id: The batch run that just completed.
+        """
+        earlier_completion = exists().where(
+            BatchRun.experiment_id == experiment_id,
+            BatchRun.status == BatchRunStatus.COMPLETED.value,
+            BatchRun.id != batch_run_id,
+        )
+        stmt = (
+            update(User)
+            .where(User.id == user_id, ~earlier_completion)
+            .values(completed_experiments_count=User.completed_experiments_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def list_experiment_summaries(
         self,
         user_id: UUID,
         limit: int = 50,
         offset: int = 0,
         status: ExperimentStatus | None = None,
-    ) -> list[Experiment]:
+    ) -> tuple[list[Row[Any]], int]:
         """
-        List experiments for a specific user with pagination and optional status filter.
+        Fetch one page of experiment summary columns plus the total match count.
+
+        The total comes from a COUNT(*) OVER () window on the same query, so
+        pagination costs a single round-trip. Only list-view columns are
+        selected, which also skips the eager batch_runs/iterations loads an
+        Experiment entity would trigger.
 
         Args:
             user_id: Filter experiments by this user ID.
-            limit: Maximum number of experiments to return.
-            offset: Number of experiments to skip.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
             status: Optional status filter.
 
         Returns:
-            List of experiments belonging to the user.
+            Tuple of (rows, total). Rows expose id, prompt, target_brand,
+            competitor_brands, status, error_message, created_at, updated_at.
         """
         stmt = (
-            select(Experiment)
+            select(
+                Experiment.id,
+                Experiment.prompt,
+                Experiment.target_brand,
+                Experiment.competitor_brands,
+                Experiment.status,
+                Experiment.error_message,
+                Experiment.created_at,
+                Experiment.updated_at,
+                func.count().over().label("total"),
+            )
             .where(Experiment.user_id == user_id)
             .order_by(Experiment.created_at.desc())
         )
@@ -174,9 +382,14 @@ class ExperimentRepository:
         if status:
             stmt = stmt.where(Experiment.status == status.value)
 
-        stmt = stmt.limit(limit).offset(offset)
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        result = await self.session.execute(stmt.limit(limit).offset(offset))
+        rows = list(result.all())
+        if rows:
+            return rows, rows[0].total
+        # An empty page carries no window value; only count when paged past the end
+        if offset:
+            return rows, await self.count_experiments(user_id, status)
+        return rows, 0
 
     async def count_experiments(
         self,
@@ -193,9 +406,7 @@ class ExperimentRepository:
         Returns:
             Total count of experiments.
         """
-        from sqlalchemy import func
-
-        stmt = select(func.count()).select_from(Experiment).where(Experiment.user_id == user_id)
+        stmt = select(func.count(Experiment.id)).where(Experiment.user_id == user_id)
 
         if status:
             stmt = stmt.where(Experiment.status == status.value)
@@ -217,13 +428,61 @@ class ExperimentRepository:
 
         Returns:
             Experiment or None if not found or doesn't belong to user.
+            Relationships are not loaded.
+        """
+        stmt = (
+            select(Experiment)
+            .where(
+                Experiment.id == experiment_id,
+                Experiment.user_id == user_id,
+            )
+            .options(raiseload(Experiment.batch_runs))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_status_for_user(
+        self,
+        experiment_id: UUID,
+        user_id: UUID,
+    ) -> Row[Any] | None:
+        """
+        Get an owned experiment's status columns without loading relationships.
+
+        Args:
+            experiment_id: The experiment UUID.
+            user_id: The user UUID who should own this experiment.
+
+        Returns:
+            Row with status, error_message and updated_at, or None if not
+            found or doesn't belong to user.
         """
-        stmt = select(Experiment).where(
+        stmt = select(Experiment.status, Experiment.error_message, Experiment.updated_at).where(
             Experiment.id == experiment_id,
             Experiment.user_id == user_id,
         )
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.first()
+
+    async def user_owns_experiment(self, experiment_id: UUID, user_id: UUID) -> bool:
+        """
+        Check ownership without loading the experiment or its relationships.
+
+        Args:
+            experiment_id: The experiment UUID.
+            user_id: The user UUID who should own this experiment.
+
+        Returns:
+            True if the experiment exists and belongs to the user.
+        """
+        stmt = select(
+            exists().where(
+                Experiment.id == experiment_id,
+                Experiment.user_id == user_id,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return bool(result.scalar())
 
 
 class BatchRunRepository:
@@ -274,9 +533,14 @@ class BatchRunRepository:
             batch_run_id: The batch run UUID.
 
         Returns:
-            BatchRun or None if not found.
+            BatchRun or None if not found. Iterations are not loaded; use
+            get_batch_run_with_iterations for those.
         """
-        stmt = select(BatchRun).where(BatchRun.id == batch_run_id)
+        stmt = (
+            select(BatchRun)
+            .where(BatchRun.id == batch_run_id)
+            .options(raiseload(BatchRun.iterations))
+        )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -484,3 +748,89 @@ class IterationRepository:
 
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def list_iterations_for_experiment(
+        self,
+        experiment_id: UUID,
+        limit: int,
+        offset: int = 0,
+    ) -> list[Row[Any]]:
+        """
+        Get one page of an experiment's iteration rows.
+
+        Args:
+            experiment_id: The experiment UUID.
+            limit: Maximum number of rows to return.
+            offset: Number of rows to skip.
+
+        Returns:
+            Rows with the same columns and order as
+            stream_iteration_batches.
+        """
+        stmt = _iteration_detail_query(experiment_id).limit(limit).offset(offset)
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_iteration_stats(self, experiment_id: UUID) -> Row[Any]:
+        """
+        Aggregate an experiment's iterations in a single query.
+
+        Counts, latency percentiles and token totals are computed by
+        PostgreSQL, so no iteration rows are loaded into Python.
+
+        Args:
+            experiment_id: The experiment UUID.
+
+        Returns:
+            Row with total_iterations, successful_iterations, avg/p50/p95
+            latency_ms (None without successful iterations) and
+            prompt/completion/total token sums.
+        """
+        succeeded = Iteration.is_success.is_(True)
+        stmt = (
+            select(
+                func.count().label("total_iterations"),
+                func.count().filter(succeeded).label("successful_iterations"),
+                func.avg(Iteration.latency_ms).filter(succeeded).label("avg_latency_ms"),
+                func.percentile_cont(0.5)
+                .within_group(Iteration.latency_ms)
+                .filter(succeeded)
+                .label("p50_latency_ms"),
+                func.percentile_cont(0.95)
+                .within_group(Iteration.latency_ms)
+                .filter(succeeded)
+                .label("p95_latency_ms"),
+                func.coalesce(func.sum(Iteration.prompt_tokens), 0).label("prompt_tokens"),
+                func.coalesce(func.sum(Iteration.completion_tokens), 0).label("completion_tokens"),
+                func.coalesce(func.sum(Iteration.total_tokens), 0).label("total_tokens"),
+            )
+            .join(BatchRun, Iteration.batch_run_id == BatchRun.id)
+            .where(BatchRun.experiment_id == experiment_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.one()
+
+    async def stream_iteration_batches(
+        self,
+        experiment_id: UUID,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[Row[Any]]]:
+        """
+        Stream an experiment's iteration rows through a server-side cursor.
+
+        Rows are fetched and yielded `batch_size` at a time, so memory stays
+        bounded however many iterations (and raw_response blobs) the
+        experiment has, and callers can handle each fetch as one unit.
+
+        Args:
+            experiment_id: The experiment UUID.
+            batch_size: Rows fetched per cursor round-trip.
+
+        Yields:
+            Lists of rows with batch_run_id plus the IterationDetail columns,
+            ordered by batch run start and iteration index.
+        """
+        stmt = _iteration_detail_query(experiment_id).execution_options(yield_per=batch_size)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield rows
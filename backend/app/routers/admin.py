@@ -8,15 +8,20 @@ This module provides admin-only endpoints for:
 - Platform statistics
 """
 
+import base64
+import json
 import logging
+from datetime import datetime
 from typing import Annotated, Any
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db_session as get_db
 from backend.app.core.deps import get_current_admin_user
+from backend.app.core.redis import RedisClient, cache_delete, cache_get, cache_set
 from backend.app.models.experiment import Experiment, ExperimentStatus
 from backend.app.models.user import User, UserRole
 from backend.app.schemas.admin import (
@@ -25,25 +30,20 @@ from backend.app.schemas.admin import (
     SystemConfigUpdate,
     UserManagementResponse,
 )
+from backend.app.services.system_config import system_config_store
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 logger = logging.getLogger(__name__)
 
-
-# In-memory system configuration (in production, use Redis or database)
-_system_config = {
-    "default_iterations": 10,
-    "default_frequency": "daily",  # daily, weekly, monthly
-    "default_recurring": False,
-    "max_iterations_per_experiment": 100,
-    "enable_recurring_experiments": True,
-    "maintenance_mode": False,
-}
+# Platform-wide stats are not user-specific, so a single shared key is safe
+ADMIN_STATS_CACHE_KEY = "admin:stats"
+ADMIN_STATS_CACHE_TTL = 30  # seconds
 
 
 @router.get("/config", response_model=SystemConfigResponse)
 async def get_system_config(
     current_admin: Annotated[User, Depends(get_current_admin_user)],
+    redis: RedisClient,
 ) -> dict[str, Any]:
     """
     Get current system configuration.
@@ -54,13 +54,14 @@ async def get_system_config(
         System configuration including default settings for experiments.
     """
     logger.info(f"Admin {current_admin.email} retrieved system config")
-    return _system_config
+    return await system_config_store.get_all(redis)
 
 
 @router.put("/config", response_model=SystemConfigResponse)
 async def update_system_config(
     config_update: SystemConfigUpdate,
     current_admin: Annotated[User, Depends(get_current_admin_user)],
+    redis: RedisClient,
 ) -> dict[str, Any]:
     """
     Update system configuration.
@@ -73,6 +74,7 @@ async def update_system_config(
     Args:
         config_update: Configuration updates to apply.
         current_admin: Authenticated admin user.
+        redis: Redis client holding the shared configuration.
 
     Returns:
         Updated system configuration.
@@ -83,18 +85,20 @@ async def update_system_config(
 
     # Update only provided fields
     update_data = config_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        if key in _system_config:
-            _system_config[key] = value
+    config = await system_config_store.update(redis, update_data)
+
+    # Stats embed the system config, so drop the cached copy
+    await cache_delete(redis, ADMIN_STATS_CACHE_KEY)
 
     logger.info("System config updated successfully")
-    return _system_config
+    return config
 
 
 @router.get("/stats", response_model=AdminStatsResponse)
 async def get_admin_stats(
     current_admin: Annotated[User, Depends(get_current_admin_user)],
     session: Annotated[AsyncSession, Depends(get_db)],
+    redis: RedisClient,
 ) -> dict[str, Any]:
     """
     Get platform-wide statistics.
@@ -106,54 +110,55 @@ async def get_admin_stats(
     - Active recurring experiments
     - Resource usage
 
+    Results are cached in Redis for 30 seconds.
+
     Args:
         current_admin: Authenticated admin user.
         session: Database session.
+        redis: Redis client for response caching.
 
     Returns:
         Platform statistics.
     """
     logger.info(f"Admin {current_admin.email} retrieving platform stats")
 
-    # Get user counts
-    total_users_result = await session.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar() or 0
-
-    active_users_result = await session.execute(select(func.count(User.id)).where(User.is_active))
-    active_users = active_users_result.scalar() or 0
-
-    # Get experiment counts
-    total_experiments_result = await session.execute(select(func.count(Experiment.id)))
-    total_experiments = total_experiments_result.scalar() or 0
+    cached = await cache_get(redis, ADMIN_STATS_CACHE_KEY)
+    if cached:
+        return json.loads(cached)
 
-    completed_experiments_result = await session.execute(
-        select(func.count(Experiment.id)).where(
-            Experiment.status == ExperimentStatus.COMPLETED.value
+    # User counts in a single round-trip via conditional aggregation
+    user_counts = await session.execute(
+        select(
+            func.count(User.id),
+            func.count(User.id).filter(User.is_active),
         )
     )
-    completed_experiments = completed_experiments_result.scalar() or 0
-
-    running_experiments_result = await session.execute(
-        select(func.count(Experiment.id)).where(Experiment.status == ExperimentStatus.RUNNING.value)
-    )
-    running_experiments = running_experiments_result.scalar() or 0
-
-    # Get recurring experiment counts
-    recurring_experiments_result = await session.execute(
-        select(func.count(Experiment.id)).where(Experiment.is_recurring)
-    )
-    recurring_experiments = recurring_experiments_result.scalar() or 0
-
-    active_recurring_result = await session.execute(
-        select(func.count(Experiment.id)).where(
-            Experiment.is_recurring,
-            Experiment.status != ExperimentStatus.FAILED.value,
-            Experiment.status != ExperimentStatus.CANCELLED.value,
+    total_users, active_users = user_counts.one()
+
+    # Experiment counts in a single round-trip via conditional aggregation
+    experiment_counts = await session.execute(
+        select(
+            func.count(Experiment.id),
+            func.count(Experiment.id).filter(Experiment.status == ExperimentStatus.COMPLETED.value),
+            func.count(Experiment.id).filter(Experiment.status == ExperimentStatus.RUNNING.value),
+            func.count(Experiment.id).filter(Experiment.is_recurring),
+            func.count(Experiment.id).filter(
+                Experiment.is_recurring,
+                Experiment.status.notin_(
+                    [ExperimentStatus.FAILED.value, ExperimentStatus.CANCELLED.value]
+                ),
+            ),
         )
     )
-    active_recurring = active_recurring_result.scalar() or 0
-
-    return {
+    (
+        total_experiments,
+        completed_experiments,
+        running_experiments,
+        recurring_experiments,
+        active_recurring,
+    ) = experiment_counts.one()
+
+    stats = {
         "total_users": total_users,
         "active_users": active_users,
         "total_experiments": total_experiments,
@@ -161,39 +166,96 @@ async def get_admin_stats(
         "running_experiments": running_experiments,
         "recurring_experiments": recurring_experiments,
         "active_recurring_experiments": active_recurring,
-        "system_config": _system_config,
+        "system_config": await system_config_store.get_all(redis),
     }
 
+    await cache_set(redis, ADMIN_STATS_CACHE_KEY, json.dumps(stats), ADMIN_STATS_CACHE_TTL)
+
+    return stats
+
 
 @router.get("/users", response_model=list[UserManagementResponse])
 async def list_users(
+    response: Response,
     current_admin: Annotated[User, Depends(get_current_admin_user)],
     session: Annotated[AsyncSession, Depends(get_db)],
-    limit: int = 50,
-    offset: int = 0,
-) -> list[User]:
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
+) -> list[UserManagementResponse]:
     """
     List all users with pagination.
 
     **Admin only**: Requires admin role.
 
+    Supports keyset pagination: when a page is full, the `X-Next-Cursor`
+    response header carries an opaque cursor; pass it back as `cursor` to
+    fetch the next page in constant time regardless of depth. `offset` is
+    still honoured when no cursor is given.
+
     Args:
+        response: Outgoing response (used to set the next-page cursor header).
         current_admin: Authenticated admin user.
         session: Database session.
-        limit: Maximum number of users to return.
-        offset: Number of users to skip.
+        limit: Maximum number of users to return (1-200).
+        offset: Number of users to skip (ignored when `cursor` is set).
+        cursor: Cursor from a previous page's `X-Next-Cursor` header.
 
     Returns:
         List of users with their details.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
     """
-    logger.info(f"Admin {current_admin.email} listing users (limit={limit}, offset={offset})")
+    logger.info(
+        f"Admin {current_admin.email} listing users (limit={limit}, offset={offset}, cursor={cursor})"
+    )
 
-    result = await session.execute(
-        select(User).order_by(User.created_at.desc()).limit(limit).offset(offset)
+    # Only the columns the response exposes (never hashed_password or brand data)
+    stmt = (
+        select(
+            User.id,
+            User.email,
+            User.full_name,
+            User.role,
+            User.pricing_tier,
+            User.monthly_prompt_quota,
+            User.prompts_used_this_month,
+            User.is_active,
+            User.is_verified,
+            User.created_at,
+            User.last_login_at,
+        )
+        .order_by(User.created_at.desc(), User.id.desc())
+        .limit(limit)
     )
-    users = result.scalars().all()
 
-    return list(users)
+    if cursor:
+        try:
+            created_at_raw, id_raw = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+            cursor_key = (datetime.fromisoformat(created_at_raw), UUID(id_raw))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        stmt = stmt.where(tuple_(User.created_at, User.id) < cursor_key)
+    else:
+        stmt = stmt.offset(offset)
+
+    result = await session.execute(stmt)
+    # Typed columns straight from the database; skip per-row validation
+    users = [
+        UserManagementResponse.model_construct(**{**row._mapping, "id": str(row.id)})
+        for row in result
+    ]
+
+    if users and len(users) == limit:
+        last = users[-1]
+        raw_cursor = f"{last.created_at.isoformat()}|{last.id}"
+        response.headers["X-Next-Cursor"] = base64.urlsafe_b64encode(raw_cursor.encode()).decode()
+
+    return users
 
 
 @router.patch("/users/{user_id}/role")
@@ -219,23 +281,23 @@ async def update_user_role(
     """
     logger.info(f"Admin {current_admin.email} updating user {user_id} role to {new_role}")
 
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
+    # Prevent admin from demoting themselves (the caller is already loaded, no query needed)
+    if user_id.lower() == str(current_admin.id).lower() and new_role != UserRole.ADMIN:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot change your own admin role",
         )
 
-    # Prevent admin from demoting themselves
-    if str(user.id) == str(current_admin.id) and new_role != UserRole.ADMIN:
+    # Single round-trip: update and detect a missing user via RETURNING
+    result = await session.execute(
+        update(User).where(User.id == user_id).values(role=new_role.value).returning(User.id)
+    )
+    if result.first() is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot change your own admin role",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
         )
 
-    user.role = new_role.value
     await session.commit()
 
     logger.info(f"User {user_id} role updated to {new_role}")
@@ -271,16 +333,18 @@ async def update_user_quota(
             detail="Quota cannot be negative",
         )
 
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
+    result = await session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(monthly_prompt_quota=new_quota)
+        .returning(User.id)
+    )
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    user.monthly_prompt_quota = new_quota
     await session.commit()
 
     logger.info(f"User {user_id} quota updated to {new_quota}")
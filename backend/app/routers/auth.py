@@ -4,20 +4,25 @@ Authentication and user management endpoints.
 This module provides routes for user registration, login, and API key management.
 """
 
+import asyncio
+import json
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from pydantic import BaseModel, EmailStr
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from sqlalchemy import select
+from redis.asyncio import Redis
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db_session as get_db
 from backend.app.core.deps import get_current_active_user
+from backend.app.core.rate_limit import rate_limit_by_ip
+from backend.app.core.redis import RedisClient, cache_delete, cache_get, cache_set
 from backend.app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -25,7 +30,9 @@ from backend.app.core.security import (
     generate_api_key,
     get_api_key_prefix,
     get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    record_last_login,
+    verify_password_async,
 )
 from backend.app.models.user import APIKey, PricingTier, User, UserRole
 from backend.app.schemas.auth import (
@@ -37,6 +44,7 @@ from backend.app.schemas.auth import (
     UserRegister,
     UserResponse,
 )
+from backend.app.services.cache_keys import brand_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -55,34 +63,128 @@ class VerifyEmailRequest(BaseModel):
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
-limiter = Limiter(key_func=get_remote_address)
 logger = logging.getLogger(__name__)
 
+# Length of the free tier's first quota period
+_FREE_QUOTA_PERIOD = timedelta(days=30)
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("3/hour")  # Prevent spam registrations
+# Checked against when the email is unknown so failed logins take the same time
+_DUMMY_HASH = get_password_hash("!invalid!")
+
+# Short-lived cache of the user fields the token flows need
+USER_CACHE_TTL = 60  # seconds
+# Cap on email token redemptions per user per window
+TOKEN_ATTEMPT_LIMIT = 10
+TOKEN_ATTEMPT_WINDOW = 60  # seconds
+
+
+def _user_cache_key(user_id: str) -> str:
+    return f"echo:user:{user_id}"
+
+
+async def get_user_cached(
+    db: AsyncSession,
+    redis: Redis,  # type: ignore[type-arg]
+    user_id: str,
+) -> dict[str, object] | None:
+    """
+    Look up the email, name and verification state of a user.
+
+    Served from Redis when possible; falls back to the database and caches
+    the result for USER_CACHE_TTL seconds.
+
+    Args:
+        db: Database session.
+        redis: Redis client.
+        user_id: UUID of the user.
+
+    Returns:
+        dict | None: The cached user fields, or None if the user does not exist.
+    """
+    cache_key = _user_cache_key(user_id)
+    cached = await cache_get(redis, cache_key)
+    if cached:
+        return json.loads(cached)
+
+    result = await db.execute(
+        select(User.email, User.full_name, User.is_verified).where(User.id == UUID(user_id))
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    user_info = {"email": row.email, "full_name": row.full_name, "is_verified": row.is_verified}
+    await cache_set(redis, cache_key, json.dumps(user_info), USER_CACHE_TTL)
+    return user_info
+
+
+async def invalidate_user_cache(redis: Redis, user_id: str) -> None:  # type: ignore[type-arg]
+    """Drop the cached user fields after a change to the user row."""
+    await cache_delete(redis, _user_cache_key(user_id))
+
+
+async def _send_email_safely(
+    send: Callable[..., Awaitable[None]],
+    description: str,
+    **kwargs: str,
+) -> None:
+    """
+    Run an email send as a background task, logging instead of raising on failure.
+
+    Args:
+        send: Email service coroutine function.
+        description: Human-readable email type used in the error log.
+        **kwargs: Arguments forwarded to the send function.
+    """
+    try:
+        await send(**kwargs)
+    except Exception as e:
+        logger.error(f"Failed to send {description}: {e}", exc_info=True)
+
+
+async def _check_token_attempts(redis: Redis, user_id: str) -> None:  # type: ignore[type-arg]
+    """
+    Rate-limit email token redemptions for a user.
+
+    Fails open if Redis is unavailable.
+
+    Raises:
+        HTTPException: If the user exceeded TOKEN_ATTEMPT_LIMIT in the current window.
+    """
+    key = f"echo:verify:{user_id}"
+    try:
+        attempts = await redis.incr(key)
+        if attempts == 1:
+            await redis.expire(key, TOKEN_ATTEMPT_WINDOW)
+    except Exception as e:
+        logger.warning(f"Redis token attempt counter failed for {key}: {e}")
+        return
+
+    if attempts > TOKEN_ATTEMPT_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, please try again later",
+        )
+
+
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit_by_ip("register", 3, 3600))],  # Prevent spam registrations
+)
 async def register(
     user_data: UserRegister,
-    request: Request,  # noqa: ARG001
     db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
 ) -> User:
     """
     Register a new user account.
 
     Creates a new user with the FREE pricing tier and default quota.
     """
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing_user = result.scalar_one_or_none()
-
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         email=user_data.email,
         hashed_password=hashed_password,
@@ -90,34 +192,44 @@ async def register(
         role=UserRole.USER.value,
         pricing_tier=PricingTier.FREE.value,
         monthly_prompt_quota=3,  # Free tier quota (3 prompts/month, each runs 10 iterations)
-        quota_reset_date=datetime.now(UTC) + timedelta(days=30),
+        quota_reset_date=datetime.now(UTC) + _FREE_QUOTA_PERIOD,
     )
 
+    # All defaults are client-side and the session doesn't expire on commit,
+    # so the instance is already complete without a refresh SELECT
     db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # UNIQUE(email) enforces duplicates in the same round-trip as the insert
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered",
+        )
 
-    # Send verification email
+    # Send verification email after the response is flushed; failures don't fail registration
     from backend.app.services.email import send_verification_email
 
-    try:
-        await send_verification_email(
-            user_email=new_user.email,
-            user_name=new_user.full_name or new_user.email,
-            user_id=str(new_user.id),
-        )
-    except Exception as e:
-        # Log error but don't fail registration
-        logger.error(f"Failed to send verification email: {e}", exc_info=True)
+    background_tasks.add_task(
+        _send_email_safely,
+        send_verification_email,
+        "verification email",
+        user_email=new_user.email,
+        user_name=new_user.full_name or new_user.email,
+        user_id=str(new_user.id),
+    )
 
     return new_user
 
 
-@router.post("/login", response_model=Token)
-@limiter.limit("5/minute")  # Prevent brute force attacks
+@router.post(
+    "/login",
+    response_model=Token,
+    dependencies=[Depends(rate_limit_by_ip("login", 5, 60))],  # Prevent brute force attacks
+)
 async def login(
     login_data: UserLogin,
-    request: Request,  # noqa: ARG001
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> dict[str, str]:
     """
@@ -126,11 +238,19 @@ async def login(
     Returns both access token (15 min TTL) and refresh token (7 day TTL).
     Use the refresh token to obtain new access tokens without re-authenticating.
     """
-    # Find user by email
-    result = await db.execute(select(User).where(User.email == login_data.email))
-    user = result.scalar_one_or_none()
+    # Find user by email, loading only the columns needed to authenticate
+    result = await db.execute(
+        select(User.id, User.email, User.hashed_password, User.is_active).where(
+            User.email == login_data.email
+        )
+    )
+    user = result.first()
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # Always run bcrypt so unknown emails can't be distinguished by response time
+    password_ok = await verify_password_async(
+        login_data.password, user.hashed_password if user else _DUMMY_HASH
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -143,9 +263,8 @@ async def login(
             detail="User account is inactive",
         )
 
-    # Update last login timestamp
-    user.last_login_at = datetime.now(UTC)
-    await db.commit()
+    # Buffered in Redis and batched into Postgres, keeping a commit off the login path
+    await record_last_login(str(user.id))
 
     # Create access token (short-lived) and refresh token (long-lived)
     access_token = create_access_token(data={"user_id": str(user.id), "email": user.email})
@@ -320,7 +439,7 @@ async def create_api_key(
     The full API key is only returned once. Store it securely!
     """
     # Generate API key
-    raw_key, hashed_key = generate_api_key()
+    raw_key, hashed_key = await asyncio.to_thread(generate_api_key)
     prefix = get_api_key_prefix(raw_key)
 
     # Create API key record
@@ -333,7 +452,6 @@ async def create_api_key(
 
     db.add(api_key)
     await db.commit()
-    await db.refresh(api_key)
 
     # Return response with the raw key (only time it's shown)
     return APIKeyResponse(
@@ -374,20 +492,23 @@ async def revoke_api_key(
 
     Only the owner of the API key can revoke it.
     """
+    # Single round-trip; COALESCE keeps the original revocation time on repeat calls
     result = await db.execute(
-        select(APIKey).where(APIKey.id == api_key_id, APIKey.user_id == current_user.id)
+        update(APIKey)
+        .where(APIKey.id == api_key_id, APIKey.user_id == current_user.id)
+        .values(
+            is_active=False,
+            revoked_at=func.coalesce(APIKey.revoked_at, datetime.now(UTC)),
+        )
+        .returning(APIKey.id)
     )
-    api_key = result.scalar_one_or_none()
 
-    if not api_key:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="API key not found",
         )
 
-    # Soft delete by setting revoked_at and deactivating
-    api_key.is_active = False
-    api_key.revoked_at = datetime.utcnow()
     await db.commit()
 
 
@@ -395,6 +516,8 @@ async def revoke_api_key(
 async def verify_email(
     body: VerifyEmailRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
+    redis: RedisClient,
+    background_tasks: BackgroundTasks,
 ) -> dict[str, str]:
     """
     Verify user email address using token from email.
@@ -424,32 +547,45 @@ async def verify_email(
             detail="Invalid token payload",
         )
 
-    # Get user and mark as verified
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
-    user = result.scalar_one_or_none()
+    await _check_token_attempts(redis, user_id)
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+    # Repeat clicks on the same link are answered from the cache
+    cached_user = await cache_get(redis, _user_cache_key(user_id))
+    if cached_user and json.loads(cached_user)["is_verified"]:
+        return {"message": "Email already verified"}
 
-    if user.is_verified:
+    # Mark as verified in one round-trip; RETURNING supplies the welcome email details
+    result = await db.execute(
+        update(User)
+        .where(User.id == UUID(user_id), User.is_verified.is_(False))
+        .values(is_verified=True)
+        .returning(User.email, User.full_name)
+    )
+    row = result.first()
+
+    if row is None:
+        # Nothing updated: either already verified or the user no longer exists
+        if await get_user_cached(db, redis, user_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
         return {"message": "Email already verified"}
 
-    user.is_verified = True
     await db.commit()
+    await invalidate_user_cache(redis, user_id)
+    email, full_name = row
 
-    # Send welcome email
+    # Send welcome email after the response
     from backend.app.services.email import send_welcome_email
 
-    try:
-        await send_welcome_email(
-            user_email=user.email,
-            user_name=user.full_name or user.email,
-        )
-    except Exception as e:
-        logger.error(f"Failed to send welcome email: {e}", exc_info=True)
+    background_tasks.add_task(
+        _send_email_safely,
+        send_welcome_email,
+        "welcome email",
+        user_email=email,
+        user_name=full_name or email,
+    )
 
     return {"message": "Email verified successfully"}
 
@@ -488,6 +624,7 @@ async def resend_verification(
 async def forgot_password(
     body: ForgotPasswordRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
 ) -> dict[str, str]:
     """
     Request password reset email.
@@ -502,14 +639,15 @@ async def forgot_password(
 
     from backend.app.services.email import send_password_reset_email
 
-    try:
-        await send_password_reset_email(
-            user_email=user.email,
-            user_name=user.full_name or user.email,
-            user_id=str(user.id),
-        )
-    except Exception as e:
-        logger.error(f"Failed to send password reset email: {e}", exc_info=True)
+    # Sent after the response so the timing doesn't reveal whether the email exists
+    background_tasks.add_task(
+        _send_email_safely,
+        send_password_reset_email,
+        "password reset email",
+        user_email=user.email,
+        user_name=user.full_name or user.email,
+        user_id=str(user.id),
+    )
 
     return {"message": "If the email exists, a password reset link has been sent"}
 
@@ -518,6 +656,7 @@ async def forgot_password(
 async def reset_password(
     body: ResetPasswordRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
+    redis: RedisClient,
 ) -> dict[str, str]:
     """
     Reset password using token from email.
@@ -546,19 +685,24 @@ async def reset_password(
             detail="Invalid token payload",
         )
 
-    # Get user and update password
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
-    user = result.scalar_one_or_none()
+    await _check_token_attempts(redis, user_id)
 
-    if not user:
+    # Update password in a single statement
+    new_hash = await get_password_hash_async(body.new_password)
+    result = await db.execute(
+        update(User)
+        .where(User.id == UUID(user_id))
+        .values(hashed_password=new_hash)
+        .returning(User.id)
+    )
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    # Update password
-    user.hashed_password = get_password_hash(body.new_password)
     await db.commit()
+    await invalidate_user_cache(redis, user_id)
 
     return {"message": "Password reset successfully"}
 
@@ -567,6 +711,7 @@ async def reset_password(
 async def delete_account(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    redis: RedisClient,
 ) -> None:
     """
     Delete the current user's account (GDPR right to erasure).
@@ -586,3 +731,8 @@ async def delete_account(
     # experiments, batch_runs, and iterations will be removed automatically.
     await db.delete(current_user)
     await db.commit()
+
+    # Cached per-user responses would otherwise outlive the account until their TTL
+    await cache_delete(
+        redis, _user_cache_key(str(current_user.id)), brand_cache_key(current_user.id)
+    )
@@ -7,27 +7,33 @@ This module provides routes for Stripe integration including:
 - Webhook handling
 """
 
+import logging
 from typing import Annotated
 
 import stripe
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 from pydantic import BaseModel, HttpUrl
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.config import get_settings
 from backend.app.core.database import get_db_session as get_db
 from backend.app.core.deps import get_current_active_user
+from backend.app.core.redis import RedisClient, cache_delete
 from backend.app.models.user import PricingTier, User
 from backend.app.services.billing import (
     create_checkout_session,
     create_portal_session,
     downgrade_user_tier,
+    reset_subscription_usage,
     upgrade_user_tier,
 )
 
 settings = get_settings()
 router = APIRouter(prefix="/billing", tags=["Billing"])
+logger = logging.getLogger(__name__)
+
+# Stripe retries deliveries for up to 3 days; a day covers the bulk of retries
+STRIPE_EVENT_DEDUP_TTL = 86400  # seconds
 
 
 # Request/Response schemas
@@ -173,18 +179,18 @@ async def get_usage(
 ) -> UsageResponse:
     """
     Get current usage statistics for the user.
+
+    Served entirely from the user row already loaded for authentication,
+    so there is no additional database or cache lookup.
     """
-    remaining = current_user.monthly_prompt_quota - current_user.prompts_used_this_month
-    percentage_used = (
-        (current_user.prompts_used_this_month / current_user.monthly_prompt_quota) * 100
-        if current_user.monthly_prompt_quota > 0
-        else 0
-    )
+    used = current_user.prompts_used_this_month
+    quota = current_user.monthly_prompt_quota
+    percentage_used = used * 100 / quota if quota > 0 else 0.0
 
     return UsageResponse(
-        prompts_used=current_user.prompts_used_this_month,
-        monthly_quota=current_user.monthly_prompt_quota,
-        remaining=remaining,
+        prompts_used=used,
+        monthly_quota=quota,
+        remaining=quota - used,
         percentage_used=round(percentage_used, 2),
         pricing_tier=current_user.pricing_tier,
     )
@@ -194,6 +200,7 @@ async def get_usage(
 async def stripe_webhook(
     request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
+    redis: RedisClient,
     stripe_signature: Annotated[str | None, Header(alias="stripe-signature")] = None,
 ) -> dict[str, str]:
     """
@@ -207,6 +214,8 @@ async def stripe_webhook(
     - customer.subscription.deleted: Downgrade to free tier
     - invoice.payment_succeeded: Reset monthly quota
     - invoice.payment_failed: Handle failed payment
+
+    Redelivered events (same event id) are acknowledged without reprocessing.
     """
     if not stripe_signature:
         raise HTTPException(
@@ -239,52 +248,54 @@ async def stripe_webhook(
             detail="Invalid signature",
         )
 
-    # Handle the event
-    event_type = event["type"]
-    data = event["data"]["object"]
-
-    if event_type == "checkout.session.completed":
-        # Payment successful, upgrade user
-        user_id = data.get("metadata", {}).get("user_id")
-        pricing_tier = data.get("metadata", {}).get("pricing_tier")
-
-        if user_id and pricing_tier:
-            result = await db.execute(select(User).where(User.id == user_id))
-            user = result.scalar_one_or_none()
-
-            if user:
-                user.stripe_subscription_id = data.get("subscription")
-                await upgrade_user_tier(user, PricingTier(pricing_tier), db)
-
-    elif event_type == "customer.subscription.deleted":
-        # Subscription cancelled, downgrade to free
-        subscription_id = data["id"]
-
-        result = await db.execute(
-            select(User).where(User.stripe_subscription_id == subscription_id)
-        )
-        user = result.scalar_one_or_none()
-
-        if user:
-            user.stripe_subscription_id = None
-            await downgrade_user_tier(user, PricingTier.FREE, db)
-
-    elif event_type == "invoice.payment_succeeded":
-        # Monthly payment succeeded, reset quota
-        subscription_id = data.get("subscription")
-
-        if subscription_id:
-            result = await db.execute(
-                select(User).where(User.stripe_subscription_id == subscription_id)
-            )
-            user = result.scalar_one_or_none()
+    # Dedup gate: Stripe may deliver the same event more than once
+    dedup_key = f"echo:stripe:event:{event['id']}"
+    try:
+        first_delivery = await redis.set(dedup_key, "1", nx=True, ex=STRIPE_EVENT_DEDUP_TTL)
+    except Exception as e:
+        # Without Redis we can't dedup; process rather than drop the event
+        logger.warning(f"Stripe event dedup unavailable for {event['id']}: {e}")
+        first_delivery = True
 
-            if user:
-                user.prompts_used_this_month = 0
-                await db.commit()
+    if not first_delivery:
+        logger.info(f"Ignoring duplicate Stripe event {event['id']}")
+        return {"status": "duplicate"}
 
-    elif event_type == "invoice.payment_failed":
-        # Payment failed, notify user (implement notification system)
-        pass
+    try:
+        # Handle the event
+        event_type = event["type"]
+        data = event["data"]["object"]
+
+        if event_type == "checkout.session.completed":
+            # Payment successful, upgrade user
+            user_id = data.get("metadata", {}).get("user_id")
+            pricing_tier = data.get("metadata", {}).get("pricing_tier")
+
+            if user_id and pricing_tier:
+                await upgrade_user_tier(
+                    user_id,
+                    PricingTier(pricing_tier),
+                    db,
+                    subscription_id=data.get("subscription"),
+                )
+
+        elif event_type == "customer.subscription.deleted":
+            # Subscription cancelled, downgrade to free
+            await downgrade_user_tier(data["id"], PricingTier.FREE, db)
+
+        elif event_type == "invoice.payment_succeeded":
+            # Monthly payment succeeded, reset quota
+            subscription_id = data.get("subscription")
+
+            if subscription_id:
+                await reset_subscription_usage(subscription_id, db)
+
+        elif event_type == "invoice.payment_failed":
+            # Payment failed, notify user (implement notification system)
+            pass
+    except Exception:
+        # Release the gate so Stripe's retry of this event is processed
+        await cache_delete(redis, dedup_key)
+        raise
 
     return {"status": "success"}
@@ -1,10 +1,16 @@
 """Brand management API endpoints."""
 
+from typing import Any
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import ColumnElement, Row, Text, cast, func, select, type_coerce, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.database import get_db_session as get_session
-from backend.app.core.deps import get_current_user
+from backend.app.core.deps import get_current_user_id
+from backend.app.core.redis import RedisClient, cache_get, cache_set
 from backend.app.models.user import User
 from backend.app.schemas.brand import (
     BrandProfileCreate,
@@ -12,129 +18,228 @@ from backend.app.schemas.brand import (
     CompetitorAdd,
     CompetitorRemove,
 )
+from backend.app.services.cache_keys import brand_cache_key
 
 router = APIRouter(tags=["brand"])
 
+MAX_COMPETITORS = 10
+BRAND_CACHE_TTL = 60  # seconds
+
+# Brand columns selected or returned to build the profile response
+_BRAND_COLUMNS = (
+    User.brand_name,
+    User.brand_description,
+    User.brand_website,
+    User.brand_industry,
+    User.brand_competitors,
+    User.brand_target_keywords,
+)
+
+
+def _active_user(user_id: UUID) -> tuple[ColumnElement[bool], ...]:
+    """WHERE clauses scoping a write to the caller, if their account is active."""
+    return (User.id == user_id, User.is_active.is_(True))
+
+
+def _credentials_error() -> HTTPException:
+    """401 for a token whose user no longer exists."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def _account_error(session: AsyncSession, user_id: UUID) -> HTTPException | None:
+    """
+    Error for a caller whose active-user scoped statement matched no row.
+
+    Mirrors get_current_active_user: 401 if the user no longer exists and 403
+    if the account is inactive. Returns None when the account is active, so
+    the statement missed for another reason.
+    """
+    is_active = (
+        await session.execute(select(User.is_active).where(User.id == user_id))
+    ).scalar_one_or_none()
+    if is_active is None:
+        return _credentials_error()
+    if not is_active:
+        return HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive",
+        )
+    return None
+
+
+async def _cache_profile(redis: RedisClient, user_id: UUID, response: BrandProfileResponse) -> None:
+    """Write-through the latest profile so the next GET is served from Redis."""
+    await cache_set(redis, brand_cache_key(user_id), response.model_dump_json(), BRAND_CACHE_TTL)
+
+
+def _profile_response(row: Row[Any]) -> BrandProfileResponse:
+    """
+    Build the profile response from a row of _BRAND_COLUMNS.
+
+    Uses model_construct: every value is a database column written from a
+    validated BrandProfileCreate, so re-validating it is wasted work.
+    """
+    return BrandProfileResponse.model_construct(
+        brand_name=row.brand_name or "",
+        brand_description=row.brand_description,
+        brand_website=row.brand_website,
+        brand_industry=row.brand_industry,
+        brand_competitors=row.brand_competitors or [],
+        brand_target_keywords=row.brand_target_keywords or [],
+        has_brand_profile=bool(row.brand_name),
+    )
+
 
 @router.get("/brand/profile", response_model=BrandProfileResponse)
 async def get_brand_profile(
-    current_user: User = Depends(get_current_user),
+    redis: RedisClient,
+    user_id: UUID = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_session),
 ) -> BrandProfileResponse:
     """Get current user's brand profile."""
-    has_profile = bool(current_user.brand_name)
-
-    return BrandProfileResponse(
-        brand_name=current_user.brand_name or "",
-        brand_description=current_user.brand_description,
-        brand_website=current_user.brand_website,
-        brand_industry=current_user.brand_industry,
-        brand_competitors=current_user.brand_competitors or [],
-        brand_target_keywords=current_user.brand_target_keywords or [],
-        has_brand_profile=has_profile,
-    )
+    # A hit skips the is_active check; delete_account drops this key when it
+    # deactivates a user, and the TTL bounds any other out-of-band change
+    cache_key = brand_cache_key(user_id)
+    cached = await cache_get(redis, cache_key)
+    if cached:
+        return BrandProfileResponse.model_validate_json(cached)
+
+    row = (await session.execute(select(*_BRAND_COLUMNS).where(*_active_user(user_id)))).first()
+    if row is None:
+        raise await _account_error(session, user_id) or _credentials_error()
+
+    response = _profile_response(row)
+    await _cache_profile(redis, user_id, response)
+    return response
 
 
 @router.put("/brand/profile", response_model=BrandProfileResponse)
 async def update_brand_profile(
     profile: BrandProfileCreate,
-    current_user: User = Depends(get_current_user),
+    redis: RedisClient,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_session),
 ) -> BrandProfileResponse:
     """Update user's brand profile."""
-    # Update brand fields
-    current_user.brand_name = profile.brand_name
-    current_user.brand_description = profile.brand_description
-    current_user.brand_website = profile.brand_website
-    current_user.brand_industry = profile.brand_industry
-    current_user.brand_competitors = profile.brand_competitors
-    current_user.brand_target_keywords = profile.brand_target_keywords
-
-    session.add(current_user)
+    # Single UPDATE ... RETURNING; the user row is never loaded
+    result = await session.execute(
+        update(User)
+        .where(*_active_user(user_id))
+        .values(
+            brand_name=profile.brand_name,
+            brand_description=profile.brand_description,
+            brand_website=profile.brand_website,
+            brand_industry=profile.brand_industry,
+            brand_competitors=profile.brand_competitors,
+            brand_target_keywords=profile.brand_target_keywords,
+        )
+        .returning(*_BRAND_COLUMNS)
+    )
+    row = result.first()
+
+    if row is None:
+        raise await _account_error(session, user_id) or _credentials_error()
+
     await session.commit()
-    await session.refresh(current_user)
-
-    return BrandProfileResponse(
-        brand_name=current_user.brand_name,
-        brand_description=current_user.brand_description,
-        brand_website=current_user.brand_website,
-        brand_industry=current_user.brand_industry,
-        brand_competitors=current_user.brand_competitors or [],
-        brand_target_keywords=current_user.brand_target_keywords or [],
-        has_brand_profile=True,
+
+    response = _profile_response(row)
+    await _cache_profile(redis, user_id, response)
+    return response
+
+
+def _competitors_column() -> ColumnElement[Any]:
+    """brand_competitors as JSONB, treating NULL as an empty array."""
+    return type_coerce(
+        func.coalesce(User.brand_competitors, cast([], JSONB)),
+        JSONB,
     )
 
 
 @router.post("/brand/competitors", response_model=BrandProfileResponse)
 async def add_competitor(
     competitor: CompetitorAdd,
-    current_user: User = Depends(get_current_user),
+    redis: RedisClient,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_session),
 ) -> BrandProfileResponse:
     """Add a competitor to user's brand profile."""
-    competitors = current_user.brand_competitors or []
-
-    # Check if already exists
-    if competitor.competitor_name in competitors:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Competitor already exists",
+    name = competitor.competitor_name
+    competitors_col = _competitors_column()
+
+    # Atomic append: uniqueness and the 10-item cap are enforced in the WHERE
+    # clause, so concurrent requests can't race past either invariant
+    result = await session.execute(
+        update(User)
+        .where(
+            *_active_user(user_id),
+            ~competitors_col.has_key(name),
+            func.jsonb_array_length(competitors_col) < MAX_COMPETITORS,
         )
-
-    # Check max limit
-    if len(competitors) >= 10:
+        .values(brand_competitors=competitors_col.op("||")(cast([name], JSONB)))
+        .returning(*_BRAND_COLUMNS)
+    )
+    row = result.first()
+
+    if row is None:
+        # Nothing updated: work out which invariant rejected the change
+        current = (
+            await session.execute(select(User.brand_competitors).where(*_active_user(user_id)))
+        ).first()
+        if current is None:
+            raise await _account_error(session, user_id) or _credentials_error()
+        if name in (current.brand_competitors or []):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Competitor already exists",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Maximum 10 competitors allowed",
+            detail=f"Maximum {MAX_COMPETITORS} competitors allowed",
         )
 
-    # Create a new list to ensure SQLAlchemy detects the change
-    competitors = list(current_user.brand_competitors or [])
-    competitors.append(competitor.competitor_name)
-    current_user.brand_competitors = competitors
-
-    session.add(current_user)
     await session.commit()
-    await session.refresh(current_user)
-
-    return BrandProfileResponse(
-        brand_name=current_user.brand_name or "",
-        brand_description=current_user.brand_description,
-        brand_website=current_user.brand_website,
-        brand_industry=current_user.brand_industry,
-        brand_competitors=competitors,
-        brand_target_keywords=current_user.brand_target_keywords or [],
-        has_brand_profile=bool(current_user.brand_name),
-    )
+
+    response = _profile_response(row)
+    await _cache_profile(redis, user_id, response)
+    return response
 
 
 @router.delete("/brand/competitors", response_model=BrandProfileResponse)
 async def remove_competitor(
     competitor: CompetitorRemove,
-    current_user: User = Depends(get_current_user),
+    redis: RedisClient,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_session),
 ) -> BrandProfileResponse:
     """Remove a competitor from user's brand profile."""
-    competitors = current_user.brand_competitors or []
+    name = competitor.competitor_name
+    competitors_col = _competitors_column()
+
+    # Atomic removal; jsonb - text drops the matching string element
+    result = await session.execute(
+        update(User)
+        .where(*_active_user(user_id), competitors_col.has_key(name))
+        .values(brand_competitors=competitors_col.op("-")(cast(name, Text)))
+        .returning(*_BRAND_COLUMNS)
+    )
+    row = result.first()
 
-    if competitor.competitor_name not in competitors:
+    if row is None:
+        # Either the name isn't in the list or the account can't be used
+        error = await _account_error(session, user_id)
+        if error is not None:
+            raise error
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Competitor not found",
         )
 
-    competitors.remove(competitor.competitor_name)
-    current_user.brand_competitors = competitors
-
-    session.add(current_user)
     await session.commit()
-    await session.refresh(current_user)
-
-    return BrandProfileResponse(
-        brand_name=current_user.brand_name or "",
-        brand_description=current_user.brand_description,
-        brand_website=current_user.brand_website,
-        brand_industry=current_user.brand_industry,
-        brand_competitors=competitors,
-        brand_target_keywords=current_user.brand_target_keywords or [],
-        has_brand_profile=bool(current_user.brand_name),
-    )
+
+    response = _profile_response(row)
+    await _cache_profile(redis, user_id, response)
+    return response
@@ -2,20 +2,21 @@
 FastAPI router for dashboard analytics.
 """
 
+import asyncio
 import json
 import logging
 from collections import defaultdict
-from datetime import UTC, datetime, timedelta
-from typing import Annotated
+from datetime import UTC, datetime, time, timedelta
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import desc, func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Row, Select, case, column, desc, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import JSONB
 
-from backend.app.core.database import DbSession
+from backend.app.core.database import DbSession, get_session_factory
 from backend.app.core.deps import get_current_active_user
-from backend.app.core.redis import RedisClient
+from backend.app.core.redis import RedisClient, cache_get, cache_set
 from backend.app.models.experiment import BatchRun, Experiment, ExperimentStatus
 from backend.app.models.user import User
 from backend.app.schemas.dashboard import (
@@ -23,11 +24,17 @@ from backend.app.schemas.dashboard import (
     DashboardStatsResponse,
     ShareOfVoiceItem,
 )
+from backend.app.services.cache_keys import stats_cache_key
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 logger = logging.getLogger(__name__)
 
-STATS_CACHE_TTL = 300  # 5 minutes
+# Short TTL as a backstop; the worker also invalidates on experiment completion
+STATS_CACHE_TTL = 60  # seconds
+
+
+# Offsets for the 30-day trend skeleton, oldest first
+_TREND_DAY_OFFSETS = tuple(timedelta(days=i) for i in range(29, -1, -1))
 
 
 class TrendPoint(BaseModel):
@@ -49,7 +56,8 @@ class TrendPoint(BaseModel):
     - Aggregated Share of Voice
     - 30-day visibility trend
 
-    Results are cached in Redis for 5 minutes.
+    Results are cached in Redis for 60 seconds and invalidated when one of
+    the user's experiments completes.
     """,
 )
 async def get_dashboard_stats(
@@ -57,116 +65,126 @@ async def get_dashboard_stats(
     redis: RedisClient,
     current_user: Annotated[User, Depends(get_current_active_user)],
 ) -> DashboardStatsResponse:
-    cache_key = f"dashboard:stats:{current_user.id}"
+    # No experiment has ever completed: answer from the user row's counters
+    # without touching Redis or running any queries
+    if current_user.completed_experiments_count == 0:
+        return DashboardStatsResponse.model_construct(
+            total_experiments=current_user.experiments_count,
+            completed_experiments=0,
+            avg_visibility_score=0.0,
+            share_of_voice=[],
+            visibility_trend=[],
+        )
+
+    cache_key = stats_cache_key(current_user.id)
 
     # Try cache first
-    try:
-        cached = await redis.get(cache_key)
-        if cached:
-            data = json.loads(cached)
-            return DashboardStatsResponse(**data)
-    except Exception as e:
-        logger.warning(f"Redis cache read failed for {cache_key}: {e}")
+    cached = await cache_get(redis, cache_key)
+    if cached:
+        return DashboardStatsResponse.model_validate_json(cached)
 
-    # 1. Basic Counts
-    total_query = select(func.count()).where(Experiment.user_id == current_user.id)
-    completed_query = select(func.count()).where(
-        Experiment.user_id == current_user.id,
-        Experiment.status == ExperimentStatus.COMPLETED,
-    )
+    # 1. Basic Counts (single scan with a FILTERed aggregate)
+    counts_query = select(
+        func.count(Experiment.id),
+        func.count(Experiment.id).filter(Experiment.status == ExperimentStatus.COMPLETED),
+    ).where(Experiment.user_id == current_user.id)
 
-    total_experiments = (await session.execute(total_query)).scalar() or 0
-    completed_experiments = (await session.execute(completed_query)).scalar() or 0
+    total_experiments, completed_experiments = (await session.execute(counts_query)).one()
 
     # Return basic stats even if no completed experiments
     if completed_experiments == 0:
-        result = DashboardStatsResponse(
+        # Trusted, internally computed values: skip re-validation
+        result = DashboardStatsResponse.model_construct(
             total_experiments=total_experiments,
             completed_experiments=0,
             avg_visibility_score=0.0,
             share_of_voice=[],
             visibility_trend=[],
         )
-        _cache_stats(redis, cache_key, result)
+        await cache_set(redis, cache_key, result.model_dump_json(), STATS_CACHE_TTL)
         return result
 
-    # 2. Fetch completed experiments with their BatchRuns for aggregation
-    stmt = (
-        select(Experiment)
-        .options(selectinload(Experiment.batch_runs))
+    # 2. Aggregate BatchRun metrics in SQL over the 100 most recent completed experiments
+    recent_experiment_ids = (
+        select(Experiment.id)
         .where(
             Experiment.user_id == current_user.id,
             Experiment.status == ExperimentStatus.COMPLETED,
         )
         .order_by(desc(Experiment.created_at))
         .limit(100)
+        .scalar_subquery()
+    )
+    run_filter = (
+        BatchRun.experiment_id.in_(recent_experiment_ids),
+        func.jsonb_typeof(BatchRun.metrics) == "object",
+        BatchRun.metrics != literal_column("'{}'::jsonb"),
+    )
+    vis_rate = func.coalesce(
+        BatchRun.metrics["target_visibility"]["visibility_rate"].as_float(), 0.0
     )
-    result_rows = await session.execute(stmt)
-    experiments = result_rows.scalars().all()
-
-    # Aggregators
-    total_visibility_sum = 0.0
-    count_for_avg = 0
-
-    sov_agg: dict[str, float] = defaultdict(float)
-    sov_count: dict[str, int] = defaultdict(int)
-
-    trend_data: dict[str, list[float]] = defaultdict(list)
-
-    for exp in experiments:
-        if not exp.batch_runs:
-            continue
-
-        for br in exp.batch_runs:
-            if not br.metrics:
-                continue
-
-            metrics = br.metrics
 
-            # Visibility Score
-            target_vis = metrics.get("target_visibility", {})
-            vis_rate = target_vis.get("visibility_rate", 0.0)
+    # Average visibility across runs
+    avg_stmt = select(func.count(), func.avg(vis_rate)).where(*run_filter)
 
-            total_visibility_sum += vis_rate
-            count_for_avg += 1
+    # Share of Voice: unnest each run's share_of_voice array and sum shares per brand
+    sov_array = BatchRun.metrics["share_of_voice"]
+    sov_item = (
+        func.jsonb_array_elements(
+            case(
+                (func.jsonb_typeof(sov_array) == "array", sov_array),
+                else_=literal_column("'[]'::jsonb"),
+            )
+        )
+        .table_valued(column("value", JSONB))
+        .render_derived(name="sov_item")
+    )
+    brand_col = sov_item.c.value["brand"].astext
+    share_total = func.sum(func.coalesce(sov_item.c.value["share"].as_float(), 0.0))
+    sov_stmt = (
+        select(brand_col, share_total)
+        .select_from(BatchRun)
+        .join(sov_item, true())
+        .where(*run_filter, brand_col.is_not(None), brand_col != "")
+        .group_by(brand_col)
+        # Percentages are share_total scaled by a constant, so this is the final order
+        .order_by(desc(share_total))
+    )
 
-            # Trend Data (Group by Date)
-            if br.completed_at:
-                date_key = br.completed_at.strftime("%Y-%m-%d")
-                trend_data[date_key].append(vis_rate)
+    # 30-day trend: daily average visibility bucketed by UTC date
+    today = datetime.now(UTC).date()
+    trend_start = datetime.combine(today - _TREND_DAY_OFFSETS[0], time.min, tzinfo=UTC)
+    day_col = func.date(func.timezone("UTC", BatchRun.completed_at))
+    trend_stmt = (
+        select(day_col, func.avg(vis_rate))
+        .where(*run_filter, BatchRun.completed_at >= trend_start)
+        .group_by(day_col)
+    )
 
-            # Share of Voice
-            sov_list = metrics.get("share_of_voice", [])
-            for item in sov_list:
-                brand = item.get("brand")
-                share = item.get("share", 0.0)
-                if brand:
-                    sov_agg[brand] += share
-                    sov_count[brand] += 1
+    # The three aggregates are independent, so run them concurrently
+    avg_rows, sov_rows, trend_rows = await asyncio.gather(
+        _fetch_rows(avg_stmt), _fetch_rows(sov_stmt), _fetch_rows(trend_stmt)
+    )
 
-    # Final Calculations
-    avg_vis = (total_visibility_sum / count_for_avg) * 100 if count_for_avg > 0 else 0.0
+    count_for_avg, avg_rate = avg_rows[0]
+    avg_vis = float(avg_rate or 0.0) * 100
 
     final_sov = []
     if count_for_avg > 0:
-        for brand, total_share in sov_agg.items():
+        for brand, total_share in sov_rows:
             avg_share = (total_share / count_for_avg) * 100
-            final_sov.append(ShareOfVoiceItem(brand=brand, percentage=round(avg_share, 1)))
-    final_sov.sort(key=lambda x: x.percentage, reverse=True)
+            final_sov.append(
+                ShareOfVoiceItem.model_construct(brand=brand, percentage=round(avg_share, 1))
+            )
 
-    trends = []
-    today = datetime.now(UTC).date()
-    for i in range(29, -1, -1):
-        d = today - timedelta(days=i)
-        d_str = d.strftime("%Y-%m-%d")
-        daily_scores = trend_data.get(d_str, [])
-        if daily_scores:
-            daily_avg = sum(daily_scores) / len(daily_scores)
-            trends.append(DailyVisibility(date=d, visibility_score=round(daily_avg * 100, 1)))
-        else:
-            trends.append(DailyVisibility(date=d, visibility_score=0.0))
-
-    stats = DashboardStatsResponse(
+    # Scores keyed by date (the SQL already buckets by day), zipped onto the skeleton
+    trend_data = {day: round(float(daily_avg) * 100, 1) for day, daily_avg in trend_rows}
+    trends = [
+        DailyVisibility.model_construct(date=d, visibility_score=trend_data.get(d, 0.0))
+        for d in (today - offset for offset in _TREND_DAY_OFFSETS)
+    ]
+
+    stats = DashboardStatsResponse.model_construct(
         total_experiments=total_experiments,
         completed_experiments=completed_experiments,
         avg_visibility_score=round(avg_vis, 1),
@@ -174,22 +192,20 @@ async def get_dashboard_stats(
         visibility_trend=trends,
     )
 
-    # Write to cache (fire-and-forget, don't block response)
-    try:
-        await redis.setex(
-            cache_key,
-            STATS_CACHE_TTL,
-            stats.model_dump_json(),
-        )
-    except Exception as e:
-        logger.warning(f"Redis cache write failed for {cache_key}: {e}")
+    await cache_set(redis, cache_key, stats.model_dump_json(), STATS_CACHE_TTL)
 
     return stats
 
 
-def _cache_stats(redis: object, cache_key: str, stats: DashboardStatsResponse) -> None:
-    """Helper — we skip async write for empty-state shortcut to avoid awaiting in sync ctx."""
-    pass  # Cache written in the main path only
+async def _fetch_rows(stmt: Select[Any]) -> list[Row[Any]]:
+    """
+    Execute a read-only statement on its own session.
+
+    An AsyncSession can't run statements concurrently, so each query fanned
+    out with asyncio.gather gets a dedicated session (and pooled connection).
+    """
+    async with get_session_factory()() as session:
+        return list((await session.execute(stmt)).all())
 
 
 @router.get(
@@ -221,8 +237,9 @@ async def get_visibility_trends(
     cutoff = datetime.now(UTC) - timedelta(days=days)
 
     # Fetch completed batch_runs within the date range for this user's experiments
+    # (only the two columns used; whole rows would also selectin-load iterations)
     stmt = (
-        select(BatchRun)
+        select(BatchRun.metrics, BatchRun.completed_at)
         .join(Experiment, BatchRun.experiment_id == Experiment.id)
         .where(
             Experiment.user_id == current_user.id,
@@ -232,11 +249,11 @@ async def get_visibility_trends(
         .order_by(BatchRun.completed_at)
     )
     result = await session.execute(stmt)
-    batch_runs = result.scalars().all()
+    batch_runs = result.all()
 
-    # Aggregate by day
-    vis_by_day: dict[str, list[float]] = defaultdict(list)
-    sov_by_day: dict[str, list[float]] = defaultdict(list)
+    # Aggregate by day, keeping a running [sum, count] per bucket
+    vis_by_day: dict[str, list[float]] = defaultdict(lambda: [0.0, 0])
+    sov_by_day: dict[str, list[float]] = defaultdict(lambda: [0.0, 0])
 
     for br in batch_runs:
         if not br.metrics or not br.completed_at:
@@ -247,12 +264,16 @@ async def get_visibility_trends(
 
         target_vis = metrics.get("target_visibility", {})
         vis_rate = target_vis.get("visibility_rate", 0.0)
-        vis_by_day[date_key].append(vis_rate * 100)
+        acc = vis_by_day[date_key]
+        acc[0] += vis_rate * 100
+        acc[1] += 1
 
         sov_list = metrics.get("share_of_voice", [])
         if sov_list:
             # Use the first brand's share as the primary metric
-            sov_by_day[date_key].append(sov_list[0].get("share", 0.0) * 100)
+            acc = sov_by_day[date_key]
+            acc[0] += sov_list[0].get("share", 0.0) * 100
+            acc[1] += 1
 
     # Build ordered list for all days in range
     trend_points: list[TrendPoint] = []
@@ -261,14 +282,14 @@ async def get_visibility_trends(
         d = today - timedelta(days=i)
         d_str = d.strftime("%Y-%m-%d")
 
-        vis_values = vis_by_day.get(d_str, [])
-        sov_values = sov_by_day.get(d_str, [])
+        vis_sum, vis_count = vis_by_day.get(d_str, (0.0, 0))
+        sov_sum, sov_count = sov_by_day.get(d_str, (0.0, 0))
 
         trend_points.append(
-            TrendPoint(
+            TrendPoint.model_construct(
                 date=d_str,
-                visibility_rate=round(sum(vis_values) / len(vis_values), 1) if vis_values else 0.0,
-                share_of_voice=round(sum(sov_values) / len(sov_values), 1) if sov_values else 0.0,
+                visibility_rate=round(vis_sum / vis_count, 1) if vis_count else 0.0,
+                share_of_voice=round(sov_sum / sov_count, 1) if sov_count else 0.0,
             )
         )
 
@@ -1,20 +1,20 @@
+import asyncio
 import logging
+from itertools import islice
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from backend.app.builders.analysis import AnalysisBuilder
 from backend.app.builders.runner import BatchConfig, RunnerBuilder
-from backend.app.core.database import DbSession
-from backend.app.models.demo import DemoUsage
+from backend.app.core.rate_limit import rate_limit_by_ip
+from backend.app.core.redis import RedisClient
 from backend.app.schemas.llm import LLMProvider
+from backend.app.services.demo_usage import record_demo_usage
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/demo", tags=["Demo"])
-limiter = Limiter(key_func=get_remote_address)
 
 
 class DemoRequest(BaseModel):
@@ -35,12 +35,12 @@ class DemoResponse(BaseModel):
     "/quick-analysis",
     response_model=DemoResponse,
     summary="Run a quick 5-iteration public demo analysis",
+    dependencies=[Depends(rate_limit_by_ip("demo", 5, 60))],
 )
-@limiter.limit("5/minute")
 async def run_quick_demo(
     request: Request,
     demo_req: DemoRequest,
-    session: DbSession,
+    redis: RedisClient,
 ):
     """
     Public demo endpoint. Runs a small-scale analysis (5 iterations) synchronously.
@@ -50,16 +50,18 @@ async def run_quick_demo(
     - Rate limited to 5 per minute per IP
     - No auth required
     """
-    # 1. Log Usage
+    # 1. Log Usage (buffered in Redis; written in bulk by a periodic task)
+    # Runs alongside the LLM batch so the Redis round-trip stays off the critical path
     client_ip = request.client.host if request.client else "unknown"
-    usage_entry = DemoUsage(
-        target_brand=demo_req.target_brand,
-        provider=demo_req.provider.value,
-        prompt=demo_req.prompt,
-        ip_address=client_ip,
+    log_usage = asyncio.create_task(
+        record_demo_usage(
+            redis,
+            target_brand=demo_req.target_brand,
+            provider=demo_req.provider.value,
+            prompt=demo_req.prompt,
+            ip_address=client_ip,
+        )
     )
-    session.add(usage_entry)
-    await session.commit()
 
     # 2. Configure simplified batch
     # We use a mocked/simplified config for the runner
@@ -93,17 +95,24 @@ async def run_quick_demo(
         # raw_metrics is dict like {brand: {visibility_score: ..., sentiment: ...}}
         metrics = analysis_result.raw_metrics.get(demo_req.target_brand, {})
 
-        # Extract top citations/snippets (simplified logic)
-        citations = []
-        for iter in batch_result.iterations:
-            if iter.response and iter.response.content:
-                citations.append(iter.response.content[:200] + "...")
+        # Extract top 3 citations/snippets, stopping once we have enough
+        citations = list(
+            islice(
+                (
+                    it.response.content[:200] + "..."
+                    for it in batch_result.iterations
+                    if it.response and it.response.content
+                ),
+                3,
+            )
+        )
 
-        return DemoResponse(
+        # Built from internally computed metrics, so skip re-validation
+        return DemoResponse.model_construct(
             visibility_score=metrics.get("visibility_score", 0.0),
             share_of_voice=metrics.get("share_of_voice", 0.0),
             sentiment_score=metrics.get("sentiment_score", 0.0),
-            citations=citations[:3],  # Return top 3 snippets
+            citations=citations,
             message="This is a simplified demo result. Sign up for full details.",
         )
 
@@ -113,3 +122,6 @@ async def run_quick_demo(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Demo analysis service is currently busy. Please try again later.",
         )
+    finally:
+        # Usage is recorded whether or not the analysis succeeded
+        await log_usage
@@ -9,42 +9,193 @@ service via a RESTful API. The async design enables high-concurrency
 request handling while Celery processes experiments in the background.
 """
 
+import asyncio
 import csv
+import hashlib
 import io
 import json
 import logging
+from collections.abc import AsyncIterator
 from typing import Annotated, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import StreamingResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import Row, update
 
 from backend.app.core.config import get_settings
-from backend.app.core.database import DbSession
+from backend.app.core.database import DbSession, get_session_factory
 from backend.app.core.deps import get_current_active_user
+from backend.app.core.rate_limit import rate_limit_by_user
+from backend.app.core.redis import (
+    RedisClient,
+    cache_delete,
+    cache_get,
+    cache_hget,
+    cache_hset,
+    cache_set,
+    create_redis_client,
+)
 from backend.app.models.experiment import ExperimentStatus
 from backend.app.models.user import User
 from backend.app.repositories.experiment_repo import (
     ExperimentRepository,
+    IterationRepository,
 )
 from backend.app.schemas.experiment import (
+    ITERATION_LIST_ADAPTER,
     BatchRunResult,
     ExperimentDetailResponse,
     ExperimentListResponse,
     ExperimentRequest,
     ExperimentResponse,
+    ExperimentStats,
     ExperimentStatusResponse,
-    IterationDetail,
     VisibilityReport,
 )
+from backend.app.services.cache_keys import (
+    experiment_cache_key,
+    list_cache_key,
+    report_cache_key,
+)
+from backend.app.services.experiment_events import (
+    experiment_channel,
+    stream_experiment_events,
+)
 from backend.app.worker import execute_experiment_task
 
 router = APIRouter(prefix="/experiments", tags=["Experiments"])
 
 logger = logging.getLogger(__name__)
-limiter = Limiter(key_func=get_remote_address)
+settings = get_settings()
+
+# Completed experiments are immutable, so their responses can be cached for long;
+# the worker still invalidates when an experiment (re)completes
+RESULT_CACHE_TTL = 86400  # seconds
+
+
+# Short TTL for polled list pages; creates and completions also invalidate, and
+# running/failed transitions show up within the TTL
+LIST_CACHE_TTL = 10  # seconds
+
+
+def _cached_json_response(payload: str) -> Response:
+    """
+    Serve a cached model_dump_json() payload as-is.
+
+    The cache holds the exact bytes the response model would serialize to, so
+    parsing it back into a model only to re-encode it is pure overhead.
+    """
+    return Response(content=payload, media_type="application/json")
+
+
+# Completed results can still change when a recurring experiment reruns, so
+# clients must revalidate every time; a matching ETag costs a 304, not a rebuild
+COMPLETED_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag(*parts: object) -> str:
+    """Quoted strong ETag over the given values."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value covers `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _not_modified(etag: str) -> Response:
+    """304 for a client already holding the completed result tagged `etag`."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": COMPLETED_CACHE_CONTROL},
+    )
+
+
+def _completed_json_response(payload: str, etag: str, if_none_match: str | None) -> Response:
+    """Serve a completed result's JSON with its ETag, or 304 if the client has it."""
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": COMPLETED_CACHE_CONTROL},
+    )
+
+
+async def _reserve_prompts(session: DbSession, user_id: UUID, prompts: int) -> Row[Any] | None:
+    """
+    Atomically add `prompts` to the user's monthly usage if it fits the quota.
+
+    A single conditional UPDATE, so concurrent creates can't both pass the
+    check; the change commits with the rest of the request.
+
+    Returns:
+        Row with the new prompts_used_this_month and monthly_prompt_quota,
+        or None if the quota would be exceeded.
+    """
+    result = await session.execute(
+        update(User)
+        .where(
+            User.id == user_id,
+            User.prompts_used_this_month + prompts <= User.monthly_prompt_quota,
+        )
+        .values(prompts_used_this_month=User.prompts_used_this_month + prompts)
+        .returning(User.prompts_used_this_month, User.monthly_prompt_quota)
+    )
+    return result.first()
+
+
+async def _refund_prompts(session: DbSession, user_id: UUID, prompts: int) -> None:
+    """Return reserved prompts with a relative UPDATE (no read-modify-write)."""
+    await session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(prompts_used_this_month=User.prompts_used_this_month - prompts)
+    )
+
+
+async def _release_request_session(session: DbSession) -> None:
+    """
+    End the request session's transaction before returning a long-lived stream.
+
+    FastAPI only runs get_db_session's cleanup after a StreamingResponse has
+    finished, so the connection the auth dependency read the user with would
+    otherwise sit idle in transaction for the whole stream. Committing (which
+    also persists an API key's last_used_at) returns it to the pool.
+    """
+    await session.commit()
+
+
+def _publish_experiment_tasks(task_kwargs: list[dict[str, Any]]) -> list[str | None]:
+    """
+    Publish several experiment tasks over one broker producer.
+
+    Blocking; run it in a worker thread. Each publish is attempted
+    independently so one failure doesn't drop the rest of the batch.
+
+    Args:
+        task_kwargs: Task kwargs per experiment, in submission order.
+
+    Returns:
+        list[str | None]: Task ID per experiment, or None if it failed to publish.
+    """
+    task_ids: list[str | None] = []
+    with execute_experiment_task.app.producer_or_acquire() as producer:
+        for kwargs in task_kwargs:
+            try:
+                task = execute_experiment_task.apply_async(kwargs=kwargs, producer=producer)
+                task_ids.append(task.id)
+            except Exception as e:
+                logger.error("Failed to queue experiment %s: %s", kwargs["experiment_id"], e)
+                task_ids.append(None)
+    return task_ids
 
 
 @router.post(
@@ -69,12 +220,12 @@ limiter = Limiter(key_func=get_remote_address)
 
     **Rate Limit**: 10 requests per minute per user
     """,
+    dependencies=[Depends(rate_limit_by_user("create_experiment", 10, 60))],
 )
-@limiter.limit("10/minute")
 async def create_experiment(
     experiment_request: ExperimentRequest,
-    request: Request,  # noqa: ARG001
     session: DbSession,
+    redis: RedisClient,
     current_user: Annotated[User, Depends(get_current_active_user)],
 ) -> ExperimentResponse:
     """
@@ -83,13 +234,16 @@ async def create_experiment(
     Args:
         experiment_request: Experiment configuration.
         session: Database session.
+        redis: Redis client (list cache invalidation).
         current_user: Authenticated user creating the experiment.
 
     Returns:
         ExperimentResponse with experiment ID and job ID.
     """
     logger.info(
-        f"User {current_user.email} creating experiment for brand '{experiment_request.target_brand}'"
+        "User %s creating experiment for brand '%s'",
+        current_user.email,
+        experiment_request.target_brand,
     )
 
     # Require brand profile for non-admin users
@@ -100,7 +254,6 @@ async def create_experiment(
         )
 
     # Validate iterations against max allowed BEFORE quota check
-    settings = get_settings()
     iterations_requested = experiment_request.iterations
     if iterations_requested > settings.max_iterations:
         raise HTTPException(
@@ -112,25 +265,23 @@ async def create_experiment(
     # IMPORTANT: Quota is based on number of prompts (iterations), not experiments
     if not settings.testing_mode and not settings.unlimited_prompts:
         prompts_needed = iterations_requested
-        if (
-            current_user.prompts_used_this_month + prompts_needed
-            > current_user.monthly_prompt_quota
-        ):
+        quota_row = await _reserve_prompts(session, current_user.id, prompts_needed)
+        if quota_row is None:
             remaining = current_user.monthly_prompt_quota - current_user.prompts_used_this_month
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient quota. Need {prompts_needed} prompts, have {remaining} remaining. Used: {current_user.prompts_used_this_month}/{current_user.monthly_prompt_quota}",
             )
 
-        # Increment usage counter by number of iterations
-        current_user.prompts_used_this_month += prompts_needed
-        await session.commit()
-        await session.refresh(current_user)
         logger.info(
-            f"User {current_user.email} quota: {current_user.prompts_used_this_month}/{current_user.monthly_prompt_quota} (used {prompts_needed} prompts)"
+            "User %s quota: %d/%d (used %d prompts)",
+            current_user.email,
+            quota_row.prompts_used_this_month,
+            quota_row.monthly_prompt_quota,
+            prompts_needed,
         )
     else:
-        logger.info(f"Testing mode enabled - skipping quota check for user {current_user.email}")
+        logger.info("Testing mode enabled - skipping quota check for user %s", current_user.email)
 
     # Build configuration dictionary
     config: dict[str, Any] = {
@@ -146,32 +297,51 @@ async def create_experiment(
     # Use user's brand profile if set, otherwise fall back to request body
     effective_target_brand = current_user.brand_name or experiment_request.target_brand
 
-    # Create experiment in database
+    # Insert the experiment and publish its task concurrently. The ID is generated
+    # up front so the task can go out before the INSERT returns; the worker retries
+    # briefly if it picks the task up before this request's transaction commits.
     exp_repo = ExperimentRepository(session)
-    experiment = await exp_repo.create_experiment(
-        user_id=current_user.id,
-        prompt=experiment_request.prompt,
-        target_brand=effective_target_brand,
-        config=config,
-        competitor_brands=experiment_request.competitor_brands,
-        domain_whitelist=experiment_request.domain_whitelist,
+    experiment_id = uuid4()
+    experiment, task = await asyncio.gather(
+        exp_repo.create_experiment(
+            user_id=current_user.id,
+            prompt=experiment_request.prompt,
+            target_brand=effective_target_brand,
+            config=config,
+            competitor_brands=experiment_request.competitor_brands,
+            domain_whitelist=experiment_request.domain_whitelist,
+            experiment_id=experiment_id,
+        ),
+        # The broker publish is blocking I/O; keep it off the event loop
+        asyncio.to_thread(
+            execute_experiment_task.apply_async,
+            kwargs={
+                "experiment_id": str(experiment_id),
+                "provider": experiment_request.provider.value,
+                "model": experiment_request.model,
+            },
+        ),
+        return_exceptions=True,
     )
 
-    # Trigger Celery task
-    try:
-        task = execute_experiment_task.delay(
-            experiment_id=str(experiment.id),
-            provider=experiment_request.provider.value,
-            model=experiment_request.model,
-        )
-    except Exception as e:
-        logger.error(f"Failed to queue experiment task: {e}")
+    if isinstance(experiment, BaseException):
+        if not isinstance(task, BaseException):
+            # The row will never commit; don't leave the worker retrying for it
+            try:
+                await asyncio.to_thread(task.revoke)
+            except Exception as e:
+                logger.warning("Failed to revoke task %s: %s", task.id, e)
+        raise experiment
+
+    if isinstance(task, BaseException):
+        logger.error("Failed to queue experiment task: %s", task)
         # Refund quota
         if not settings.testing_mode and not settings.unlimited_prompts:
-            current_user.prompts_used_this_month -= iterations_requested
-            await session.commit()
+            await _refund_prompts(session, current_user.id, iterations_requested)
             logger.info(
-                f"Refunded {iterations_requested} prompts to user {current_user.email} due to queue failure"
+                "Refunded %d prompts to user %s due to queue failure",
+                iterations_requested,
+                current_user.email,
             )
 
         # Mark as failed
@@ -180,12 +350,18 @@ async def create_experiment(
             ExperimentStatus.FAILED,
             error_message="System overloaded, please try again later.",
         )
+        # Commit explicitly: raising rolls back the request session
+        await session.commit()
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Failed to queue experiment. Quota has been refunded.",
         )
 
-    logger.info(f"Experiment {experiment.id} created, task {task.id} queued")
+    logger.info("Experiment %s created, task %s queued", experiment.id, task.id)
+    # Commit before invalidating: get_db_session only commits after the response
+    # is sent, and a list GET in between would re-cache the page without this row
+    await session.commit()
+    await cache_delete(redis, list_cache_key(current_user.id))
 
     return ExperimentResponse(
         experiment_id=experiment.id,
@@ -212,25 +388,34 @@ async def create_experiment(
 async def get_experiment(
     experiment_id: UUID,
     session: DbSession,
+    redis: RedisClient,
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> ExperimentStatusResponse:
+) -> ExperimentStatusResponse | Response:
     """
     Get experiment status and results.
 
     Args:
         experiment_id: The experiment UUID.
         session: Database session.
+        redis: Redis client for the completed-result cache.
         current_user: Authenticated user requesting the experiment.
 
     Returns:
-        ExperimentStatusResponse with status and metrics.
+        ExperimentStatusResponse with status and metrics, or the cached JSON as-is on a hit.
 
     Raises:
         HTTPException: If experiment not found.
     """
+    cache_key = experiment_cache_key(current_user.id, experiment_id)
+    cached = await cache_get(redis, cache_key)
+    if cached:
+        return _cached_json_response(cached)
+
     exp_repo = ExperimentRepository(session)
-    # Verify ownership before fetching results
-    experiment = await exp_repo.get_experiment_by_user(experiment_id, current_user.id)
+    # Ownership check and batch run summaries in one lookup (iterations aren't needed)
+    experiment = await exp_repo.get_experiment_with_batch_runs_for_user(
+        experiment_id, current_user.id
+    )
 
     if not experiment:
         raise HTTPException(
@@ -238,43 +423,9 @@ async def get_experiment(
             detail="Experiment not found or access denied",
         )
 
-    # Now load full results (which might already be loaded by get_experiment_by_user if the repo method supported it,
-    # but based on line 264 we need to verify first then load full if separate).
-    # actually wait, get_experiment_with_results loads relationships.
-    # Let's check if we can just stick to get_experiment_by_user check then re-fetch or if we should modify the repo.
-    # For minimally invasive fix that is secure:
-    # 1. Check ownership.
-    # 2. If valid, fetch with results.
-
-    experiment_with_results = await exp_repo.get_experiment_with_results(experiment_id)
-    if not experiment_with_results:
-        # Should not happen if first check passed, but safe guard
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Experiment found but could not load results",
-        )
-    experiment = experiment_with_results
-
-    # Build batch run results
-    batch_runs = [
-        BatchRunResult(
-            batch_run_id=br.id,
-            provider=br.provider,
-            model=br.model,
-            status=br.status,
-            started_at=br.started_at,
-            completed_at=br.completed_at,
-            duration_ms=br.duration_ms,
-            total_iterations=br.total_iterations,
-            successful_iterations=br.successful_iterations,
-            failed_iterations=br.failed_iterations,
-            total_tokens=br.total_tokens,
-            metrics=br.metrics,
-        )
-        for br in experiment.batch_runs
-    ]
+    batch_runs = [BatchRunResult.from_orm_row(br) for br in experiment.batch_runs]
 
-    return ExperimentStatusResponse(
+    response = ExperimentStatusResponse.model_construct(
         experiment_id=experiment.id,
         prompt=experiment.prompt,
         target_brand=experiment.target_brand,
@@ -286,6 +437,12 @@ async def get_experiment(
         batch_runs=batch_runs,
     )
 
+    # Only completed results are final; in-flight status must stay live for polling
+    if experiment.status == ExperimentStatus.COMPLETED.value:
+        await cache_set(redis, cache_key, response.model_dump_json(), RESULT_CACHE_TTL)
+
+    return response
+
 
 @router.get(
     "/{experiment_id}/detail",
@@ -301,7 +458,13 @@ async def get_experiment_detail(
     experiment_id: UUID,
     session: DbSession,
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> ExperimentDetailResponse:
+    iteration_limit: Annotated[
+        int | None,
+        Query(ge=1, le=500, description="Page size for iterations (omit for all)"),
+    ] = None,
+    iteration_offset: Annotated[int, Query(ge=0, description="Iterations to skip")] = 0,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ExperimentDetailResponse | Response:
     """
     Get detailed experiment results with iterations.
 
@@ -309,17 +472,41 @@ async def get_experiment_detail(
         experiment_id: The experiment UUID.
         session: Database session.
         current_user: Authenticated user requesting the experiment.
+        iteration_limit: If set, return only this many iterations, read as
+            one page from the database instead of loading them all.
+        iteration_offset: Iterations to skip when paging.
+        if_none_match: ETag from a previous response to this same query.
 
     Returns:
-        ExperimentDetailResponse with iteration details.
+        ExperimentDetailResponse with iteration details. Completed
+        experiments are sent with an ETag, and a matching If-None-Match gets
+        304 Not Modified.
 
     Raises:
         HTTPException: If experiment not found or access denied.
     """
     exp_repo = ExperimentRepository(session)
 
-    # Verify ownership before fetching results
-    experiment = await exp_repo.get_experiment_by_user(experiment_id, current_user.id)
+    # Revalidation: answer from the status columns alone, before loading any runs
+    if if_none_match:
+        current = await exp_repo.get_status_for_user(experiment_id, current_user.id)
+        if current is not None and current.status == ExperimentStatus.COMPLETED.value:
+            etag = _etag(
+                experiment_id, current.updated_at.isoformat(), iteration_limit, iteration_offset
+            )
+            if _etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+
+    if iteration_limit is not None:
+        # Ownership check and run summaries; iterations come as a page below
+        experiment = await exp_repo.get_experiment_with_batch_runs_for_user(
+            experiment_id, current_user.id
+        )
+    else:
+        # Ownership check and full results with iterations in one lookup
+        experiment = await exp_repo.get_experiment_with_results_for_user(
+            experiment_id, current_user.id
+        )
 
     if not experiment:
         raise HTTPException(
@@ -327,46 +514,20 @@ async def get_experiment_detail(
             detail="Experiment not found or access denied",
         )
 
-    # Now load full results with iterations
-    experiment = await exp_repo.get_experiment_with_results(experiment_id)
-
-    # Build batch run results
-    batch_runs = []
-    all_iterations = []
-
-    for br in experiment.batch_runs:
-        batch_runs.append(
-            BatchRunResult(
-                batch_run_id=br.id,
-                provider=br.provider,
-                model=br.model,
-                status=br.status,
-                started_at=br.started_at,
-                completed_at=br.completed_at,
-                duration_ms=br.duration_ms,
-                total_iterations=br.total_iterations,
-                successful_iterations=br.successful_iterations,
-                failed_iterations=br.failed_iterations,
-                total_tokens=br.total_tokens,
-                metrics=br.metrics,
-            )
+    batch_runs = [BatchRunResult.from_orm_row(br) for br in experiment.batch_runs]
+
+    if iteration_limit is not None:
+        # A paged request reads just its page instead of the loaded relationship
+        iter_repo = IterationRepository(session)
+        iterations: list[Any] = await iter_repo.list_iterations_for_experiment(
+            experiment_id, iteration_limit, iteration_offset
         )
+    else:
+        iterations = [it for br in experiment.batch_runs for it in br.iterations]
 
-        # Add iterations
-        for iteration in br.iterations:
-            all_iterations.append(
-                IterationDetail(
-                    iteration_index=iteration.iteration_index,
-                    is_success=iteration.is_success,
-                    status=iteration.status,
-                    latency_ms=iteration.latency_ms,
-                    raw_response=iteration.raw_response,
-                    error_message=iteration.error_message,
-                    extracted_brands=iteration.extracted_brands,
-                )
-            )
+    all_iterations = ITERATION_LIST_ADAPTER.validate_python(iterations, from_attributes=True)
 
-    return ExperimentDetailResponse(
+    detail = ExperimentDetailResponse.model_construct(
         experiment_id=experiment.id,
         prompt=experiment.prompt,
         target_brand=experiment.target_brand,
@@ -379,6 +540,195 @@ async def get_experiment_detail(
         iterations=all_iterations,
     )
 
+    if experiment.status != ExperimentStatus.COMPLETED.value:
+        return detail
+
+    etag = _etag(
+        experiment.id, experiment.updated_at.isoformat(), iteration_limit, iteration_offset
+    )
+    return _completed_json_response(detail.model_dump_json(), etag, if_none_match)
+
+
+@router.get(
+    "/{experiment_id}/detail/stream",
+    summary="Stream experiment iterations as NDJSON",
+    description="""
+    Stream every iteration of an experiment as newline-delimited JSON, one
+    object per line.
+
+    Rows are read from the database through a server-side cursor and written
+    as they arrive, so memory stays bounded for experiments with thousands of
+    iterations. Batch run summaries are available from GET /experiments/{id}.
+    """,
+)
+async def stream_experiment_detail(
+    experiment_id: UUID,
+    session: DbSession,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> StreamingResponse:
+    """
+    Stream experiment iterations as NDJSON.
+
+    Args:
+        experiment_id: The experiment UUID.
+        session: Request session (authentication only; released before streaming).
+        current_user: Authenticated user requesting the experiment.
+
+    Returns:
+        StreamingResponse of application/x-ndjson lines.
+
+    Raises:
+        HTTPException: If experiment not found or access denied.
+    """
+    await _release_request_session(session)
+
+    # Short-lived session: only the stream below holds a connection while the
+    # body is sent
+    async with get_session_factory()() as check_session:
+        owned = await ExperimentRepository(check_session).user_owns_experiment(
+            experiment_id, current_user.id
+        )
+    if not owned:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Experiment not found or access denied",
+        )
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        # The server-side cursor needs a session that lives as long as the stream
+        async with get_session_factory()() as stream_session:
+            iter_repo = IterationRepository(stream_session)
+            async for rows in iter_repo.stream_iteration_batches(experiment_id):
+                # Rows already have the IterationStreamItem fields: encode them
+                # directly in pydantic-core (no model per row) and send each
+                # cursor fetch as one chunk rather than one write per line
+                yield b"".join(to_json(row._asdict()) + b"\n" for row in rows)
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/{experiment_id}/stats",
+    response_model=ExperimentStats,
+    summary="Get iteration summary statistics",
+    description="""
+    Success counts, latency percentiles and token totals across all of an
+    experiment's iterations.
+
+    Computed by a single aggregate query, so it stays cheap for experiments
+    with thousands of iterations. Use GET /experiments/{id}/detail when the
+    individual iterations are needed.
+    """,
+)
+async def get_experiment_stats(
+    experiment_id: UUID,
+    session: DbSession,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> ExperimentStats:
+    """
+    Get iteration summary statistics for an experiment.
+
+    Args:
+        experiment_id: The experiment UUID.
+        session: Database session.
+        current_user: Authenticated user requesting the stats.
+
+    Returns:
+        ExperimentStats aggregated over every batch run.
+
+    Raises:
+        HTTPException: If experiment not found or access denied.
+    """
+    exp_repo = ExperimentRepository(session)
+    if not await exp_repo.user_owns_experiment(experiment_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Experiment not found or access denied",
+        )
+
+    row = await IterationRepository(session).get_iteration_stats(experiment_id)
+
+    # Every value is a typed SQL aggregate, so skip re-validation
+    return ExperimentStats.model_construct(
+        experiment_id=experiment_id,
+        total_iterations=row.total_iterations,
+        successful_iterations=row.successful_iterations,
+        failed_iterations=row.total_iterations - row.successful_iterations,
+        success_rate=(
+            row.successful_iterations / row.total_iterations if row.total_iterations else 0.0
+        ),
+        avg_latency_ms=row.avg_latency_ms,
+        p50_latency_ms=row.p50_latency_ms,
+        p95_latency_ms=row.p95_latency_ms,
+        prompt_tokens=row.prompt_tokens,
+        completion_tokens=row.completion_tokens,
+        total_tokens=row.total_tokens,
+    )
+
+
+@router.get(
+    "/{experiment_id}/events",
+    summary="Subscribe to experiment status changes",
+    description="""
+    Server-Sent Events stream of an experiment's status transitions.
+
+    The first event carries the current status; the stream closes after the
+    experiment completes or fails. Use this instead of polling
+    GET /experiments/{id}, which remains available for legacy clients.
+    """,
+)
+async def stream_experiment_events_endpoint(
+    experiment_id: UUID,
+    session: DbSession,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> StreamingResponse:
+    """
+    Stream experiment status events as SSE.
+
+    Args:
+        experiment_id: The experiment UUID.
+        session: Request session (authentication only; released before streaming).
+        current_user: Authenticated user requesting the experiment.
+
+    Returns:
+        StreamingResponse of text/event-stream frames.
+
+    Raises:
+        HTTPException: If experiment not found or access denied.
+    """
+    await _release_request_session(session)
+
+    # A dedicated connection per stream: subscribers hold their connection for
+    # the stream's lifetime and would otherwise drain the shared pool
+    redis = create_redis_client(settings)
+    pubsub = redis.pubsub()
+    try:
+        # Subscribe before reading the status so no transition is missed
+        await pubsub.subscribe(experiment_channel(experiment_id))
+        # Short-lived session: the stream itself holds no database connection
+        async with get_session_factory()() as status_session:
+            row = await ExperimentRepository(status_session).get_status_for_user(
+                experiment_id, current_user.id
+            )
+    except Exception:
+        await pubsub.aclose()
+        await redis.aclose()
+        raise
+
+    if row is None:
+        await pubsub.aclose()
+        await redis.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Experiment not found or access denied",
+        )
+
+    return StreamingResponse(
+        stream_experiment_events(redis, pubsub, experiment_id, row.status, row.error_message),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @router.get(
     "/{experiment_id}/report",
@@ -396,26 +746,39 @@ async def get_experiment_detail(
 async def get_visibility_report(
     experiment_id: UUID,
     session: DbSession,
+    redis: RedisClient,
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> VisibilityReport:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """
     Get visibility report.
 
     Args:
         experiment_id: The experiment UUID.
         session: Database session.
+        redis: Redis client for the completed-result cache.
         current_user: Authenticated user requesting the report.
+        if_none_match: ETag from a previous response for this report.
 
     Returns:
-        VisibilityReport with key metrics.
+        The VisibilityReport JSON with an ETag, or 304 Not Modified if
+        If-None-Match matches.
 
     Raises:
         HTTPException: If experiment not found, access denied, or not complete.
     """
+    cache_key = report_cache_key(current_user.id, experiment_id)
+    cached = await cache_get(redis, cache_key)
+    if cached:
+        # Content-addressed, so a cache hit never touches the database
+        return _completed_json_response(cached, _etag(cached), if_none_match)
+
     exp_repo = ExperimentRepository(session)
 
-    # Verify ownership before fetching results
-    experiment = await exp_repo.get_experiment_by_user(experiment_id, current_user.id)
+    # Ownership check and batch run summaries in one lookup (iterations aren't needed)
+    experiment = await exp_repo.get_experiment_with_batch_runs_for_user(
+        experiment_id, current_user.id
+    )
 
     if not experiment:
         raise HTTPException(
@@ -423,9 +786,6 @@ async def get_visibility_report(
             detail="Experiment not found or access denied",
         )
 
-    # Load full results
-    experiment = await exp_repo.get_experiment_with_results(experiment_id)
-
     if experiment.status != ExperimentStatus.COMPLETED.value:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -448,14 +808,10 @@ async def get_visibility_report(
     hallucination = metrics.get("hallucination")
     sov = metrics.get("share_of_voice", [])
 
-    # Find target brand's share of voice
-    target_sov = 0.0
-    for item in sov:
-        if item.get("brand") == experiment.target_brand:
-            target_sov = item.get("share", 0.0)
-            break
+    # Find target brand's share of voice (keyed by the worker; older runs backfilled)
+    target_sov = metrics.get("share_of_voice_by_brand", {}).get(experiment.target_brand, 0.0)
 
-    return VisibilityReport(
+    report = VisibilityReport(
         experiment_id=experiment.id,
         prompt=experiment.prompt,
         target_brand=experiment.target_brand,
@@ -475,6 +831,11 @@ async def get_visibility_report(
         completed_at=batch_run.completed_at,
     )
 
+    payload = report.model_dump_json()
+    await cache_set(redis, cache_key, payload, RESULT_CACHE_TTL)
+
+    return _completed_json_response(payload, _etag(payload), if_none_match)
+
 
 @router.get(
     "",
@@ -484,76 +845,69 @@ async def get_visibility_report(
 )
 async def list_experiments(
     session: DbSession,
+    redis: RedisClient,
     current_user: Annotated[User, Depends(get_current_active_user)],
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    status_filter: str | None = Query(
+    status_filter: ExperimentStatus | None = Query(
         default=None,
         alias="status",
-        description="Filter by status (pending, running, completed, failed)",
+        description="Filter by status (pending, running, completed, failed, cancelled)",
     ),
-) -> ExperimentListResponse:
+) -> ExperimentListResponse | Response:
     """
     List experiments with pagination.
 
     Args:
         session: Database session.
+        redis: Redis client for the short-lived page cache.
         current_user: Authenticated user.
         limit: Maximum results per page.
         offset: Number of results to skip.
-        status_filter: Optional status filter.
+        status_filter: Optional status filter; FastAPI rejects unknown values with 422.
 
     Returns:
-        ExperimentListResponse with paginated results.
+        ExperimentListResponse with paginated results, or the cached JSON as-is on a hit.
     """
-    exp_repo = ExperimentRepository(session)
+    cache_key = list_cache_key(current_user.id)
+    cache_field = f"{status_filter.value if status_filter else ''}:{limit}:{offset}"
+    cached = await cache_hget(redis, cache_key, cache_field)
+    if cached:
+        return _cached_json_response(cached)
 
-    # Parse status filter
-    status_enum = None
-    if status_filter:
-        try:
-            status_enum = ExperimentStatus(status_filter)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status_filter}",
-            )
+    exp_repo = ExperimentRepository(session)
 
-    experiments = await exp_repo.list_experiments(
+    rows, total_count = await exp_repo.list_experiment_summaries(
         user_id=current_user.id,
         limit=limit,
         offset=offset,
-        status=status_enum,
-    )
-
-    # Get total count for pagination
-    total_count = await exp_repo.count_experiments(
-        user_id=current_user.id,
-        status=status_enum,
+        status=status_filter,
     )
 
-    # Convert to response models
+    # Rows come straight from typed columns, so skip per-row re-validation
     items = [
-        ExperimentStatusResponse(
-            experiment_id=exp.id,
-            prompt=exp.prompt,
-            target_brand=exp.target_brand,
-            competitor_brands=exp.competitor_brands,
-            status=exp.status,
-            error_message=exp.error_message,
-            created_at=exp.created_at,
-            updated_at=exp.updated_at,
+        ExperimentStatusResponse.model_construct(
+            experiment_id=row.id,
+            prompt=row.prompt,
+            target_brand=row.target_brand,
+            competitor_brands=row.competitor_brands,
+            status=row.status,
+            error_message=row.error_message,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
             batch_runs=[],  # Don't include batch runs in list view
         )
-        for exp in experiments
+        for row in rows
     ]
 
-    return ExperimentListResponse(
+    response = ExperimentListResponse.model_construct(
         experiments=items,
-        total=total_count,  # Accurate total count from database
+        total=total_count,
         limit=limit,
         offset=offset,
     )
+    await cache_hset(redis, cache_key, cache_field, response.model_dump_json(), LIST_CACHE_TTL)
+    return response
 
 
 @router.get(
@@ -591,17 +945,14 @@ async def export_experiment(
     """
     exp_repo = ExperimentRepository(session)
 
-    # Verify ownership
-    experiment = await exp_repo.get_experiment_by_user(experiment_id, current_user.id)
+    # Ownership check and full results with iterations in one lookup
+    experiment = await exp_repo.get_experiment_with_results_for_user(experiment_id, current_user.id)
     if not experiment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Experiment not found or access denied",
         )
 
-    # Load full results with iterations
-    experiment = await exp_repo.get_experiment_with_results(experiment_id)
-
     filename_base = f"experiment_{experiment_id}"
 
     if format == "json":
@@ -717,12 +1068,12 @@ async def export_experiment(
     Performs a single quota check for the total iterations needed,
     then queues all experiments simultaneously.
     """,
+    dependencies=[Depends(rate_limit_by_user("create_experiments_batch", 3, 60))],
 )
-@limiter.limit("3/minute")
 async def create_experiments_batch(
     experiment_requests: list[ExperimentRequest],
-    request: Request,  # noqa: ARG001
     session: DbSession,
+    redis: RedisClient,
     current_user: Annotated[User, Depends(get_current_active_user)],
 ) -> list[ExperimentResponse]:
     """
@@ -730,8 +1081,8 @@ async def create_experiments_batch(
 
     Args:
         experiment_requests: List of experiment configurations (max 10).
-        request: FastAPI request object (for rate limiting).
         session: Database session.
+        redis: Redis client (list cache invalidation).
         current_user: Authenticated user creating the experiments.
 
     Returns:
@@ -752,8 +1103,6 @@ async def create_experiments_batch(
             detail="Maximum 10 experiments per batch request",
         )
 
-    settings = get_settings()
-
     # Validate all iterations upfront
     total_iterations = sum(req.iterations for req in experiment_requests)
     for req in experiment_requests:
@@ -770,28 +1119,25 @@ async def create_experiments_batch(
             detail="Please complete your brand profile before creating experiments.",
         )
 
-    # Single quota check for entire batch
-    if not settings.testing_mode and not settings.unlimited_prompts:
-        if (
-            current_user.prompts_used_this_month + total_iterations
-            > current_user.monthly_prompt_quota
-        ):
-            remaining = current_user.monthly_prompt_quota - current_user.prompts_used_this_month
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=(
-                    f"Insufficient quota for batch. Need {total_iterations} prompts, "
-                    f"have {remaining} remaining."
-                ),
-            )
-        current_user.prompts_used_this_month += total_iterations
-        await session.commit()
-        await session.refresh(current_user)
+    # Single atomic quota reservation for the entire batch
+    if (
+        not settings.testing_mode
+        and not settings.unlimited_prompts
+        and await _reserve_prompts(session, current_user.id, total_iterations) is None
+    ):
+        remaining = current_user.monthly_prompt_quota - current_user.prompts_used_this_month
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=(
+                f"Insufficient quota for batch. Need {total_iterations} prompts, "
+                f"have {remaining} remaining."
+            ),
+        )
 
     exp_repo = ExperimentRepository(session)
-    responses: list[ExperimentResponse] = []
-    queued_iterations = 0
 
+    # One INSERT flush for the whole batch
+    specs: list[dict[str, Any]] = []
     for exp_request in experiment_requests:
         config: dict[str, Any] = {
             "iterations": exp_request.iterations,
@@ -801,34 +1147,49 @@ async def create_experiments_batch(
         if exp_request.model:
             config["model"] = exp_request.model
 
-        effective_target_brand = current_user.brand_name or exp_request.target_brand
-
-        experiment = await exp_repo.create_experiment(
-            user_id=current_user.id,
-            prompt=exp_request.prompt,
-            target_brand=effective_target_brand,
-            config=config,
-            competitor_brands=exp_request.competitor_brands,
-            domain_whitelist=exp_request.domain_whitelist,
+        specs.append(
+            {
+                "prompt": exp_request.prompt,
+                "target_brand": current_user.brand_name or exp_request.target_brand,
+                "config": config,
+                "competitor_brands": exp_request.competitor_brands,
+                "domain_whitelist": exp_request.domain_whitelist,
+            }
         )
+    experiments = await exp_repo.create_experiments(current_user.id, specs)
 
-        try:
-            task = execute_experiment_task.delay(
-                experiment_id=str(experiment.id),
-                provider=exp_request.provider.value,
-                model=exp_request.model,
-            )
+    # Publish every task over a single broker producer, in one worker thread
+    task_kwargs = [
+        {
+            "experiment_id": str(experiment.id),
+            "provider": exp_request.provider.value,
+            "model": exp_request.model,
+        }
+        for experiment, exp_request in zip(experiments, experiment_requests, strict=True)
+    ]
+    try:
+        task_ids = await asyncio.to_thread(_publish_experiment_tasks, task_kwargs)
+    except Exception as e:
+        # Couldn't even acquire a producer; nothing was queued
+        logger.error("Failed to queue experiment batch: %s", e)
+        task_ids = [None] * len(experiments)
+
+    responses: list[ExperimentResponse] = []
+    queued_iterations = 0
+    for experiment, exp_request, task_id in zip(
+        experiments, experiment_requests, task_ids, strict=True
+    ):
+        if task_id is not None:
             responses.append(
                 ExperimentResponse(
                     experiment_id=experiment.id,
-                    job_id=task.id,
+                    job_id=task_id,
                     status="pending",
                     message=f"Experiment queued with {exp_request.iterations} iterations",
                 )
             )
             queued_iterations += exp_request.iterations
-        except Exception as e:
-            logger.error(f"Failed to queue batch experiment {experiment.id}: {e}")
+        else:
             await exp_repo.update_experiment_status(
                 experiment.id,
                 ExperimentStatus.FAILED,
@@ -846,10 +1207,16 @@ async def create_experiments_batch(
     # Refund iterations for any that failed to queue
     failed_iterations = total_iterations - queued_iterations
     if failed_iterations > 0 and not settings.testing_mode and not settings.unlimited_prompts:
-        current_user.prompts_used_this_month -= failed_iterations
-        await session.commit()
+        await _refund_prompts(session, current_user.id, failed_iterations)
         logger.info(
-            f"Refunded {failed_iterations} iterations to {current_user.email} after batch failures"
+            "Refunded %d iterations to %s after batch failures",
+            failed_iterations,
+            current_user.email,
         )
 
+    # Commit before invalidating so a concurrent list GET can't re-cache the
+    # pre-batch page (get_db_session would only commit after the response)
+    await session.commit()
+    await cache_delete(redis, list_cache_key(current_user.id))
+
     return responses
@@ -1,50 +1,54 @@
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, status
-from redis.asyncio import Redis
 from sqlalchemy import text
 
-from backend.app.core.config import get_settings
 from backend.app.core.database import DbSession
+from backend.app.core.redis import RedisClient
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/health", tags=["Health"])
 
 
+async def _check_db(session: DbSession) -> str:
+    """Probe the database; returns "healthy" or "unhealthy"."""
+    try:
+        await session.execute(text("SELECT 1"))
+        return "healthy"
+    except Exception as e:
+        logger.error(f"Health check failed for Database: {e}")
+        return "unhealthy"
+
+
+async def _check_redis(redis: RedisClient) -> str:
+    """Probe Redis on the shared pool (no new connection per probe)."""
+    try:
+        await redis.ping()
+        return "healthy"
+    except Exception as e:
+        logger.error(f"Health check failed for Redis: {e}")
+        return "unhealthy"
+
+
 @router.get("/detailed", summary="Detailed system health status")
-async def detailed_health_check(session: DbSession):
+async def detailed_health_check(session: DbSession, redis: RedisClient):
     """
     Check connectivity of critical infrastructure components:
     - Database (PostgreSQL)
     - Cache/Broker (Redis)
     """
-    settings = get_settings()
+    # Both probes are pure network round trips, so overlap them
+    db_status, redis_status = await asyncio.gather(_check_db(session), _check_redis(redis))
+
     status_report = {
         "status": "healthy",
         "components": {
-            "database": "unknown",
-            "redis": "unknown",
+            "database": db_status,
+            "redis": redis_status,
         },
     }
-
-    # 1. Check Database
-    try:
-        await session.execute(text("SELECT 1"))
-        status_report["components"]["database"] = "healthy"
-    except Exception as e:
-        logger.error(f"Health check failed for Database: {e}")
-        status_report["components"]["database"] = "unhealthy"
-        status_report["status"] = "degraded"
-
-    # 2. Check Redis
-    try:
-        redis = Redis.from_url(str(settings.redis_url), decode_responses=True)
-        await redis.ping()
-        await redis.close()
-        status_report["components"]["redis"] = "healthy"
-    except Exception as e:
-        logger.error(f"Health check failed for Redis: {e}")
-        status_report["components"]["redis"] = "unhealthy"
+    if "unhealthy" in (db_status, redis_status):
         status_report["status"] = "degraded"
 
     if status_report["status"] != "healthy":
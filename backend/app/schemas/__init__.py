@@ -17,6 +17,7 @@ from backend.app.schemas.experiment import (
     ExperimentListResponse,
     ExperimentRequest,
     ExperimentResponse,
+    ExperimentStats,
     ExperimentStatusResponse,
     IterationDetail,
     VisibilityReport,
@@ -53,6 +54,7 @@ __all__ = [
     "ExperimentListResponse",
     "ExperimentRequest",
     "ExperimentResponse",
+    "ExperimentStats",
     "ExperimentStatusResponse",
     "IterationDetail",
     "IterationResult",
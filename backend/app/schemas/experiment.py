@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from backend.app.schemas.llm import LLMProvider
 
@@ -84,6 +84,9 @@ class ExperimentRequest(BaseModel):
         description="Optional system prompt for all iterations",
     )
 
+    # Trim every string field once, before the length constraints are checked
+    model_config = {"str_strip_whitespace": True}
+
 
 class ExperimentResponse(BaseModel):
     """
@@ -118,6 +121,30 @@ class BatchRunResult(BaseModel):
     total_tokens: int = Field(description="Total tokens consumed")
     metrics: dict[str, Any] | None = Field(description="Computed analytics")
 
+    @classmethod
+    def from_orm_row(cls, row: Any) -> "BatchRunResult":
+        """
+        Build from a BatchRun entity or row.
+
+        The id -> batch_run_id rename rules out from_attributes validation, and
+        an experiment only has a handful of runs, so the typed columns are
+        used as-is. Only for trusted database data.
+        """
+        return cls.model_construct(
+            batch_run_id=row.id,
+            provider=row.provider,
+            model=row.model,
+            status=row.status,
+            started_at=row.started_at,
+            completed_at=row.completed_at,
+            duration_ms=row.duration_ms,
+            total_iterations=row.total_iterations,
+            successful_iterations=row.successful_iterations,
+            failed_iterations=row.failed_iterations,
+            total_tokens=row.total_tokens,
+            metrics=row.metrics,
+        )
+
 
 class IterationDetail(BaseModel):
     """
@@ -134,6 +161,46 @@ class IterationDetail(BaseModel):
     error_message: str | None = Field(description="Error if failed")
     extracted_brands: list[str] | None = Field(description="Brands mentioned")
 
+    # Field names match the Iteration columns, so entities and rows validate directly
+    model_config = {"from_attributes": True}
+
+
+# Iterations are the bulk of a detail response: validating the whole list of
+# entities/rows in one pydantic-core call beats building each model in Python
+ITERATION_LIST_ADAPTER: TypeAdapter[list[IterationDetail]] = TypeAdapter(list[IterationDetail])
+
+
+class IterationStreamItem(IterationDetail):
+    """
+    One NDJSON line of a streamed experiment detail.
+
+    Carries its parent batch run so clients can group iterations.
+    """
+
+    batch_run_id: UUID = Field(description="Parent batch run identifier")
+
+
+class ExperimentStats(BaseModel):
+    """
+    Iteration summary statistics for an experiment, aggregated in SQL.
+
+    Covers every batch run of the experiment.
+    """
+
+    experiment_id: UUID = Field(description="Experiment identifier")
+    total_iterations: int = Field(description="Iterations recorded")
+    successful_iterations: int = Field(description="Successful iterations")
+    failed_iterations: int = Field(description="Failed iterations")
+    success_rate: float = Field(description="Successful share of iterations (0-1)")
+    avg_latency_ms: float | None = Field(description="Mean latency of successful iterations")
+    p50_latency_ms: float | None = Field(description="Median latency of successful iterations")
+    p95_latency_ms: float | None = Field(
+        description="95th percentile latency of successful iterations"
+    )
+    prompt_tokens: int = Field(description="Prompt tokens consumed")
+    completion_tokens: int = Field(description="Completion tokens consumed")
+    total_tokens: int = Field(description="Total tokens consumed")
+
 
 class ExperimentStatusResponse(BaseModel):
     """
@@ -178,7 +245,7 @@ class ExperimentListResponse(BaseModel):
     """
 
     experiments: list[ExperimentStatusResponse] = Field(description="List of experiments")
-    total: int = Field(description="Total count")
+    total: int = Field(description="Total experiments matching the filter, across all pages")
     limit: int = Field(description="Page size")
     offset: int = Field(description="Page offset")
 
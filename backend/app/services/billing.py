@@ -9,6 +9,7 @@ This module handles all Stripe-related operations including:
 """
 
 import stripe
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.config import get_settings
@@ -29,6 +30,11 @@ PRICE_IDS = {
     PricingTier.ENTERPRISE_PLUS: getattr(settings, "stripe_price_id_enterprise_plus", None),
 }
 
+# Reverse lookup for Stripe objects that carry a price ID rather than our tier
+TIER_BY_PRICE_ID: dict[str, PricingTier] = {
+    price_id: tier for tier, price_id in PRICE_IDS.items() if price_id
+}
+
 # Quota mapping (monitored prompts per month, each runs 10 iterations daily)
 TIER_QUOTAS = {
     PricingTier.FREE: 3,
@@ -39,6 +45,19 @@ TIER_QUOTAS = {
 }
 
 
+def tier_from_price_id(price_id: str) -> PricingTier | None:
+    """
+    Resolve the pricing tier sold under a Stripe price ID.
+
+    Args:
+        price_id: Stripe price ID.
+
+    Returns:
+        PricingTier | None: Matching tier, or None for an unknown price.
+    """
+    return TIER_BY_PRICE_ID.get(price_id)
+
+
 async def create_stripe_customer(user: User) -> str:
     """
     Create a Stripe customer for a user.
@@ -152,47 +171,99 @@ async def cancel_subscription(subscription_id: str) -> stripe.Subscription:
 
 
 async def upgrade_user_tier(
-    user: User,
+    user_id: str,
     new_tier: PricingTier,
     db: AsyncSession,
-) -> None:
+    subscription_id: str | None = None,
+) -> bool:
     """
     Upgrade user to a new pricing tier.
 
-    Updates quota and resets usage counter.
+    Updates quota, resets usage counter and records the subscription in a
+    single UPDATE statement.
 
     Args:
-        user: User to upgrade.
+        user_id: UUID of the user to upgrade.
         new_tier: New pricing tier.
         db: Database session.
+        subscription_id: Stripe subscription ID backing the new tier.
+
+    Returns:
+        bool: True if a user was updated.
     """
-    user.pricing_tier = new_tier.value
-    user.monthly_prompt_quota = TIER_QUOTAS[new_tier]
-    user.prompts_used_this_month = 0
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            pricing_tier=new_tier.value,
+            monthly_prompt_quota=TIER_QUOTAS[new_tier],
+            prompts_used_this_month=0,
+            stripe_subscription_id=subscription_id,
+        )
+        .returning(User.id)
+    )
+    updated = result.first() is not None
 
     await db.commit()
-    await db.refresh(user)
+    return updated
 
 
 async def downgrade_user_tier(
-    user: User,
+    subscription_id: str,
     new_tier: PricingTier,
     db: AsyncSession,
-) -> None:
+) -> bool:
     """
-    Downgrade user to a lower pricing tier.
+    Downgrade the user on a cancelled subscription to a lower pricing tier.
+
+    Clears the subscription and updates quota in a single UPDATE statement.
 
     Args:
-        user: User to downgrade.
+        subscription_id: Stripe subscription ID that was cancelled.
         new_tier: New pricing tier.
         db: Database session.
+
+    Returns:
+        bool: True if a user was updated.
+    """
+    result = await db.execute(
+        update(User)
+        .where(User.stripe_subscription_id == subscription_id)
+        .values(
+            pricing_tier=new_tier.value,
+            monthly_prompt_quota=TIER_QUOTAS[new_tier],
+            stripe_subscription_id=None,
+            # Don't reset usage to prevent abuse
+        )
+        .returning(User.id)
+    )
+    updated = result.first() is not None
+
+    await db.commit()
+    return updated
+
+
+async def reset_subscription_usage(subscription_id: str, db: AsyncSession) -> bool:
     """
-    user.pricing_tier = new_tier.value
-    user.monthly_prompt_quota = TIER_QUOTAS[new_tier]
-    # Don't reset usage to prevent abuse
+    Reset the monthly usage counter for the user on a subscription.
+
+    Args:
+        subscription_id: Stripe subscription ID that was renewed.
+        db: Database session.
+
+    Returns:
+        bool: True if a user was updated.
+    """
+    result = await db.execute(
+        update(User)
+        .where(User.stripe_subscription_id == subscription_id)
+        .values(prompts_used_this_month=0)
+        .returning(User.id)
+    )
+    updated = result.first() is not None
 
     await db.commit()
-    await db.refresh(user)
+    return updated
 
 
 async def check_usage_quota(user: User) -> bool:
@@ -0,0 +1,33 @@
+"""
+Redis keys for cached API responses.
+
+Shared by the routers that fill these caches and the code that invalidates
+them elsewhere: the Celery worker when an experiment starts or completes,
+and account deletion for per-user entries.
+"""
+
+
+def stats_cache_key(user_id: object) -> str:
+    """Redis key for a user's cached dashboard stats."""
+    return f"dashboard:stats:{user_id}"
+
+
+def experiment_cache_key(user_id: object, experiment_id: object) -> str:
+    """Redis key for a completed experiment's cached status response."""
+    # Scoped by owner so a cache hit is already authorized
+    return f"experiment:{user_id}:{experiment_id}"
+
+
+def report_cache_key(user_id: object, experiment_id: object) -> str:
+    """Redis key for a completed experiment's cached visibility report."""
+    return f"report:{user_id}:{experiment_id}"
+
+
+def list_cache_key(user_id: object) -> str:
+    """Redis hash holding a user's cached list pages, one field per query."""
+    return f"experiments:list:{user_id}"
+
+
+def brand_cache_key(user_id: object) -> str:
+    """Redis key for a user's cached brand profile."""
+    return f"echo:brand:{user_id}"
@@ -0,0 +1,59 @@
+"""
+Buffered logging of public demo usage.
+
+Demo requests are audit-only, so usage rows are pushed onto a Redis list
+(O(1), shared by every API worker and durable across restarts) instead of
+costing each request a database commit. A periodic Celery task drains the
+list into the demo_usage table in bulk.
+"""
+
+import json
+import logging
+from datetime import datetime
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+DEMO_USAGE_KEY = "echo:demo:usage"
+# Bound memory if the flush task falls behind; the oldest rows are dropped first
+MAX_BUFFERED_ROWS = 10_000
+
+
+async def record_demo_usage(
+    redis: Redis,  # type: ignore[type-arg]
+    target_brand: str,
+    provider: str,
+    prompt: str,
+    ip_address: str,
+) -> None:
+    """
+    Buffer a demo usage row for the next bulk insert.
+
+    Redis failures are logged and swallowed; usage logging must never fail
+    the demo request.
+
+    Args:
+        redis: Redis client.
+        target_brand: Brand analysed by the demo.
+        provider: LLM provider used.
+        prompt: Prompt submitted.
+        ip_address: Client IP address.
+    """
+    row = json.dumps(
+        {
+            "target_brand": target_brand,
+            "provider": provider,
+            "prompt": prompt,
+            "ip_address": ip_address,
+            # demo_usage.created_at is a naive UTC column
+            "created_at": datetime.utcnow().isoformat(),
+        }
+    )
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(DEMO_USAGE_KEY, row)
+            pipe.ltrim(DEMO_USAGE_KEY, -MAX_BUFFERED_ROWS, -1)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to buffer demo usage in {DEMO_USAGE_KEY}: {e}")
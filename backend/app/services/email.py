@@ -5,6 +5,7 @@ This module handles sending verification emails, password resets,
 and other transactional emails using SMTP.
 """
 
+from datetime import timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -81,6 +82,40 @@ PASSWORD_RESET_TEMPLATE = """
 """
 
 
+WELCOME_EMAIL_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Welcome to AI Visibility!</h1>
+        <p>Hi {{ user_name }},</p>
+        <p>Your email has been verified successfully. You're all set to start analyzing brand visibility across LLM providers!</p>
+        <p><strong>What's next?</strong></p>
+        <ul>
+            <li>Run your first experiment to see how your brand appears in AI responses</li>
+            <li>Compare visibility across OpenAI, Anthropic, and Perplexity</li>
+            <li>Track metrics like Share of Voice and Consistency Scores</li>
+        </ul>
+        <p>Get started: <a href="{{ dashboard_url }}">{{ dashboard_url }}</a></p>
+        <p>Questions? Reply to this email or visit our documentation.</p>
+        <p>Best regards,<br>The AI Visibility Team</p>
+    </div>
+</body>
+</html>
+"""
+
+# Compiled once at import; each send only renders
+_VERIFICATION_TPL = Template(VERIFICATION_EMAIL_TEMPLATE)
+_RESET_TPL = Template(PASSWORD_RESET_TEMPLATE)
+_WELCOME_TPL = Template(WELCOME_EMAIL_TEMPLATE)
+
+
 async def send_email(
     to_email: str,
     subject: str,
@@ -135,8 +170,6 @@ async def send_verification_email(user_email: str, user_name: str, user_id: str)
         user_id: User's ID for token generation.
     """
     # Generate verification token (valid for 24 hours)
-    from datetime import timedelta
-
     token = create_access_token(
         data={"user_id": user_id, "type": "email_verification"},
         expires_delta=timedelta(hours=24),
@@ -146,8 +179,7 @@ async def send_verification_email(user_email: str, user_name: str, user_id: str)
     verification_url = f"{settings.frontend_url}/verify-email?token={token}"
 
     # Render template
-    template = Template(VERIFICATION_EMAIL_TEMPLATE)
-    html_content = template.render(
+    html_content = _VERIFICATION_TPL.render(
         user_name=user_name or "there",
         verification_url=verification_url,
     )
@@ -170,8 +202,6 @@ async def send_password_reset_email(user_email: str, user_name: str, user_id: st
         user_id: User's ID for token generation.
     """
     # Generate reset token (valid for 1 hour)
-    from datetime import timedelta
-
     token = create_access_token(
         data={"user_id": user_id, "type": "password_reset"},
         expires_delta=timedelta(hours=1),
@@ -181,8 +211,7 @@ async def send_password_reset_email(user_email: str, user_name: str, user_id: st
     reset_url = f"{settings.frontend_url}/reset-password?token={token}"
 
     # Render template
-    template = Template(PASSWORD_RESET_TEMPLATE)
-    html_content = template.render(
+    html_content = _RESET_TPL.render(
         user_name=user_name or "there",
         reset_url=reset_url,
     )
@@ -203,33 +232,10 @@ async def send_welcome_email(user_email: str, user_name: str) -> None:
         user_email: User's email address.
         user_name: User's display name.
     """
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Welcome to AI Visibility!</h1>
-            <p>Hi {user_name or "there"},</p>
-            <p>Your email has been verified successfully. You're all set to start analyzing brand visibility across LLM providers!</p>
-            <p><strong>What's next?</strong></p>
-            <ul>
-                <li>Run your first experiment to see how your brand appears in AI responses</li>
-                <li>Compare visibility across OpenAI, Anthropic, and Perplexity</li>
-                <li>Track metrics like Share of Voice and Consistency Scores</li>
-            </ul>
-            <p>Get started: <a href="{settings.frontend_url}/dashboard">{settings.frontend_url}/dashboard</a></p>
-            <p>Questions? Reply to this email or visit our documentation.</p>
-            <p>Best regards,<br>The AI Visibility Team</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_content = _WELCOME_TPL.render(
+        user_name=user_name or "there",
+        dashboard_url=f"{settings.frontend_url}/dashboard",
+    )
 
     await send_email(
         to_email=user_email,
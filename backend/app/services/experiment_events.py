@@ -0,0 +1,114 @@
+"""
+Experiment status events over Redis pub/sub.
+
+The worker publishes each status transition on a per-experiment channel and
+the API relays it to subscribed clients as Server-Sent Events, so clients
+waiting on an experiment no longer poll GET /experiments/{id}.
+"""
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from backend.app.core.config import get_settings
+from backend.app.core.redis import create_redis_client
+from backend.app.models.experiment import ExperimentStatus
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({ExperimentStatus.COMPLETED.value, ExperimentStatus.FAILED.value})
+
+# Comment line sent while idle so proxies don't drop the connection
+KEEPALIVE_SECONDS = 15
+# Upper bound on a single stream; matches the worker's task_time_limit
+MAX_STREAM_SECONDS = 3600
+
+
+def experiment_channel(experiment_id: object) -> str:
+    """Redis pub/sub channel carrying an experiment's status events."""
+    return f"echo:experiment:{experiment_id}:events"
+
+
+def _event(experiment_id: object, status: str, error_message: str | None = None) -> str:
+    return json.dumps(
+        {"experiment_id": str(experiment_id), "status": status, "error_message": error_message}
+    )
+
+
+async def publish_experiment_status(
+    experiment_id: object,
+    status: ExperimentStatus,
+    error_message: str | None = None,
+) -> None:
+    """
+    Publish a status transition for any listening clients.
+
+    Uses a dedicated Redis client since callers run in the worker's own event
+    loop. Failures are logged and swallowed; subscribers fall back to polling.
+
+    Args:
+        experiment_id: The experiment UUID.
+        status: New experiment status.
+        error_message: Error details for FAILED transitions.
+    """
+    redis = create_redis_client(get_settings())
+    try:
+        await redis.publish(
+            experiment_channel(experiment_id),
+            _event(experiment_id, status.value, error_message),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish status for experiment {experiment_id}: {e}")
+    finally:
+        await redis.aclose()
+
+
+async def stream_experiment_events(
+    redis: Redis,  # type: ignore[type-arg]
+    pubsub: PubSub,
+    experiment_id: object,
+    status: str,
+    error_message: str | None,
+) -> AsyncIterator[str]:
+    """
+    Yield SSE frames for an experiment until it reaches a terminal status.
+
+    The caller subscribes `pubsub` before reading the current status, so no
+    transition can fall between that read and the first message here. The
+    pubsub and its dedicated client are closed when the stream ends or the
+    client disconnects.
+
+    Args:
+        redis: Dedicated client owning the pubsub connection.
+        pubsub: PubSub already subscribed to the experiment's channel.
+        experiment_id: The experiment UUID.
+        status: Status read after subscribing.
+        error_message: Error message read after subscribing.
+
+    Yields:
+        str: SSE-formatted frames.
+    """
+    try:
+        yield f"data: {_event(experiment_id, status, error_message)}\n\n"
+        if status in TERMINAL_STATUSES:
+            return
+
+        deadline = time.monotonic() + MAX_STREAM_SECONDS
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=KEEPALIVE_SECONDS
+            )
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            yield f"data: {message['data']}\n\n"
+            if json.loads(message["data"]).get("status") in TERMINAL_STATUSES:
+                return
+    finally:
+        await pubsub.aclose()
+        await redis.aclose()
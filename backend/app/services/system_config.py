@@ -0,0 +1,133 @@
+"""
+Shared system configuration backed by Redis.
+
+Admin-editable platform settings live in a Redis hash so every API worker
+sees the same values. Each worker keeps a short-lived local snapshot to avoid
+a Redis round-trip on every read; updates publish an invalidation message so
+other workers drop their snapshot immediately instead of waiting for expiry.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from typing import Any
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_CONFIG_KEY = "echo:sys:config"
+SYSTEM_CONFIG_CHANNEL = "echo:sys:config:invalidate"
+SNAPSHOT_TTL_SECONDS = 5.0
+
+DEFAULT_SYSTEM_CONFIG: dict[str, Any] = {
+    "default_iterations": 10,
+    "default_frequency": "daily",  # daily, weekly, monthly
+    "default_recurring": False,
+    "max_iterations_per_experiment": 100,
+    "enable_recurring_experiments": True,
+    "maintenance_mode": False,
+}
+
+
+class RedisConfigStore:
+    """
+    System configuration stored in a Redis hash with a per-worker snapshot.
+
+    Field values are JSON-encoded so ints and bools round-trip intact.
+    Fields missing from Redis fall back to DEFAULT_SYSTEM_CONFIG, and a
+    Redis failure on read degrades to the last snapshot (or the defaults).
+    """
+
+    def __init__(self, ttl_seconds: float = SNAPSHOT_TTL_SECONDS) -> None:
+        self._ttl = ttl_seconds
+        self._snapshot: dict[str, Any] | None = None
+        self._expires_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the local snapshot so the next read hits Redis."""
+        self._snapshot = None
+        self._expires_at = 0.0
+
+    async def get_all(self, redis: Redis) -> dict[str, Any]:  # type: ignore[type-arg]
+        """
+        Return the current configuration.
+
+        Args:
+            redis: Redis client.
+
+        Returns:
+            dict[str, Any]: Full configuration with defaults applied.
+        """
+        if self._snapshot is not None and time.monotonic() < self._expires_at:
+            return dict(self._snapshot)
+
+        config = dict(DEFAULT_SYSTEM_CONFIG)
+        try:
+            stored = await redis.hgetall(SYSTEM_CONFIG_KEY)
+        except Exception as e:
+            logger.warning(f"Redis config read failed for {SYSTEM_CONFIG_KEY}: {e}")
+            return dict(self._snapshot) if self._snapshot is not None else config
+
+        for key, raw in stored.items():
+            if key in config:
+                config[key] = json.loads(raw)
+
+        self._snapshot = config
+        self._expires_at = time.monotonic() + self._ttl
+        return dict(config)
+
+    async def update(self, redis: Redis, updates: dict[str, Any]) -> dict[str, Any]:  # type: ignore[type-arg]
+        """
+        Persist configuration changes and notify other workers.
+
+        Unknown keys are ignored.
+
+        Args:
+            redis: Redis client.
+            updates: Fields to change.
+
+        Returns:
+            dict[str, Any]: The configuration after the update.
+        """
+        mapping = {
+            key: json.dumps(value) for key, value in updates.items() if key in DEFAULT_SYSTEM_CONFIG
+        }
+        if mapping:
+            await redis.hset(SYSTEM_CONFIG_KEY, mapping=mapping)
+            self.invalidate()
+            try:
+                await redis.publish(SYSTEM_CONFIG_CHANNEL, "1")
+            except Exception as e:
+                # Other workers still converge once their snapshot expires
+                logger.warning(f"Config invalidation publish failed: {e}")
+
+        return await self.get_all(redis)
+
+    async def listen_for_invalidations(self, redis: Redis) -> None:  # type: ignore[type-arg]
+        """
+        Drop the local snapshot whenever another worker publishes an update.
+
+        Intended to run as a background task for the lifetime of the app.
+
+        Args:
+            redis: Redis client.
+        """
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(SYSTEM_CONFIG_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self.invalidate()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Config invalidation listener stopped: {e}")
+        finally:
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()
+
+
+system_config_store = RedisConfigStore()
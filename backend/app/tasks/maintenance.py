@@ -1,22 +1,47 @@
+import json
 import logging
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
-from sqlalchemy import update
+from sqlalchemy import insert, select, update
 
 from backend.app.core.config import get_settings
 from backend.app.core.database import get_session_factory
+from backend.app.core.redis import create_redis_client
+from backend.app.core.security import LAST_LOGIN_KEY
+from backend.app.models.demo import DemoUsage
 from backend.app.models.experiment import Iteration
+from backend.app.models.user import User
+from backend.app.services.demo_usage import DEMO_USAGE_KEY
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+DEMO_USAGE_FLUSH_BATCH = 500
+
+# KEYS[1] = hash; ARGV = field, value pairs. Deletes each field only if it
+# still holds the flushed value, so a newer login written meanwhile survives.
+# Returns the number of fields deleted.
+_HDEL_IF_UNCHANGED_LUA = """
+local deleted = 0
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        deleted = deleted + redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return deleted
+"""
+PII_CLEANUP_BATCH = 10_000
+
 
 async def cleanup_old_pii_data() -> str:
     """
     Remove raw PII data from old iterations based on retention policy.
 
     This task nullifies the `raw_response` field for records older than
-    `data_retention_days` setting.
+    `data_retention_days` setting, committing every `PII_CLEANUP_BATCH` rows
+    so no single transaction holds locks on (or writes WAL for) the whole
+    backlog.
     """
     retention_days = settings.data_retention_days
     cutoff_date = datetime.now(UTC) - timedelta(days=retention_days)
@@ -25,21 +50,34 @@ async def cleanup_old_pii_data() -> str:
         f"Starting PII data cleanup. Cutoff date: {cutoff_date} (Retention: {retention_days} days)"
     )
 
+    # Ids of the next batch still holding a raw response past the cutoff
+    batch_ids = (
+        select(Iteration.id)
+        .where(Iteration.created_at < cutoff_date)
+        .where(Iteration.raw_response.is_not(None))
+        .limit(PII_CLEANUP_BATCH)
+    )
+    stmt = (
+        update(Iteration)
+        .where(Iteration.id.in_(batch_ids))
+        .values(raw_response=None)
+        .returning(Iteration.id)
+        .execution_options(synchronize_session=False)
+    )
+
+    rows_affected = 0
     session_factory = get_session_factory()
     async with session_factory() as session:
         try:
-            # Update query to nullify raw_response for old records
-            stmt = (
-                update(Iteration)
-                .where(Iteration.created_at < cutoff_date)
-                .where(Iteration.raw_response.is_not(None))
-                .values(raw_response=None)
-            )
-
-            result = await session.execute(stmt)
-            await session.commit()
-
-            rows_affected = result.rowcount
+            while True:
+                result = await session.execute(stmt)
+                batch_count = len(result.all())
+                await session.commit()
+
+                rows_affected += batch_count
+                if batch_count < PII_CLEANUP_BATCH:
+                    break
+
             msg = f"Cleaned up {rows_affected} iteration records older than {cutoff_date}"
             logger.info(msg)
             return msg
@@ -48,3 +86,101 @@ async def cleanup_old_pii_data() -> str:
             logger.error(f"Error during PII cleanup: {e}")
             await session.rollback()
             raise e
+
+
+async def flush_last_login_timestamps() -> str:
+    """
+    Persist buffered last-login timestamps from Redis to the users table.
+
+    Logins record their timestamp in the `echo:lastlogin` hash instead of
+    committing on the request path; this task writes them in one batched
+    UPDATE and then removes each flushed entry unless a newer login has
+    replaced it in the meantime.
+    """
+    # A dedicated client: the shared one is bound to the API process event loop
+    redis = create_redis_client(settings)
+    try:
+        pending = await redis.hgetall(LAST_LOGIN_KEY)
+        if not pending:
+            return "No last-login timestamps to flush"
+
+        rows = [
+            {"id": UUID(user_id), "last_login_at": datetime.fromisoformat(ts)}
+            for user_id, ts in pending.items()
+        ]
+
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            try:
+                # ORM bulk UPDATE by primary key (executemany)
+                await session.execute(update(User), rows)
+                await session.commit()
+            except Exception as e:
+                logger.error(f"Error flushing last-login timestamps: {e}")
+                await session.rollback()
+                raise e
+
+        # Compare-and-delete: a login between HGETALL and here overwrote its
+        # field with a newer timestamp, which stays for the next run
+        hdel_if_unchanged = redis.register_script(_HDEL_IF_UNCHANGED_LUA)
+        await hdel_if_unchanged(
+            keys=[LAST_LOGIN_KEY],
+            args=[item for pair in pending.items() for item in pair],
+        )
+
+        msg = f"Flushed last-login timestamps for {len(rows)} users"
+        logger.info(msg)
+        return msg
+    finally:
+        await redis.aclose()
+
+
+async def flush_demo_usage() -> str:
+    """
+    Persist buffered demo usage rows from Redis to the demo_usage table.
+
+    The demo endpoint pushes rows onto the `echo:demo:usage` list instead of
+    committing on the request path; this task reads them in batches, writes
+    each batch with one executemany INSERT and only then trims it off the
+    list, so a failed insert (or a crashed worker) leaves the rows in Redis
+    for the next run. Rows that can't be decoded are logged and dropped.
+    """
+    # A dedicated client: the shared one is bound to the API process event loop
+    redis = create_redis_client(settings)
+    flushed = 0
+    try:
+        session_factory = get_session_factory()
+        while True:
+            raw_rows = await redis.lrange(DEMO_USAGE_KEY, 0, DEMO_USAGE_FLUSH_BATCH - 1)
+            if not raw_rows:
+                break
+
+            rows = []
+            for raw in raw_rows:
+                try:
+                    row = json.loads(raw)
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Dropping malformed demo usage row {raw!r}: {e}")
+                    continue
+                rows.append(row)
+
+            if rows:
+                async with session_factory() as session:
+                    try:
+                        await session.execute(insert(DemoUsage), rows)
+                        await session.commit()
+                    except Exception as e:
+                        logger.error(f"Error flushing demo usage: {e}")
+                        await session.rollback()
+                        raise e
+
+            # New rows are appended at the tail, so the batch is still the head
+            await redis.ltrim(DEMO_USAGE_KEY, len(raw_rows), -1)
+            flushed += len(rows)
+
+        msg = f"Flushed {flushed} demo usage rows"
+        logger.info(msg)
+        return msg
+    finally:
+        await redis.aclose()
@@ -3,18 +3,33 @@ Scheduler tasks for recurring experiments.
 """
 
 import logging
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
-
-from sqlalchemy import and_, select
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.orm import selectinload
-
-from backend.app.core.config import get_settings
-from backend.app.models.experiment import Experiment, ExperimentFrequency, ExperimentStatus
+from typing import TYPE_CHECKING
+
+from celery import Signature, group
+from sqlalchemy import and_, desc, select, update
+
+from backend.app.core.database import get_session_factory
+from backend.app.models.experiment import (
+    BatchRun,
+    Experiment,
+    ExperimentFrequency,
+    ExperimentStatus,
+)
 from backend.app.worker import execute_experiment_task
 
+if TYPE_CHECKING:
+    from uuid import UUID
+
 logger = logging.getLogger(__name__)
-settings = get_settings()
+
+# Interval until the next run; unknown frequencies fall back to daily
+_FREQUENCY_INTERVALS = {
+    ExperimentFrequency.DAILY: timedelta(days=1),
+    ExperimentFrequency.WEEKLY: timedelta(weeks=1),
+    ExperimentFrequency.MONTHLY: timedelta(days=30),
+}
 
 
 async def check_scheduled_experiments() -> dict[str, int]:
@@ -27,74 +42,93 @@ async def check_scheduled_experiments() -> dict[str, int]:
        - Update last_run_at = now
        - Update next_run_at based on frequency
     """
-    engine = create_async_engine(str(settings.database_url))
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    # Shared engine: its pooled connections are reused across scheduler ticks
+    session_factory = get_session_factory()
 
     triggered_count = 0
+    task_signatures: list[Signature] = []
+    ids_by_interval: dict[timedelta, list[UUID]] = defaultdict(list)
     now = datetime.now(UTC)
 
     try:
         async with session_factory() as session, session.begin():
-            # Find due experiments with their batch runs loaded
-            stmt = (
-                select(Experiment)
-                .options(selectinload(Experiment.batch_runs))
-                .where(
-                    and_(
-                        Experiment.is_recurring,
-                        Experiment.status != ExperimentStatus.CANCELLED,
-                        Experiment.next_run_at <= now,
-                    )
+            # Provider of each experiment's most recent batch run, fetched in the
+            # same query instead of loading every run just to pick the latest
+            latest_provider = (
+                select(BatchRun.provider)
+                .where(BatchRun.experiment_id == Experiment.id)
+                .order_by(desc(BatchRun.created_at))
+                .limit(1)
+                .correlate(Experiment)
+                .scalar_subquery()
+            )
+
+            # Find due experiments (plain columns: nothing here needs ORM instances)
+            stmt = select(
+                Experiment.id,
+                Experiment.config,
+                Experiment.frequency,
+                latest_provider.label("latest_provider"),
+            ).where(
+                and_(
+                    Experiment.is_recurring,
+                    Experiment.status != ExperimentStatus.CANCELLED,
+                    Experiment.next_run_at <= now,
                 )
             )
 
             result = await session.execute(stmt)
-            due_experiments = result.scalars().all()
+            due_experiments = result.all()
 
             logger.info(f"Found {len(due_experiments)} due recurring experiments")
 
-            for exp in due_experiments:
+            for exp_id, config, frequency, last_provider in due_experiments:
                 # 1. Trigger Runs
                 # Determine provider from previous batch runs
                 providers = []
-                if exp.batch_runs:
-                    # Use the most recent provider(s)
+                if last_provider is not None:
+                    # Use the most recent provider
                     # In MVP, usually one provider per experiment
-                    # We sort by created_at to get latest
-                    latest_run = sorted(exp.batch_runs, key=lambda x: x.created_at, reverse=True)[0]
-                    providers = [latest_run.provider]
+                    providers = [last_provider]
                 else:
                     # Fallback to config or default
-                    providers = exp.config.get("providers", ["openai"])
+                    providers = config.get("providers", ["openai"])
                     if isinstance(providers, str):
                         providers = [providers]
 
-                for provider in providers:
-                    execute_experiment_task.delay(
-                        experiment_id=str(exp.id), provider=provider, model=exp.config.get("model")
+                # Queued here, published once the schedule update has committed
+                task_signatures.extend(
+                    execute_experiment_task.s(
+                        experiment_id=str(exp_id),
+                        provider=provider,
+                        model=config.get("model"),
                     )
+                    for provider in providers
+                )
 
-                # 2. Update Schedule
-                exp.last_run_at = now
-
-                if exp.frequency == ExperimentFrequency.DAILY:
-                    exp.next_run_at = now + timedelta(days=1)
-                elif exp.frequency == ExperimentFrequency.WEEKLY:
-                    exp.next_run_at = now + timedelta(weeks=1)
-                elif exp.frequency == ExperimentFrequency.MONTHLY:
-                    exp.next_run_at = now + timedelta(days=30)
-                else:
-                    # Default to daily if unknown
-                    exp.next_run_at = now + timedelta(days=1)
+                # 2. Group by next-run interval for the schedule update below
+                interval = _FREQUENCY_INTERVALS.get(frequency, timedelta(days=1))
+                ids_by_interval[interval].append(exp_id)
 
                 triggered_count += 1
-                logger.info(f"Triggered recurring run for Experiment {exp.id}")
+                logger.info(f"Triggered recurring run for Experiment {exp_id}")
+
+            # One UPDATE per frequency rather than one per experiment
+            for interval, exp_ids in ids_by_interval.items():
+                await session.execute(
+                    update(Experiment)
+                    .where(Experiment.id.in_(exp_ids))
+                    .values(last_run_at=now, next_run_at=now + interval)
+                    .execution_options(synchronize_session=False)
+                )
 
             # Commit happens here
 
+        # Publish outside the transaction so broker latency doesn't hold row locks
+        if task_signatures:
+            group(task_signatures).apply_async()
+
     except Exception as e:
         logger.exception(f"Error checking scheduled experiments: {e}")
-    finally:
-        await engine.dispose()
 
     return {"triggered": triggered_count}
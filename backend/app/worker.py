@@ -12,7 +12,7 @@ to thousands of concurrent experiments.
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
@@ -31,17 +31,38 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
+    # Message protocol v2 (the Celery 4+ default), pinned: headers carry the
+    # task metadata, so routing needs no body decode
+    task_protocol=2,
     task_serializer="json",
     accept_content=["json"],
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
-    task_track_started=True,
+    # Every task is fire-and-forget (experiment progress lives in the database and
+    # nothing reads AsyncResult), so skip all result-backend state/result writes
+    task_ignore_result=True,
     task_time_limit=3600,  # 1 hour hard limit (allows for large batches)
     task_soft_time_limit=3300,  # 55 minute soft limit
     worker_prefetch_multiplier=1,  # Process one task at a time
     task_acks_late=True,  # Acknowledge after completion
     task_reject_on_worker_lost=True,
+    # Wait longer than the 10s default for a killed child's result before raising
+    # WorkerLostError (which, with reject_on_worker_lost, requeues the experiment).
+    # Workers are started with -Ofair so each long experiment goes to an idle child.
+    worker_lost_wait=60,
+    # Publishes from the API run in to_thread workers; keep enough pooled broker
+    # connections that concurrent creates reuse one instead of reconnecting
+    broker_pool_limit=20,
+    broker_connection_retry_on_startup=True,
+    broker_transport_options={
+        # With acks_late, a Redis broker redelivers tasks unacked after the visibility
+        # timeout (default 1h); keep it above task_time_limit to avoid duplicate runs
+        "visibility_timeout": 7200,
+        # Detect connections silently dropped by proxies/LBs while idle in the pool
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
 )
 
 # Configure periodic tasks (Celery Beat)
@@ -54,17 +75,41 @@ celery_app.conf.beat_schedule = {
         "task": "cleanup_old_pii_data",
         "schedule": 86400.0,  # Run every 24 hours (daily)
     },
+    "flush-last-login-timestamps": {
+        "task": "flush_last_login_timestamps",
+        "schedule": 300.0,  # Run every 5 minutes
+    },
+    "flush-demo-usage": {
+        "task": "flush_demo_usage",
+        "schedule": 60.0,  # Run every minute
+    },
 }
 
 logger = logging.getLogger(__name__)
 
+# The API publishes the task concurrently with the experiment INSERT, so a fast
+# worker can see the task before the row commits; retry briefly before failing
+EXPERIMENT_NOT_FOUND_RETRIES = 5
+EXPERIMENT_NOT_FOUND_RETRY_DELAY = 1  # seconds
+
+
+class ExperimentNotFoundError(LookupError):
+    """The experiment row isn't visible (yet) to the worker."""
+
+
+# One event loop per worker process, created on first use (after the prefork).
+# asyncpg connections are bound to the loop that opened them, so keeping the
+# loop alive is what lets tasks reuse the shared engine's pooled connections.
+_async_runner = asyncio.Runner()
+
 
 def run_async(coro: Any) -> Any:
     """
     Helper to run async code in sync Celery tasks.
 
-    Uses asyncio.run() which properly manages event loop lifecycle,
-    preventing connection pool corruption and memory leaks.
+    Runs on the process-wide event loop rather than a fresh asyncio.run()
+    loop per call, so connections pooled by get_session_factory() stay
+    usable across task invocations.
 
     Args:
         coro: Coroutine to execute.
@@ -72,7 +117,7 @@ def run_async(coro: Any) -> Any:
     Returns:
         Result of the coroutine.
     """
-    return asyncio.run(coro)
+    return _async_runner.run(coro)
 
 
 @celery_app.task(bind=True, name="execute_experiment")  # type: ignore[untyped-decorator]
@@ -112,14 +157,24 @@ def execute_experiment_task(
                 experiment_id=experiment_id,
                 provider=provider,
                 model=model,
-                task_id=self.request.id,
+                _task_id=self.request.id,
             )
         )
         return result
+    except ExperimentNotFoundError as e:
+        if self.request.retries < EXPERIMENT_NOT_FOUND_RETRIES:
+            raise self.retry(
+                exc=e,
+                countdown=EXPERIMENT_NOT_FOUND_RETRY_DELAY,
+                max_retries=EXPERIMENT_NOT_FOUND_RETRIES,
+            )
+        # Never committed (e.g. the API's insert failed): nothing to mark failed
+        logger.error(f"Giving up on experiment {experiment_id}: {e}")
+        raise
     except Exception as e:
+        # _execute_experiment_async has already marked the experiment failed,
+        # refunded the quota and published the FAILED event
         logger.exception(f"Experiment {experiment_id} failed: {e}")
-        # Update experiment status to failed
-        run_async(_mark_experiment_failed(experiment_id, str(e)))
         raise
 
 
@@ -159,6 +214,7 @@ async def _execute_experiment_async(
     )
     from backend.app.schemas.llm import LLMProvider
     from backend.app.schemas.runner import BatchConfig, IterationStatus
+    from backend.app.services.experiment_events import publish_experiment_status
 
     # Create a fresh engine for this task to avoid event loop conflicts
     # Use smaller pool size to prevent connection exhaustion
@@ -187,7 +243,7 @@ async def _execute_experiment_async(
                 # Fetch experiment
                 experiment = await exp_repo.get_experiment(UUID(experiment_id))
                 if not experiment:
-                    raise ValueError(f"Experiment {experiment_id} not found")
+                    raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
 
                 # Capture refund details early
                 user_id = experiment.user_id
@@ -211,7 +267,7 @@ async def _execute_experiment_async(
                 await batch_repo.update_batch_status(
                     batch_run.id,
                     BatchRunStatus.RUNNING,
-                    started_at=datetime.utcnow(),
+                    started_at=datetime.now(UTC),
                 )
 
                 # Store needed data for next phases
@@ -236,6 +292,11 @@ async def _execute_experiment_async(
                     system_prompt=config_dict.get("system_prompt"),
                 )
 
+            # A rerun (recurring schedule, redelivery) makes cached "completed"
+            # responses stale until the new results land
+            await _invalidate_result_caches(user_id, experiment_id)
+            await publish_experiment_status(experiment_id, ExperimentStatus.RUNNING)
+
             # Phase 2: Execute Batch (No DB Lock)
             # Transaction 1 committed. Connection returned to pool (briefly).
             logger.info(
@@ -303,7 +364,7 @@ async def _execute_experiment_async(
                 await batch_repo.update_batch_status(
                     batch_run_id,
                     BatchRunStatus.COMPLETED,
-                    completed_at=datetime.utcnow(),
+                    completed_at=datetime.now(UTC),
                     duration_ms=batch_result.total_duration_ms,
                 )
 
@@ -321,24 +382,34 @@ async def _execute_experiment_async(
                     UUID(experiment_id),
                     ExperimentStatus.COMPLETED,
                 )
+                if user_id is not None:
+                    await exp_repo.record_first_completion(
+                        user_id, UUID(experiment_id), batch_run_id
+                    )
 
             logger.info(
                 f"Experiment {experiment_id} completed: "
                 f"{batch_result.successful_iterations}/{batch_result.total_iterations} successful"
             )
 
+            await _invalidate_result_caches(user_id, experiment_id)
+            await publish_experiment_status(experiment_id, ExperimentStatus.COMPLETED)
+
+    except ExperimentNotFoundError:
+        # No row to mark failed or refund against; the task retries instead
+        raise
+
     except Exception as e:
         logger.exception(f"Error executing experiment {experiment_id}: {e}")
 
-        # Mark experiment as failed and issue refund
-        # Use captured variables (initialized to None if failure happened before capture)
-        run_async(
-            _mark_experiment_failed(
-                experiment_id=experiment_id,
-                error_message=str(e),
-                refund_amount=iterations_count,
-                user_id=user_id,
-            )
+        # Mark experiment as failed, issue refund and notify subscribers.
+        # Use captured variables (initialized to None if failure happened before capture).
+        # Already inside the task's event loop, so await rather than run_async()
+        await _mark_experiment_failed(
+            experiment_id=experiment_id,
+            error_message=str(e),
+            refund_amount=iterations_count,
+            user_id=user_id,
         )
         raise
 
@@ -347,6 +418,41 @@ async def _execute_experiment_async(
         await engine.dispose()
 
 
+async def _invalidate_result_caches(user_id: UUID | None, experiment_id: str) -> None:
+    """
+    Drop a user's cached dashboard stats, list pages and experiment results.
+
+    Called when an experiment starts (a rerun invalidates its cached
+    completed state) and again when its new results land.
+
+    Uses a dedicated Redis client since the shared one is bound to another
+    event loop. Failures are logged; the cache TTL bounds staleness anyway.
+    """
+    if user_id is None:
+        return
+
+    from backend.app.core.redis import create_redis_client
+    from backend.app.services.cache_keys import (
+        experiment_cache_key,
+        list_cache_key,
+        report_cache_key,
+        stats_cache_key,
+    )
+
+    redis = create_redis_client(settings)
+    try:
+        await redis.delete(
+            stats_cache_key(user_id),
+            experiment_cache_key(user_id, experiment_id),
+            report_cache_key(user_id, experiment_id),
+            list_cache_key(user_id),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to invalidate result caches for user {user_id}: {e}")
+    finally:
+        await redis.aclose()
+
+
 async def _refund_user_quota(session: Any, user_id: UUID, amount: int) -> None:
     """Refunding user quota after system failure."""
     from backend.app.repositories.user_repo import UserRepository
@@ -382,6 +488,7 @@ async def _mark_experiment_failed_internal(
     """
     from backend.app.models.experiment import ExperimentStatus
     from backend.app.repositories.experiment_repo import ExperimentRepository
+    from backend.app.services.experiment_events import publish_experiment_status
 
     try:
         async with session.begin():
@@ -396,6 +503,8 @@ async def _mark_experiment_failed_internal(
             if refund_amount and user_id and refund_amount > 0:
                 await _refund_user_quota(session, user_id, refund_amount)
 
+        await publish_experiment_status(experiment_id, ExperimentStatus.FAILED, error_message)
+
     except Exception as e:
         logger.exception(f"Failed to mark experiment {experiment_id} as failed: {e}")
 
@@ -477,3 +586,33 @@ def cleanup_old_pii_data_task() -> str:
     except Exception as e:
         logger.exception(f"PII cleanup task failed: {e}")
         return f"Error: {e}"
+
+
+@celery_app.task(name="flush_last_login_timestamps")  # type: ignore[untyped-decorator]
+def flush_last_login_timestamps_task() -> str:
+    """
+    Periodic task to persist buffered last-login timestamps.
+    """
+    from backend.app.tasks.maintenance import flush_last_login_timestamps
+
+    try:
+        result = run_async(flush_last_login_timestamps())
+        return result
+    except Exception as e:
+        logger.exception(f"Last-login flush task failed: {e}")
+        return f"Error: {e}"
+
+
+@celery_app.task(name="flush_demo_usage")  # type: ignore[untyped-decorator]
+def flush_demo_usage_task() -> str:
+    """
+    Periodic task to persist buffered demo usage rows.
+    """
+    from backend.app.tasks.maintenance import flush_demo_usage
+
+    try:
+        result = run_async(flush_demo_usage())
+        return result
+    except Exception as e:
+        logger.exception(f"Demo usage flush task failed: {e}")
+        return f"Error: {e}"
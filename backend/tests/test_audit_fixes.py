@@ -9,11 +9,14 @@ from backend.app.builders.providers import OpenAIProvider
 from backend.app.core.security import get_secret_key
 from backend.app.models.experiment import ExperimentStatus
 from backend.app.models.user import User
+from backend.app.routers.brand import update_brand_profile
 from backend.app.routers.experiments import (
     ExperimentRequest,
     create_experiment,
     get_experiment_detail,
+    stream_experiment_events_endpoint,
 )
+from backend.app.schemas.brand import BrandProfileCreate
 from backend.app.schemas.llm import LLMProvider, LLMRequest, Message, MessageRole
 
 
@@ -50,14 +53,15 @@ class TestAuditFixes(unittest.IsolatedAsyncioTestCase):
             valid_exp.next_run_at = None
             valid_exp.last_run_at = None
 
-            mock_exp_repo.get_experiment_by_user.return_value = valid_exp
-            mock_exp_repo.get_experiment_with_results.return_value = valid_exp
+            mock_exp_repo.get_experiment_with_results_for_user.return_value = valid_exp
 
             await get_experiment_detail(experiment_id, mock_session, current_user)
-            mock_exp_repo.get_experiment_by_user.assert_called_with(experiment_id, user_a_id)
+            mock_exp_repo.get_experiment_with_results_for_user.assert_called_with(
+                experiment_id, user_a_id
+            )
 
             # Scenario 2: User A tries to access User B's experiment (Should Fail)
-            mock_exp_repo.get_experiment_by_user.return_value = None
+            mock_exp_repo.get_experiment_with_results_for_user.return_value = None
 
             with self.assertRaises(HTTPException) as cm:
                 await get_experiment_detail(experiment_id, mock_session, current_user)
@@ -66,6 +70,8 @@ class TestAuditFixes(unittest.IsolatedAsyncioTestCase):
     async def test_crit2_quota_rollback(self):
         """Verify that if Celery task fails to queue, user quota is refunded."""
         mock_session = AsyncMock()
+        # Quota is reserved with UPDATE ... RETURNING; a returned row means it fit
+        mock_session.execute.return_value = MagicMock()
         mock_exp_repo = AsyncMock()
 
         user_id = uuid.uuid4()
@@ -74,6 +80,7 @@ class TestAuditFixes(unittest.IsolatedAsyncioTestCase):
             email="test@example.com",
             monthly_prompt_quota=100,
             prompts_used_this_month=50,
+            brand_name="TestBrand",  # Brand profile is required to create experiments
         )
 
         request = ExperimentRequest(
@@ -87,18 +94,12 @@ class TestAuditFixes(unittest.IsolatedAsyncioTestCase):
         mock_exp = MagicMock(id=uuid.uuid4())
         mock_exp_repo.create_experiment.return_value = mock_exp
 
-        # Mock Request object for rate limiter
-        mock_request = MagicMock()
-        mock_request.client.host = "127.0.0.1"
-
-        # Patch get_settings because it is called inside create_experiment
-        with patch("backend.app.routers.experiments.get_settings") as mock_get_settings:
-            mock_settings = MagicMock()
+        # Patch the module-level settings read by create_experiment
+        with patch("backend.app.routers.experiments.settings") as mock_settings:
             mock_settings.testing_mode = False
             mock_settings.unlimited_prompts = False
             # Ensure max_iterations is high enough
             mock_settings.max_iterations = 100
-            mock_get_settings.return_value = mock_settings
 
             with (
                 patch(
@@ -106,15 +107,19 @@ class TestAuditFixes(unittest.IsolatedAsyncioTestCase):
                     return_value=mock_exp_repo,
                 ),
                 patch("backend.app.routers.experiments.execute_experiment_task") as mock_task,
+                patch(
+                    "backend.app.routers.experiments._refund_prompts", new_callable=AsyncMock
+                ) as mock_refund,
             ):
-                mock_task.delay.side_effect = Exception("Redis Down")
+                mock_task.apply_async.side_effect = Exception("Redis Down")
 
                 with self.assertRaises(HTTPException) as cm:
-                    await create_experiment(request, mock_request, mock_session, current_user)
+                    await create_experiment(request, mock_session, AsyncMock(), current_user)
 
                 self.assertEqual(cm.exception.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
-                # Quota logic: 50 + 10 = 60 (commit) -> fail -> 60 - 10 = 50 (commit)
-                self.assertEqual(current_user.prompts_used_this_month, 50)
+                # Quota logic: atomic +10 UPDATE -> fail -> -10 UPDATE, committed with the failure
+                mock_refund.assert_awaited_once_with(mock_session, user_id, 10)
+                mock_session.commit.assert_awaited_once()
 
                 mock_exp_repo.update_experiment_status.assert_called_with(
                     mock_exp.id,
@@ -175,6 +180,74 @@ class TestAuditFixes(unittest.IsolatedAsyncioTestCase):
             self.assertEqual(response.content, "Success")
             self.assertEqual(mock_client.post.call_count, 3)
 
+    async def test_brand_update_inactive_user_forbidden(self):
+        """Verify a deactivated account still gets 403 (not 401) on brand writes."""
+        mock_session = AsyncMock()
+        # The active-scoped UPDATE matches nothing; the follow-up finds the user inactive
+        update_result = MagicMock()
+        update_result.first.return_value = None
+        status_result = MagicMock()
+        status_result.scalar_one_or_none.return_value = False
+        mock_session.execute.side_effect = [update_result, status_result]
+
+        profile = BrandProfileCreate(brand_name="BrandX")
+
+        with self.assertRaises(HTTPException) as cm:
+            await update_brand_profile(profile, AsyncMock(), uuid.uuid4(), mock_session)
+        self.assertEqual(cm.exception.status_code, status.HTTP_403_FORBIDDEN)
+
+        # A user that no longer exists is still a 401
+        status_result.scalar_one_or_none.return_value = None
+        mock_session.execute.side_effect = [update_result, status_result]
+
+        with self.assertRaises(HTTPException) as cm:
+            await update_brand_profile(profile, AsyncMock(), uuid.uuid4(), mock_session)
+        self.assertEqual(cm.exception.status_code, status.HTTP_401_UNAUTHORIZED)
+        mock_session.commit.assert_not_awaited()
+
+    async def test_event_stream_releases_request_session(self):
+        """Verify the SSE endpoint frees the request session before the first event."""
+        request_session = AsyncMock()
+        status_session = AsyncMock()
+        status_session.__aenter__.return_value = status_session
+        mock_exp_repo = AsyncMock()
+        mock_exp_repo.get_status_for_user.return_value = MagicMock(
+            status="running", error_message=None
+        )
+        current_user = User(id=uuid.uuid4(), email="a@example.com", is_active=True)
+        mock_redis = MagicMock()
+        mock_redis.pubsub.return_value = AsyncMock()
+        released_before_first_event = []
+
+        async def fake_events(*_args):
+            released_before_first_event.append(request_session.commit.await_count == 1)
+            yield "data: {}\n\n"
+
+        with (
+            patch("backend.app.routers.experiments.create_redis_client", return_value=mock_redis),
+            patch(
+                "backend.app.routers.experiments.get_session_factory",
+                return_value=MagicMock(return_value=status_session),
+            ),
+            patch(
+                "backend.app.routers.experiments.ExperimentRepository", return_value=mock_exp_repo
+            ) as mock_repo_cls,
+            patch(
+                "backend.app.routers.experiments.stream_experiment_events", side_effect=fake_events
+            ),
+        ):
+            response = await stream_experiment_events_endpoint(
+                uuid.uuid4(), request_session, current_user
+            )
+            async for _ in response.body_iterator:
+                pass
+
+        self.assertEqual(released_before_first_event, [True])
+        # The status read went through its own short-lived session
+        mock_repo_cls.assert_called_once_with(status_session)
+        status_session.__aexit__.assert_awaited_once()
+        request_session.execute.assert_not_awaited()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,8 +10,6 @@ os.environ["SECRET_KEY"] = "test-secret"
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
-from backend.app.models.demo import DemoUsage
-
 # Import routers after setting env vars
 from backend.app.routers.demo import router as demo_router
 from backend.app.routers.health import router as health_router
@@ -36,32 +34,29 @@ class TestProductization(unittest.IsolatedAsyncioTestCase):
         # Since we are testing the router functions directly often, or via client if we can override deps.
         # Let's try to patch the `session` argument injection or just mock the internals.
 
-    @patch("backend.app.routers.health.get_settings")
-    @patch("backend.app.routers.health.Redis")
-    async def test_health_detailed(self, mock_redis_cls, mock_get_settings):
+    async def test_health_detailed(self):
         # Setup Mocks
-        mock_settings = MagicMock()
-        mock_settings.redis_url = "redis://localhost:6379/0"
-        mock_get_settings.return_value = mock_settings
-
         mock_redis = AsyncMock()
-        mock_redis_cls.from_url.return_value = mock_redis
 
         # Test Function directly (bypassing FastAPI dep injection for simplicity in unit test)
         from backend.app.routers.health import detailed_health_check
 
         # 1. Healthy Case
         self.mock_session.execute.return_value.scalar.return_value = 1
-        response = await detailed_health_check(self.mock_session)
+        response = await detailed_health_check(self.mock_session, mock_redis)
         self.assertEqual(response["status"], "healthy")
         self.assertEqual(response["components"]["database"], "healthy")
         self.assertEqual(response["components"]["redis"], "healthy")
+        mock_redis.ping.assert_awaited_once()
 
+    @patch("backend.app.routers.demo.record_demo_usage")
     @patch("backend.app.routers.demo.RunnerBuilder")
     @patch("backend.app.routers.demo.AnalysisBuilder")
-    @patch("backend.app.routers.demo.get_settings")
     async def test_demo_quick_analysis(
-        self, _mock_settings, mock_analysis_builder_cls, mock_runner_builder_cls
+        self,
+        mock_analysis_builder_cls,
+        mock_runner_builder_cls,
+        mock_record_usage,
     ):
         from backend.app.routers.demo import DemoRequest, run_quick_demo
 
@@ -83,7 +78,7 @@ class TestProductization(unittest.IsolatedAsyncioTestCase):
         }
         mock_analyzer.analyze_batch.return_value = mock_analysis_result
 
-        # Test Request - Use real Request for slowapi compatibility
+        # Test Request - the handler reads the client IP for usage logging
         scope = {
             "type": "http",
             "client": ("127.0.0.1", 8000),
@@ -98,17 +93,80 @@ class TestProductization(unittest.IsolatedAsyncioTestCase):
         )
 
         # Execute
-        response = await run_quick_demo(req_obj, demo_req, self.mock_session)
+        response = await run_quick_demo(req_obj, demo_req, AsyncMock())
 
         # Verify Response
         self.assertEqual(response.visibility_score, 80.0)
         self.assertEqual(response.share_of_voice, 50.0)
 
-        # Verify DB Interaction (Analytics)
-        self.mock_session.add.assert_called_once()
-        args, _ = self.mock_session.add.call_args
-        self.assertIsInstance(args[0], DemoUsage)
-        self.assertEqual(args[0].target_brand, "Test Brand")
+        # Verify usage was buffered for the flush task (Analytics)
+        mock_record_usage.assert_called_once()
+        _, kwargs = mock_record_usage.call_args
+        self.assertEqual(kwargs["target_brand"], "Test Brand")
+        self.assertEqual(kwargs["ip_address"], "127.0.0.1")
+
+    async def test_flush_demo_usage_keeps_rows_on_failure(self):
+        from backend.app.services.demo_usage import DEMO_USAGE_KEY
+        from backend.app.tasks import maintenance
+
+        row = (
+            '{"target_brand": "Test Brand", "provider": "openai", "prompt": "p", '
+            '"ip_address": "127.0.0.1", "created_at": "2026-01-01T00:00:00"}'
+        )
+        mock_redis = AsyncMock()
+        self.mock_session.__aenter__.return_value = self.mock_session
+        self.mock_session.execute.side_effect = RuntimeError("DB down")
+
+        with (
+            patch.object(maintenance, "create_redis_client", return_value=mock_redis),
+            patch.object(
+                maintenance,
+                "get_session_factory",
+                return_value=MagicMock(return_value=self.mock_session),
+            ),
+        ):
+            # 1. Insert fails: the batch must stay in Redis for the next run
+            mock_redis.lrange.side_effect = [[row, row]]
+            with self.assertRaisesRegex(RuntimeError, "DB down"):
+                await maintenance.flush_demo_usage()
+            mock_redis.ltrim.assert_not_awaited()
+            self.mock_session.rollback.assert_awaited_once()
+
+            # 2. Insert succeeds: the batch is trimmed only after the commit
+            self.mock_session.execute.side_effect = None
+            mock_redis.lrange.side_effect = [[row, row], []]
+            result = await maintenance.flush_demo_usage()
+            self.assertEqual(result, "Flushed 2 demo usage rows")
+            self.mock_session.commit.assert_awaited_once()
+            mock_redis.ltrim.assert_awaited_once_with(DEMO_USAGE_KEY, 2, -1)
+
+    async def test_flush_last_login_keeps_newer_logins(self):
+        from backend.app.core.security import LAST_LOGIN_KEY
+        from backend.app.tasks import maintenance
+
+        user_id = "00000000-0000-0000-0000-000000000001"
+        ts = "2026-01-01T00:00:00+00:00"
+        mock_redis = AsyncMock()
+        mock_redis.hgetall.return_value = {user_id: ts}
+        hdel_if_unchanged = AsyncMock()
+        mock_redis.register_script = MagicMock(return_value=hdel_if_unchanged)
+        self.mock_session.__aenter__.return_value = self.mock_session
+
+        with (
+            patch.object(maintenance, "create_redis_client", return_value=mock_redis),
+            patch.object(
+                maintenance,
+                "get_session_factory",
+                return_value=MagicMock(return_value=self.mock_session),
+            ),
+        ):
+            await maintenance.flush_last_login_timestamps()
+
+        # Fields are removed by compare-and-delete against the flushed value,
+        # never by a blind HDEL that would drop a login written meanwhile
+        self.mock_session.commit.assert_awaited_once()
+        mock_redis.hdel.assert_not_awaited()
+        hdel_if_unchanged.assert_awaited_once_with(keys=[LAST_LOGIN_KEY], args=[user_id, ts])
 
 
 if __name__ == "__main__":
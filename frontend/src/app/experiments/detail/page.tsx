@@ -23,10 +23,22 @@ export function ExperimentDetailContent() {
         queryKey: ["experiment", experimentId],
         queryFn: () => (experimentId ? experimentsApi.getDetails(experimentId) : Promise.reject("No ID")),
         enabled: !!user && !!experimentId,
-        refetchInterval: (query) => ((query.state.data as any)?.status === "running" ? 3000 : false),
+        // Status changes arrive over SSE below; slow polling is only a fallback
+        refetchInterval: (query) => {
+            const status = (query.state.data as any)?.status;
+            return status === "pending" || status === "running" ? 30000 : false;
+        },
     });
 
     const experiment = experimentData as any;
+    const status = experiment?.status;
+
+    useEffect(() => {
+        if (!experimentId || (status !== "pending" && status !== "running")) return;
+        return experimentsApi.subscribeStatus(experimentId, (event) => {
+            if (event.status !== status) refetch();
+        });
+    }, [experimentId, status, refetch]);
 
     if (authLoading || isLoading) {
         return (
@@ -185,6 +185,51 @@ export const experimentsApi = {
             method: "GET",
         });
     },
+
+    /**
+     * Subscribe to experiment status changes (Server-Sent Events).
+     *
+     * Calls onEvent for the current status and every transition; the stream
+     * ends after the experiment completes or fails. Returns an unsubscribe
+     * function. Uses fetch rather than EventSource so the bearer token is sent.
+     */
+    subscribeStatus(
+        experimentId: string,
+        onEvent: (event: { status: string; error_message: string | null }) => void
+    ): () => void {
+        const controller = new AbortController();
+        const token = typeof window !== "undefined" ? localStorage.getItem("token") : null;
+
+        (async () => {
+            const response = await fetch(
+                `${BASE_URL}${API_PREFIX}/experiments/${experimentId}/events`,
+                {
+                    headers: token ? { Authorization: `Bearer ${token}` } : {},
+                    signal: controller.signal,
+                }
+            );
+            if (!response.ok || !response.body) return;
+
+            const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+            let buffer = "";
+            for (;;) {
+                const { value, done } = await reader.read();
+                if (done) return;
+                buffer += value;
+                const frames = buffer.split("\n\n");
+                buffer = frames.pop() ?? "";
+                for (const frame of frames) {
+                    if (frame.startsWith("data: ")) {
+                        onEvent(JSON.parse(frame.slice(6)));
+                    }
+                }
+            }
+        })().catch(() => {
+            // Aborted or dropped; callers keep their slow polling fallback
+        });
+
+        return () => controller.abort();
+    },
 };
 
 /**
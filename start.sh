@@ -21,7 +21,7 @@ echo "[STARTUP] Starting Celery worker with auto-scaling..."
 CPU_CORES=$(nproc 2>/dev/null || echo 2)
 MIN_CONCURRENCY=${CELERY_CONCURRENCY:-$CPU_CORES}
 MAX_CONCURRENCY=$((MIN_CONCURRENCY * 2))
-celery -A backend.app.worker worker -B --loglevel=info \
+celery -A backend.app.worker worker -B --loglevel=info -Ofair \
   --autoscale=${MAX_CONCURRENCY},${MIN_CONCURRENCY} \
   --max-tasks-per-child=100 &
 WORKER_PID=$!